@@ -6,6 +6,7 @@ software frameworks. It handles input validation, parameter binding, and stateve
 simulation to generate the Gram matrix required for geometric analysis.
 """
 
+import hashlib
 import numpy as np
 import warnings
 from typing import List, Union, Optional, Any
@@ -25,12 +26,385 @@ try:
 except ImportError:
     HAS_PENNYLANE = False
 
+from .simulator import CompiledCircuit, ProductCircuit
+from .mps import MPSCircuit
+from .parallel import parallel_statevectors, resolve_n_jobs
+from .kernels import (gram_matrix, projected_gram, reduced_density_features, allocate_kernel, ProductLayout,
+                      NystromFactor, IncrementalKernel)
+from .cache import StateCache, DiskStore, DEFAULT_CACHE_BYTES, hash_array
+
+# Fingerprints built from object ids; valid for the in-memory cache only
+SESSION_FINGERPRINT_PREFIX = "pennylane-object-"
+
+def _to_numpy(state: Any) -> np.ndarray:
+    """Converts generic tensor types (Torch/TF/Autograd) to Numpy."""
+    if hasattr(state, "numpy"):
+        state = state.numpy()
+    elif hasattr(state, "detach"): # PyTorch
+        state = state.detach().numpy()
+    return np.asarray(state)
+
 
 class BaseAdapter:
-    """Base class defining the interface for all quantum adapters."""
-    
-    def get_kernel_matrix(self, X: np.ndarray) -> np.ndarray:
-        raise NotImplementedError("Subclasses must implement get_kernel_matrix.")
+    """Base class defining the interface for all quantum adapters.
+
+    Subclasses only need to implement :meth:`_compute_statevectors`. The kernel
+    methods are derived from the statevectors so that callers who only need
+    part of the Gram matrix (e.g. a spectrum sweep against a single reference
+    point) never pay for the full N x N computation.
+    """
+
+    def __init__(self, n_jobs: int = 1, memory_budget: Optional[int] = None,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES, cache_dir: Optional[str] = None,
+                 precision: str = "double", kernel: str = "fidelity", gamma: float = 1.0):
+        """
+        Args:
+            n_jobs (int): Worker processes for state generation (-1 = all cores).
+            memory_budget (int, optional): Peak bytes for Gram matrix tiles.
+            cache_bytes (int): Capacity of the LRU statevector cache (0 disables it).
+            cache_dir (str, optional): Directory persisting state/kernel matrices across sessions.
+            precision (str): 'double' (complex128 states, float64 kernel) or 'single'
+                             (complex64 states, float32 kernel: half the memory and
+                             about twice the BLAS throughput, ~1e-6 kernel error).
+            kernel (str): 'fidelity' |<psi(x)|psi(y)>|^2, or 'projected'
+                          exp(-gamma sum_k ||rho_k(x) - rho_k(y)||_F^2) on the single-qubit
+                          reduced density matrices, which concentrates far less for
+                          wide circuits.
+            gamma (float): Width of the projected kernel.
+        """
+        if precision not in ("double", "single"):
+            raise ValueError(f"Unknown precision '{precision}'. Use 'double' or 'single'.")
+        if kernel not in ("fidelity", "projected"):
+            raise ValueError(f"Unknown kernel '{kernel}'. Use 'fidelity' or 'projected'.")
+        self.precision = precision
+        self.kernel = kernel
+        self.gamma = gamma
+        self.n_jobs = n_jobs
+        self.memory_budget = memory_budget
+        self.cache = StateCache(max_bytes=cache_bytes) if cache_bytes else None
+        self.store = DiskStore(cache_dir) if cache_dir else None
+
+    # Packed state layout (None = full 2^n statevectors). Product-state circuits,
+    # for example, store one block state per qubit group side by side.
+    _layout = None
+
+    def get_statevectors(self, X: np.ndarray) -> np.ndarray:
+        """
+        Simulates the circuit for every sample in X.
+
+        Rows are sharded across a process pool when n_jobs != 1. The result
+        does not depend on the number of workers.
+
+        Args:
+            X (np.ndarray): Input data (N, d).
+
+        Returns:
+            np.ndarray: Statevector matrix (N, 2^n_qubits).
+        """
+        return self._expand_states(self._get_states(X))
+
+    def get_states(self, X: np.ndarray) -> np.ndarray:
+        """
+        States of X in the adapter's native layout (packed for product-state or
+        MPS simulation). Pass them to `kernel_from_states` to reuse them.
+        """
+        return self._get_states(X)
+
+    def kernel_from_states(self, M_x: np.ndarray, M_y: Optional[np.ndarray] = None,
+                           out: Union[None, str, np.ndarray] = None) -> np.ndarray:
+        """Kernel matrix of states returned by `get_states` (no re-simulation)."""
+        if self.kernel == "projected":
+            F_y = None if M_y is None else self.reduced_density_features(M_y)
+            return projected_gram(self.reduced_density_features(M_x), F_y, gamma=self.gamma,
+                                  out=out, memory_budget=self.memory_budget)
+        return gram_matrix(M_x, M_y, out=out, memory_budget=self.memory_budget, layout=self._layout)
+
+    def reduced_density_features(self, M: np.ndarray) -> np.ndarray:
+        """
+        Single-qubit reduced density matrices of states from `get_states`, as real
+        features (N, 4n) (see `kernels.rdm_features`). Packed layouts compute
+        them without forming 2^n vectors.
+        """
+        if self._layout is None:
+            return reduced_density_features(M)
+        return self._layout.reduced_density_features(M)
+
+    def _get_states(self, X: np.ndarray) -> np.ndarray:
+        """States of X in the adapter's (possibly packed) layout, via store and cache."""
+        X = self._validate_input(X, required_features=self._required_features())
+
+        if self.store is not None and self._persistent(X.shape[1]):
+            state_key, dataset = self._state_key(X.shape[1]), hash_array(X)
+            key = self.store.key("states", state_key, dataset)
+            stored = self.store.load(key)
+            if stored is not None:
+                return stored
+            metadata = {"kind": "states", "fingerprint": self.fingerprint(X.shape[1]),
+                        "format": self._state_format(), "datasets": [dataset]}
+            return self.store.save(key, self._cached_statevectors(X), metadata)
+
+        return self._cached_statevectors(X)
+
+    def _expand_states(self, states: np.ndarray) -> np.ndarray:
+        """Converts packed states to full (N, 2^n) statevectors."""
+        return states
+
+    @property
+    def state_dtype(self) -> type:
+        """Complex dtype of the simulated states."""
+        return np.complex64 if self.precision == "single" else np.complex128
+
+    @property
+    def state_dim(self) -> Optional[int]:
+        """Statevector dimension 2^n if known without simulating, else None."""
+        return None
+
+    @property
+    def dense_states(self) -> bool:
+        """True if states are held as full (N, 2^n) statevectors (no packed layout)."""
+        return self._layout is None
+
+    def _state_format(self) -> str:
+        layout = "dense" if self._layout is None else repr(self._layout)
+        return layout if self.precision == "double" else f"{layout}|{self.precision}"
+
+    def _state_key(self, n_features: int) -> str:
+        """Cache key for states: the circuit fingerprint plus the state layout."""
+        fingerprint = self.fingerprint(n_features)
+        if self._state_format() == "dense":
+            return fingerprint
+        return hashlib.sha256(f"{fingerprint}|{self._state_format()}".encode()).hexdigest()
+
+    def _cached_statevectors(self, X: np.ndarray) -> np.ndarray:
+        if self.cache is None:
+            return self._simulate(X)
+
+        # Only simulate the rows that are not already cached
+        keys = self.cache.keys_for(self._state_key(X.shape[1]), X)
+        states, missing = self.cache.lookup(keys)
+        if not missing:
+            return np.array(states)
+
+        new_states = self._simulate(X[missing])
+        self.cache.insert([keys[i] for i in missing], new_states)
+        if len(missing) == X.shape[0]:
+            return new_states
+
+        for i, state in zip(missing, new_states):
+            states[i] = state
+        return np.array(states)
+
+    def _simulate(self, X: np.ndarray) -> np.ndarray:
+        if resolve_n_jobs(self.n_jobs) > 1 and X.shape[0] > 1:
+            states = parallel_statevectors(self, X, self.n_jobs)
+        else:
+            states = self._compute_statevectors(X)
+        # Engines that only simulate in double precision are rounded afterwards
+        return states.astype(self.state_dtype, copy=False)
+
+    def _compute_statevectors(self, X: np.ndarray) -> np.ndarray:
+        raise NotImplementedError("Subclasses must implement _compute_statevectors.")
+
+    def fingerprint(self, n_features: Optional[int] = None) -> str:
+        """
+        Stable hash identifying the encoding circuit (used as cache key).
+
+        Args:
+            n_features (int, optional): Input width, for frameworks whose circuit
+                                        structure depends on it.
+        """
+        raise NotImplementedError("Subclasses must implement fingerprint.")
+
+    def _persistent(self, n_features: int) -> bool:
+        """False if the fingerprint is only unique within this session: such results
+        stay in the in-memory cache and are never written to the disk store."""
+        return True
+
+    def encoding_rotations(self, X: np.ndarray) -> list:
+        """
+        Data-dependent rotations of the encoding at the input points X, read from
+        the circuit description without simulating it.
+
+        Returns:
+            list: (generator eigenvalues, angles (N,)) per data-dependent rotation.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not expose its encoding gates.")
+
+    def _required_features(self) -> Optional[int]:
+        """Number of input columns the circuit expects (None if unknown)."""
+        return None
+
+    def get_kernel_matrix(self, X: np.ndarray, Y: Optional[np.ndarray] = None,
+                          out: Union[None, str, np.ndarray] = None) -> np.ndarray:
+        """
+        Computes the kernel matrix K(x, y) = |<psi(x)|psi(y)>|^2.
+
+        The matrix is built in tiles bounded by `memory_budget`; for Y=None only
+        the upper triangle is computed and mirrored.
+
+        Args:
+            X (np.ndarray): Input data (N, d).
+            Y (np.ndarray, optional): Second input set (M, d). If None, the
+                                      symmetric Gram matrix of X is returned.
+            out (str or np.ndarray, optional): Path of a memory-mapped `.npy` file
+                                               or a preallocated (N, M) buffer.
+
+        Returns:
+            np.ndarray: Kernel matrix (N, N) or cross-kernel (N, M).
+        """
+        if self.store is None:
+            return self._compute_kernel(X, Y, out)
+
+        # Persistent store: load zero-copy, or compute straight into the store file
+        X = self._validate_input(X, required_features=self._required_features())
+        if not self._persistent(X.shape[1]):
+            return self._compute_kernel(X, Y, out)
+        hashes = [hash_array(X)] if Y is None else [hash_array(X), hash_array(self._validate_input(Y))]
+        fingerprint = self.fingerprint(X.shape[1])
+        # Layout (e.g. a truncated MPS), precision and kernel type all change the values
+        if self._state_format() != "dense" or self.kernel != "fidelity":
+            variant = f"{self._state_format()}|{self.kernel}|{self.gamma if self.kernel == 'projected' else ''}"
+            fingerprint = hashlib.sha256(f"{fingerprint}|{variant}".encode()).hexdigest()
+        key = self.store.key("kernel", fingerprint, *hashes)
+        metadata = {"kind": "kernel", "fingerprint": fingerprint, "datasets": hashes}
+
+        stored = self.store.load(key)
+        if stored is None:
+            if out is None:
+                temp_path = self.store.temp_path(key)
+                K = self._compute_kernel(X, Y, temp_path)
+                del K
+                return self.store.commit(key, temp_path, metadata)
+            K = self._compute_kernel(X, Y, out)
+            self.store.save(key, K, metadata)
+            return K
+
+        if out is None:
+            return stored
+        K = allocate_kernel(stored.shape, out)
+        K[:] = stored
+        return K
+
+    def _compute_kernel(self, X, Y, out):
+        M_x = self._get_states(X)
+        M_y = None if Y is None else self._get_states(Y)
+        self._record_truncation(M_x, M_y)
+        return self.kernel_from_states(M_x, M_y, out=out)
+
+    def _record_truncation(self, *state_batches):
+        """Hook for engines that truncate states: report the error of a whole kernel call."""
+
+    def precision_deviation(self, X: np.ndarray, Y: Optional[np.ndarray] = None) -> float:
+        """
+        Maximum absolute deviation of the single-precision kernel from the
+        double-precision one on X (or the cross-kernel X vs Y).
+
+        Both are simulated afresh, bypassing the caches, whatever `precision`
+        the adapter is set to.
+        """
+        X = self._validate_input(X, required_features=self._required_features())
+        Y = None if Y is None else self._validate_input(Y, required_features=self._required_features())
+        precision = self.precision
+        kernels = []
+        try:
+            for mode in ("single", "double"):
+                self.precision = mode
+                M_y = None if Y is None else self._simulate(Y)
+                kernels.append(self.kernel_from_states(self._simulate(X), M_y))
+        finally:
+            self.precision = precision
+        return float(np.max(np.abs(kernels[0].astype(np.float64) - kernels[1])))
+
+    def incremental_kernel(self, X: Optional[np.ndarray] = None, capacity: int = 256) -> IncrementalKernel:
+        """
+        Starts a Gram matrix that grows with `append(X_new)`, for data arriving in
+        rounds (e.g. active learning). Only new rows are simulated and only the
+        new blocks of the kernel are computed.
+
+        Args:
+            X (np.ndarray, optional): Initial data (N, d).
+            capacity (int): Initial number of rows to allocate (doubles when full).
+
+        Returns:
+            IncrementalKernel: Exposes `.matrix`, `.states` and `.X` of the data so far.
+        """
+        kernel = IncrementalKernel(self, capacity=capacity)
+        if X is not None:
+            kernel.append(X)
+        return kernel
+
+    def get_nystrom_kernel(self, X: np.ndarray, n_landmarks: int = 100, landmarks: str = "uniform",
+                           seed: int = 0) -> NystromFactor:
+        """
+        Nystrom approximation of the kernel matrix of X.
+
+        All N states are simulated, but only the (N, m) cross-kernel against the
+        landmarks is formed, so memory is O(N m) instead of O(N^2).
+
+        Args:
+            X (np.ndarray): Input data (N, d).
+            n_landmarks (int): Number of landmarks m.
+            landmarks (str): 'uniform' (random rows of X), 'kmeans' (k-means centers
+                             of X) or 'leverage' (rows sampled by approximate ridge
+                             leverage scores from a uniform pilot factor).
+            seed (int): Random seed of the landmark selection.
+
+        Returns:
+            NystromFactor: Factored approximation K ~ F F^T.
+        """
+        X = self._validate_input(X, required_features=self._required_features())
+        N = X.shape[0]
+        m = min(n_landmarks, N)
+        rng = np.random.default_rng(seed)
+        M = self._get_states(X)
+
+        indices = None
+        if landmarks == "uniform":
+            indices = np.sort(rng.choice(N, size=m, replace=False))
+        elif landmarks == "leverage":
+            pilot = self._nystrom_from_indices(X, M, np.sort(rng.choice(N, size=m, replace=False)))
+            F = pilot.factor
+            # Ridge leverage l_i = F_i (F^T F + lambda I)^{-1} F_i^T, lambda = trace / m
+            gram = F.T @ F
+            ridge = np.trace(gram) / m
+            scores = np.sum(F * np.linalg.solve(gram + ridge * np.eye(F.shape[1]), F.T).T, axis=1)
+            # Mix in a little uniform mass so every row stays reachable
+            probs = 0.9 * scores / scores.sum() + 0.1 / N
+            indices = np.sort(rng.choice(N, size=m, replace=False, p=probs))
+        elif landmarks == "kmeans":
+            from sklearn.cluster import KMeans
+            centers = KMeans(n_clusters=m, n_init=1, random_state=seed).fit(X).cluster_centers_
+            M_L = self._get_states(centers)
+            self._record_truncation(M, M_L)
+            C = self.kernel_from_states(M, M_L)
+            W = self.kernel_from_states(M_L)
+            return NystromFactor(C, W, centers)
+        else:
+            raise ValueError(f"Unknown landmark method '{landmarks}'. Use 'uniform', 'kmeans' or 'leverage'.")
+
+        return self._nystrom_from_indices(X, M, indices)
+
+    def _nystrom_from_indices(self, X, M, indices) -> NystromFactor:
+        C = self.kernel_from_states(M, M[indices])
+        return NystromFactor(C, C[indices], X[indices], landmark_indices=indices)
+
+    def get_kernel_row(self, X: np.ndarray, x_ref: np.ndarray) -> np.ndarray:
+        """
+        Computes the kernel of every sample in X against a single reference point.
+
+        Costs O(N * 2^n) instead of the O(N^2) needed for the full Gram matrix.
+
+        Args:
+            X (np.ndarray): Input data (N, d).
+            x_ref (np.ndarray): Reference sample (d,).
+
+        Returns:
+            np.ndarray: Kernel values K(x_i, x_ref) of shape (N,).
+        """
+        x_ref = np.asarray(x_ref, dtype=float).reshape(1, -1)
+        M_x, M_ref = self._get_states(X), self._get_states(x_ref)
+        self._record_truncation(M_x, M_ref)
+        return self.kernel_from_states(M_x, M_ref)[:, 0]
 
     def _validate_input(self, X: np.ndarray, required_features: Optional[int] = None) -> np.ndarray:
         """
@@ -78,7 +452,11 @@ class QiskitAdapter(BaseAdapter):
     Adapter for Qiskit QuantumCircuits.
     """
     
-    def __init__(self, circuit: 'QuantumCircuit', data_params: Union[List['Parameter'], 'Parameter'], use_gpu: bool = False):
+    def __init__(self, circuit: 'QuantumCircuit', data_params: Union[List['Parameter'], 'Parameter'], use_gpu: bool = False,
+                 simulator: str = "auto", n_jobs: int = 1, memory_budget: Optional[int] = None,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES, cache_dir: Optional[str] = None,
+                 product_states: Union[bool, str] = "auto", max_bond_dim: int = 16,
+                 precision: str = "double", kernel: str = "fidelity", gamma: float = 1.0):
         """
         Wraps a Qiskit circuit to behave like a Kernel function.
 
@@ -86,6 +464,24 @@ class QiskitAdapter(BaseAdapter):
             circuit (QuantumCircuit): The ansatz circuit.
             data_params (list or Parameter): The parameter(s) representing input data.
             use_gpu (bool): Placeholder for future GPU acceleration (e.g., via qiskit-aer-gpu).
+            simulator (str): 'compiled' (batched NumPy engine), 'statevector' (per-sample
+                             qiskit Statevector), 'mps' (matrix product states with bounded
+                             bond dimension, for wide low-entanglement circuits) or 'auto'
+                             (compiled, falling back to 'statevector' if the circuit has
+                             unsupported instructions).
+            n_jobs (int): Worker processes for state generation (-1 = all cores).
+            memory_budget (int, optional): Peak bytes for Gram matrix tiles.
+            cache_bytes (int): Capacity of the LRU statevector cache (0 disables it).
+            cache_dir (str, optional): Directory persisting state/kernel matrices across sessions.
+            product_states (bool or str): Simulate qubit groups that are never entangled
+                             with each other separately and factorize the kernel over them.
+                             'auto' enables it when it shrinks the state by 4x or more.
+            max_bond_dim (int): Bond dimension cap for simulator='mps'. The accumulated
+                             discarded weight is reported in `truncation_error`.
+            precision (str): 'double' or 'single' (complex64 evolution and float32
+                             kernel; see `precision_deviation`).
+            kernel (str): 'fidelity' or 'projected' (RBF on single-qubit reduced
+                          density matrices, with width `gamma`).
         """
         if not HAS_QISKIT:
             raise ImportError("Qiskit is not installed. Please install it via 'pip install qiskit'.")
@@ -93,6 +489,8 @@ class QiskitAdapter(BaseAdapter):
         if not isinstance(circuit, QuantumCircuit):
             raise TypeError(f"Expected qiskit.QuantumCircuit, got {type(circuit)}.")
 
+        super().__init__(n_jobs=n_jobs, memory_budget=memory_budget, cache_bytes=cache_bytes,
+                         cache_dir=cache_dir, precision=precision, kernel=kernel, gamma=gamma)
         self.circuit = circuit
         self.use_gpu = use_gpu
 
@@ -103,20 +501,117 @@ class QiskitAdapter(BaseAdapter):
             self.data_params = [data_params]
             
         self.n_params = len(self.data_params)
+        self._fingerprint = None
+
+        # Translate the circuit once into a gate list for batched simulation
+        if simulator not in ("auto", "compiled", "statevector", "mps"):
+            raise ValueError(f"Unknown simulator '{simulator}'. Use 'auto', 'compiled', 'statevector' or 'mps'.")
+
+        self.simulator = simulator
+        self._compiled = None
+        if simulator != "statevector":
+            try:
+                self._compiled = CompiledCircuit(circuit, self.data_params)
+            except NotImplementedError as e:
+                if simulator in ("compiled", "mps"):
+                    raise ValueError(f"Circuit cannot be compiled for batched simulation: {e}") from e
+                warnings.warn(f"Batched simulation unavailable ({e}). "
+                              "Falling back to per-sample Statevector simulation.")
+
+        # Matrix-product-state engine: overlaps are contracted, never 2^n vectors
+        self._mps = None
+        self.truncation_error = 0.0
+        if simulator == "mps":
+            self._mps = MPSCircuit(self._compiled, max_bond_dim=max_bond_dim)
+            self._layout = self._mps.layout
+
+        # Product-state fast path: separable blocks never form the 2^n vector
+        self._product = None
+        if self._compiled is not None and self._mps is None and product_states:
+            blocks = self._compiled.separable_blocks()
+            packed_width = sum(2**len(b) for b in blocks)
+            if len(blocks) > 1 and (product_states is True or 4 * packed_width <= 2**circuit.num_qubits):
+                self._product = ProductCircuit(self._compiled, blocks)
+                self._layout = ProductLayout(self._product.widths)
 
-    def get_kernel_matrix(self, X: np.ndarray) -> np.ndarray:
+    def _required_features(self) -> Optional[int]:
+        return self.n_params
+
+    @property
+    def state_dim(self) -> Optional[int]:
+        return 2**self.circuit.num_qubits
+
+    def _expand_states(self, states: np.ndarray) -> np.ndarray:
+        if self._mps is not None:
+            return self._layout.expand(states)
+        if self._product is not None:
+            return self._product.expand(states)
+        return states
+
+    def _get_states(self, X: np.ndarray) -> np.ndarray:
+        states = super()._get_states(X)
+        self._record_truncation(states)
+        return states
+
+    def _record_truncation(self, *state_batches):
+        if self._mps is not None:
+            # Worst-case discarded weight over every sample the call used
+            self.truncation_error = max(float(np.max(self._layout.truncation_error(M), initial=0.0))
+                                        for M in state_batches if M is not None)
+
+    def fingerprint(self, n_features: Optional[int] = None) -> str:
         """
-        Computes the kernel matrix K(x, y) = |<psi(x)|psi(y)>|^2.
+        Hash of the circuit structure: gates, qubits, parameter expressions and
+        the order of the data parameters. Stable across sessions.
+        """
+        if self._fingerprint is None:
+            h = hashlib.sha256()
+            h.update(f"qiskit|{self.circuit.num_qubits}|{[str(p) for p in self.data_params]}|"
+                     f"{self.circuit.global_phase}".encode())
+            for instruction in self.circuit.data:
+                qubits = [self.circuit.find_bit(q).index for q in instruction.qubits]
+                h.update(f"|{instruction.operation.name}{qubits}"
+                         f"{[str(p) for p in instruction.operation.params]}".encode())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    def encoding_rotations(self, X: np.ndarray) -> list:
+        """Data-dependent rotations read from the compiled gate list (no simulation)."""
+        X = self._validate_input(X, self._required_features())
+        compiled = self._compiled
+        if compiled is None:
+            try:
+                compiled = CompiledCircuit(self.circuit, self.data_params)
+            except NotImplementedError as e:
+                raise ValueError(f"Cannot read the encoding gates of this circuit: {e}") from e
+        return compiled.encoding_rotations(X)
+
+    def _compute_statevectors(self, X: np.ndarray) -> np.ndarray:
+        """
+        Simulates the circuit for every sample in X (already validated).
         
         Args:
             X (np.ndarray): Input data (N, d).
             
         Returns:
-            np.ndarray: Kernel matrix (N, N).
+            np.ndarray: Statevector matrix (N, 2^n_qubits).
         """
-        # Validate and standardise input
-        X = self._validate_input(X, required_features=self.n_params)
-        
+        if self._mps is not None:
+            # Packed MPS rows: (N, sum_k chi_k * 2 * chi_k+1 + 1)
+            return self._mps.run(X, self.state_dtype)
+
+        if self._product is not None:
+            # Packed block states: (N, sum_b 2^|b|)
+            return self._product.run(X, self.state_dtype)
+
+        if self._compiled is not None:
+            # Whole batch at once: (N, 2^n_qubits)
+            return self._compiled.run(X, self.state_dtype)
+
+        return self._simulate_reference(X)
+
+    def _simulate_reference(self, X: np.ndarray) -> np.ndarray:
+        """Per-sample simulation through qiskit.quantum_info.Statevector."""
         N = X.shape[0]
         state_vectors = []
 
@@ -142,35 +637,54 @@ class QiskitAdapter(BaseAdapter):
         except Exception as e:
             raise RuntimeError(f"Qiskit simulation failed at index {i}. Check parameter bindings.") from e
 
-        # Compute Gram Matrix using vectorization
         # shape: (N, 2^n_qubits)
-        M = np.array(state_vectors)
-        
-        # Inner products: <psi(x) | psi(y)>
-        # M @ M.H (Conjugate Transpose)
-        inner_products = M @ M.conj().T
-        
-        # Fidelity is magnitude squared
-        kernel_matrix = np.abs(inner_products)**2
-        
-        return kernel_matrix
+        return np.array(state_vectors)
 
     def __repr__(self):
         return f"<QiskitAdapter: {self.n_params} params, {self.circuit.num_qubits} qubits>"
 
 
+def _generator_gates(op) -> list:
+    """Decomposes a PennyLane operation into single-parameter gates with generators."""
+    if op.num_params == 0:
+        return []
+    if op.num_params == 1 and op.has_generator:
+        return [op]
+    try:
+        decomposition = op.decomposition()
+    except Exception as e:
+        raise ValueError(f"Cannot find the generator of '{op.name}'. Use method='fft' instead.") from e
+    return [gate for sub in decomposition for gate in _generator_gates(sub)]
+
+
 class PennyLaneAdapter(BaseAdapter):
     """
     Adapter for PennyLane QNodes.
     """
     
-    def __init__(self, qnode: Any):
+    def __init__(self, qnode: Any, n_jobs: int = 1, memory_budget: Optional[int] = None,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES, cache_dir: Optional[str] = None,
+                 broadcast: bool = True, chunk_size: int = 1024, precision: str = "double",
+                 kernel: str = "fidelity", gamma: float = 1.0):
         """
         Wraps a PennyLane QNode.
 
         Args:
             qnode (qml.QNode): A PennyLane QNode that returns qml.state().
                                Must accept data 'x' as its first argument.
+            broadcast (bool): Submit X in batches using PennyLane parameter broadcasting.
+                              Falls back to one QNode call per sample if the QNode
+                              rejects (or mis-handles) batched input.
+            chunk_size (int): Number of samples per broadcast execution.
+            n_jobs (int): Worker processes for state generation (-1 = all cores).
+            memory_budget (int, optional): Peak bytes for Gram matrix tiles.
+            cache_bytes (int): Capacity of the LRU statevector cache (0 disables it).
+            cache_dir (str, optional): Directory persisting state/kernel matrices across sessions.
+            precision (str): 'double' or 'single'. PennyLane simulates in double
+                             precision; states are rounded to complex64 and the
+                             kernel is accumulated in float32.
+            kernel (str): 'fidelity' or 'projected' (RBF on single-qubit reduced
+                          density matrices, with width `gamma`).
         """
         if not HAS_PENNYLANE:
             raise ImportError("PennyLane is not installed. Run 'pip install pennylane'.")
@@ -180,19 +694,148 @@ class PennyLaneAdapter(BaseAdapter):
              warnings.warn("The provided object does not look like a standard PennyLane QNode. "
                            "Ensure it returns a state vector.")
 
+        super().__init__(n_jobs=n_jobs, memory_budget=memory_budget, cache_bytes=cache_bytes,
+                         cache_dir=cache_dir, precision=precision, kernel=kernel, gamma=gamma)
         self.qnode = qnode
+        self._fingerprints = {}
+        self.broadcast = broadcast
+        self.chunk_size = chunk_size
+
+        # Input layout accepted for broadcasting: 'feature_major' (x[i] is a batch
+        # of feature i), 'batch_major' (x is (B, d)), or None if unsupported.
+        # Detected on first use.
+        self._broadcast_layout = "unknown"
         
         # Attempt to infer number of parameters (Heuristic)
         # PennyLane doesn't always expose this easily without inspection.
         self.n_params = None 
 
-    def get_kernel_matrix(self, X: np.ndarray) -> np.ndarray:
+    @property
+    def state_dim(self) -> Optional[int]:
+        wires = getattr(getattr(self.qnode, "device", None), "wires", None)
+        return 2**len(wires) if wires is not None and len(wires) else None
+
+    def fingerprint(self, n_features: Optional[int] = None) -> str:
         """
-        Computes the kernel matrix using the QNode.
+        Hash of the QNode's tape (operations, wires and gate parameters) recorded
+        at two fixed probe inputs, plus the device. Building the tape does not
+        simulate the circuit.
         """
-        # Validate input (Can't check n_params strictly yet, so pass None)
-        X = self._validate_input(X, required_features=None)
-        
+        n_features = n_features or 1
+        if n_features in self._fingerprints:
+            return self._fingerprints[n_features]
+
+        h = hashlib.sha256()
+        device = getattr(self.qnode, "device", None)
+        h.update(f"pennylane|{getattr(device, 'name', None)}|{n_features}".encode())
+        if device is not None and getattr(device, "wires", None) is not None:
+            h.update(str(device.wires.tolist()).encode())
+
+        try:
+            for scale in (0.1234, -0.5678):
+                probe = scale * np.arange(1, n_features + 1)
+                tape = qml.tape.make_qscript(self.qnode.func)(probe[0] if n_features == 1 else probe)
+                for op in tape.operations:
+                    params = [np.round(np.asarray(p, dtype=float), 12).tolist() for p in op.parameters]
+                    h.update(f"|{op.name}{op.wires.tolist()}{params}".encode())
+            fingerprint = h.hexdigest()
+        except Exception:
+            # Not traceable (e.g. a non-standard callable): only unique within this session
+            fingerprint = f"{SESSION_FINGERPRINT_PREFIX}{id(self.qnode)}"
+            if self.store is not None:
+                warnings.warn("The QNode's tape cannot be traced, so it has no stable fingerprint. "
+                              "Its states and kernels are cached in memory only, not in cache_dir.")
+
+        self._fingerprints[n_features] = fingerprint
+        return fingerprint
+
+    def _persistent(self, n_features: int) -> bool:
+        # Object ids are memory addresses: a later session may reuse one for another circuit
+        return not self.fingerprint(n_features).startswith(SESSION_FINGERPRINT_PREFIX)
+
+    def encoding_rotations(self, X: np.ndarray) -> list:
+        """
+        Data-dependent rotations read from the QNode's tape at every row of X.
+        Templates and multi-parameter gates are decomposed until each parameter
+        belongs to a gate with a known generator. Building tapes does not simulate.
+        """
+        X = np.asarray(X, dtype=float)
+        tapes = [qml.tape.make_qscript(self.qnode.func)(row[0] if row.size == 1 else row) for row in X]
+        structure = [(op.name, op.wires.tolist()) for op in tapes[0].operations]
+        if any([(op.name, op.wires.tolist()) for op in tape.operations] != structure for tape in tapes[1:]):
+            raise ValueError("The QNode's gate sequence changes with the input; "
+                             "its encoding gates cannot be read from the tape.")
+
+        rotations = []
+        for ops in zip(*(tape.operations for tape in tapes)):
+            values = [qml.math.toarray(p) for op in ops for p in op.parameters]
+            if all(np.allclose(v, values[0]) for v in values):
+                continue  # Not data-dependent
+            decompositions = [_generator_gates(op) for op in ops]
+            if len({len(d) for d in decompositions}) > 1:
+                raise ValueError(f"The decomposition of '{ops[0].name}' changes with the input.")
+            for gates in zip(*decompositions):
+                angles = np.array([float(qml.math.toarray(g.parameters[0])) for g in gates])
+                eigenvalues = np.real(qml.eigvals(gates[0].generator()))
+                rotations.append((tuple(eigenvalues), angles))
+        return rotations
+
+    def _compute_statevectors(self, X: np.ndarray) -> np.ndarray:
+        """
+        Executes the QNode for every sample in X.
+        (Input is validated without a feature check, as n_params is only a heuristic.)
+
+        Returns:
+            np.ndarray: Statevector matrix (N, 2^n_qubits).
+        """
+        if self.broadcast and X.shape[0] > 1:
+            if self._broadcast_layout == "unknown":
+                self._broadcast_layout = self._detect_broadcast_layout(X)
+
+            if self._broadcast_layout is not None:
+                chunks = []
+                for start in range(0, X.shape[0], self.chunk_size):
+                    chunk = X[start:start + self.chunk_size]
+                    states = self._run_broadcast(chunk, self._broadcast_layout) if chunk.shape[0] > 1 else None
+                    chunks.append(states if states is not None else self._compute_per_sample(chunk))
+                if self.n_params is None:
+                    self.n_params = X.shape[1]
+                return np.concatenate(chunks)
+
+        return self._compute_per_sample(X)
+
+    def _broadcast_input(self, X: np.ndarray, layout: str):
+        if X.shape[1] == 1:
+            return X[:, 0]
+        return X.T if layout == "feature_major" else X
+
+    def _run_broadcast(self, X: np.ndarray, layout: str) -> Optional[np.ndarray]:
+        """Executes one broadcast QNode call; returns None if the output is not (B, 2^n)."""
+        try:
+            states = _to_numpy(self.qnode(self._broadcast_input(X, layout)))
+        except Exception:
+            return None
+        if states.dtype == object or states.ndim != 2 or states.shape[0] != X.shape[0]:
+            return None
+        return states
+
+    def _detect_broadcast_layout(self, X: np.ndarray) -> Optional[str]:
+        """
+        Finds an input layout for which a broadcast call reproduces the per-sample
+        states on a 2-sample probe batch, so QNodes that silently mis-index
+        batched input are never broadcast.
+        """
+        probe = X[:2]
+        reference = self._compute_per_sample(probe)
+        layouts = ("feature_major",) if X.shape[1] == 1 else ("feature_major", "batch_major")
+        for layout in layouts:
+            states = self._run_broadcast(probe, layout)
+            if states is not None and states.shape == reference.shape and np.allclose(states, reference, atol=1e-10):
+                return layout
+        return None
+
+    def _compute_per_sample(self, X: np.ndarray) -> np.ndarray:
+        """One QNode execution per row of X."""
         N = X.shape[0]
         state_vectors = []
         
@@ -216,29 +859,20 @@ class PennyLaneAdapter(BaseAdapter):
                     "Ensure your QNode accepts this input format."
                 ) from e
             
-            # Convert generic tensor types (Torch/TF/Autograd) to Numpy
-            if hasattr(state, "numpy"):
-                state = state.numpy()
-            elif hasattr(state, "detach"): # PyTorch
-                 state = state.detach().numpy()
-            
-            state_vectors.append(state)
+            state_vectors.append(_to_numpy(state))
             
             # Heuristic: Set n_params after first successful run if unknown
             if self.n_params is None:
                 self.n_params = row.size
 
-        # 2. Compute Gram Matrix
+        # 2. Stack States
         M = np.array(state_vectors)
         
         # Check if M is actually a matrix of numbers (not objects)
         if M.dtype == object:
              raise ValueError("PennyLane returned non-numeric state vectors. Ensure QNode returns qml.state().")
 
-        inner_products = M @ M.conj().T
-        kernel_matrix = np.abs(inner_products)**2
-        
-        return kernel_matrix
+        return M
 
     def __repr__(self):
         return f"<PennyLaneAdapter: {self.n_params if self.n_params else '?'} params>"
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Statevector Caching.
+
+An in-memory LRU cache of simulated statevectors. Entries are keyed by a
+circuit fingerprint plus a hash of the (quantized) input row. This lets
+repeated `spectrum`, `geometry` and `diagnose` calls on overlapping inputs skip
+simulation.
+
+`DiskStore` persists whole state and kernel matrices across sessions as `.npy`
+files that are loaded back memory-mapped (zero-copy).
+"""
+
+import os
+import json
+import time
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# Default cache capacity (bytes of statevector data).
+DEFAULT_CACHE_BYTES = 256 * 1024**2
+
+
+def hash_row(row: np.ndarray, decimals: int = 12) -> bytes:
+    """Hashes an input row after rounding, so float noise below 1e-decimals collides."""
+    # "+ 0.0" folds -0.0 into 0.0 so both hash identically
+    quantized = np.round(np.asarray(row, dtype=np.float64), decimals) + 0.0
+    return hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+
+
+def hash_array(X: np.ndarray, decimals: int = 12) -> str:
+    """Hashes a whole dataset (shape included) to a hex digest."""
+    quantized = np.round(np.ascontiguousarray(X, dtype=np.float64), decimals) + 0.0
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(quantized.shape).encode())
+    h.update(quantized.tobytes())
+    return h.hexdigest()
+
+
+class StateCache:
+    """
+    Least-recently-used statevector cache with a byte-size limit.
+
+    Attributes:
+        hits (int): Number of rows served from the cache.
+        misses (int): Number of rows that had to be simulated.
+        nbytes (int): Current size of the stored statevectors.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, decimals: int = 12):
+        """
+        Args:
+            max_bytes (int): Eviction threshold for stored statevector bytes.
+            decimals (int): Input rows are rounded to this many decimals before hashing.
+        """
+        self.max_bytes = max_bytes
+        self.decimals = decimals
+        self._store: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def keys_for(self, fingerprint: str, X: np.ndarray) -> List[Tuple[str, bytes]]:
+        return [(fingerprint, hash_row(row, self.decimals)) for row in X]
+
+    def lookup(self, keys: list) -> Tuple[List[Optional[np.ndarray]], List[int]]:
+        """
+        Returns:
+            (states, missing): cached state per key (None if absent), and the
+            indices of the keys that were not found.
+        """
+        states, missing = [], []
+        for i, key in enumerate(keys):
+            state = self._store.get(key)
+            if state is None:
+                missing.append(i)
+            else:
+                self._store.move_to_end(key)
+            states.append(state)
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        return states, missing
+
+    def insert(self, keys: list, states: np.ndarray):
+        for key, state in zip(keys, states):
+            if key in self._store:
+                continue
+            # Copy so a cached row does not keep the whole batch alive
+            state = np.array(state)
+            if state.nbytes > self.max_bytes:
+                continue
+            self._store[key] = state
+            self.nbytes += state.nbytes
+
+        while self.nbytes > self.max_bytes and self._store:
+            _, evicted = self._store.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        self._store.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self._store),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __len__(self):
+        return len(self._store)
+
+    def __repr__(self):
+        return f"<StateCache: {len(self)} states, {self.nbytes / 1024**2:.1f} MB, hits={self.hits}, misses={self.misses}>"
+
+
+class DiskStore:
+    """
+    Persistent store of statevector and kernel matrices.
+
+    Each array lives in `<directory>/<kind>-<fingerprint>-<dataset hash>.npy`.
+    A small `index.json` records what every file holds. Files are written
+    under a temporary name and renamed into place, so concurrent runs never
+    read half-written arrays.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, kind: str, fingerprint: str, *dataset_hashes: str) -> str:
+        return "-".join([kind, fingerprint[:24]] + [h[:24] for h in dataset_hashes])
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npy")
+
+    def load(self, key: str) -> Optional[np.ndarray]:
+        """Returns the stored array memory-mapped read-only, or None."""
+        path = self.path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return np.load(path, mmap_mode="r")
+
+    def temp_path(self, key: str) -> str:
+        """Scratch file to write an array into before `commit`."""
+        return os.path.join(self.directory, f".{key}.{os.getpid()}.tmp.npy")
+
+    def commit(self, key: str, temp_path: str, metadata: Optional[dict] = None) -> np.ndarray:
+        """Moves a fully written temp file into place and records it in the index."""
+        os.replace(temp_path, self.path(key))
+        array = np.load(self.path(key), mmap_mode="r")
+        self._update_index(key, array, metadata or {})
+        return array
+
+    def save(self, key: str, array: np.ndarray, metadata: Optional[dict] = None) -> np.ndarray:
+        temp_path = self.temp_path(key)
+        np.save(temp_path, array)
+        return self.commit(key, temp_path, metadata)
+
+    def index(self) -> dict:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _update_index(self, key: str, array: np.ndarray, metadata: dict):
+        index = self.index()
+        index[key] = dict(metadata, shape=list(array.shape), dtype=str(array.dtype),
+                          file=os.path.basename(self.path(key)), created=time.time())
+        temp = os.path.join(self.directory, f".{self.INDEX_FILE}.{os.getpid()}.tmp")
+        with open(temp, "w") as f:
+            json.dump(index, f, indent=1)
+        os.replace(temp, os.path.join(self.directory, self.INDEX_FILE))
+
+    def __repr__(self):
+        return f"<DiskStore: {self.directory}, hits={self.hits}, misses={self.misses}>"
@@ -1,16 +1,30 @@
 import numpy as np
 import os
 from .adapters import QiskitAdapter, PennyLaneAdapter, HAS_PENNYLANE
-from .spectral import compute_spectrum
-from .geometry import compute_geometry_score, project_quantum_state
-from .visualize import plot_spectrum, plot_manifold_3d
+from .spectral import sweep_points, signal_spectrum, adaptive_spectrum, pencil_spectrum, grid_spectrum, grid_support, analytic_spectrum, sweep_generators, SWEEP_PROBES
+from .geometry import (compute_geometry_score, estimate_geometry_score, fit_kernel_pca,
+                       density_features, fit_feature_pca, GeometryEmbedding,
+                       kernel_sqrt, factor_sqrt, geometric_difference)
+from .kernels import NystromFactor
+from .visualize import plot_spectrum, plot_spectrum_table, plot_spectrum_2d, plot_manifold_3d
+from .metrics import kernel_metrics
 from .diagnose import print_report 
+from .cache import DEFAULT_CACHE_BYTES
 from sklearn.datasets import make_swiss_roll
+from sklearn.metrics.pairwise import rbf_kernel, linear_kernel
 
 
+def _relative_degeneracy(row):
+    """Degeneracies of an analytic spectrum without the DC term, normalized for plotting."""
+    values = np.where(row["freqs"] > 0, row["degeneracy"], 0.0)
+    return values / np.sum(values) if np.sum(values) > 0 else values
+
 
 class QuantumLens:
-    def __init__(self, object_to_analyze, params=None, framework="auto"):
+    def __init__(self, object_to_analyze, params=None, framework="auto", n_jobs=1, memory_budget=None,
+                 cache_bytes=DEFAULT_CACHE_BYTES, cache_dir=None, precision="double",
+                 kernel="fidelity", gamma=1.0, simulator="auto", max_bond_dim=16,
+                 product_states="auto"):
         """
         The main interface for HilbertLens.
         
@@ -18,14 +32,40 @@ class QuantumLens:
             object_to_analyze: The Qiskit Circuit, PennyLane QNode, or raw Python function.
             params: (Optional) The data parameter(s) for Qiskit circuits.
             framework: 'qiskit', 'pennylane', or 'auto'.
+            n_jobs: Worker processes for state generation (1 = serial, -1 = all cores).
+            memory_budget: Peak bytes for Gram matrix tiles (None = library default).
+            cache_bytes: Capacity of the statevector cache shared by spectrum, geometry
+                         and diagnose (0 disables caching).
+            cache_dir: Optional directory where statevectors and kernel matrices are
+                       persisted (as memory-mapped .npy files) and reused across sessions.
+            precision: 'double' or 'single' (complex64 states, float32 kernel). Enough
+                       for the rank-based geometry score and spectrum peaks; check the
+                       error with `adapter.precision_deviation(X)`.
+            kernel: 'fidelity' or 'projected' (RBF kernel of width `gamma` on the
+                    single-qubit reduced density matrices; resists the exponential
+                    concentration of fidelity kernels on wide circuits).
+            simulator: Qiskit only. 'auto', 'compiled', 'statevector' or 'mps' (matrix
+                       product states, for wide low-entanglement circuits beyond the
+                       reach of dense statevectors).
+            max_bond_dim: Qiskit only. Bond dimension cap for simulator='mps'; the
+                          discarded weight is reported in `adapter.truncation_error`.
+            product_states: Qiskit only. Factorize the kernel over qubit groups that
+                            are never entangled ('auto', True or False).
         """
-        self.adapter = self._load_adapter(object_to_analyze, params, framework)
+        qiskit_options = {"simulator": simulator, "max_bond_dim": max_bond_dim,
+                          "product_states": product_states}
+        self.adapter = self._load_adapter(object_to_analyze, params, framework, qiskit_options,
+                                          n_jobs=n_jobs, memory_budget=memory_budget,
+                                          cache_bytes=cache_bytes, cache_dir=cache_dir,
+                                          precision=precision, kernel=kernel, gamma=gamma)
 
         # State to store results
         self.last_spectrum_stats = None
         self.last_geometry_stats = None
+        self.last_kernel_metrics = None
+        self.last_classical_comparison = None
         
-    def _load_adapter(self, obj, params, framework):
+    def _load_adapter(self, obj, params, framework, qiskit_options, **adapter_options):
         # 1. Automatic Detection
         if framework == "auto":
             obj_type = str(type(obj))
@@ -42,80 +82,247 @@ class QuantumLens:
         if framework == "qiskit":
             if params is None:
                 raise ValueError("For Qiskit, you must provide the 'params' argument (the input data parameters).")
-            return QiskitAdapter(obj, params)
+            return QiskitAdapter(obj, params, **qiskit_options, **adapter_options)
             
         elif framework == "pennylane":
             if not HAS_PENNYLANE:
                 raise ImportError("PennyLane not installed.")
-            return PennyLaneAdapter(obj)
+            if qiskit_options != {"simulator": "auto", "max_bond_dim": 16, "product_states": "auto"}:
+                raise ValueError("simulator, max_bond_dim and product_states only apply to Qiskit circuits.")
+            return PennyLaneAdapter(obj, **adapter_options)
             
         else:
             raise ValueError(f"Unknown framework: {framework}")
 
-    def spectrum(self, mode='local', feature_index=0, save_path=None):
+    def spectrum(self, mode='local', feature_index=0, save_path=None, method='fft', n_samples=None,
+                 features=(0, 1)):
         """
         Analyzes and plots the frequency spectrum.
         
         Args:
-            mode (str): 'local' (sweep one feature, freeze others) 
-                        or 'global' (sweep all features together: x1=t, x2=t...).
+            mode (str): 'local' (sweep one feature, freeze others),
+                        'global' (sweep all features together: x1=t, x2=t...),
+                        'all' (every local sweep plus the global one, simulated
+                        as a single stacked batch; returns a per-feature table)
+                        or 'grid' (joint N-dimensional spectrum over a grid of the
+                        selected `features`, revealing cross-feature frequencies).
             feature_index (int): If mode='local', which feature index to sweep.
             save_path (str): Path to save the plot.
+            method (str): 'fft' (sample the kernel along the sweep and transform it),
+                          'pencil' (matrix pencil fit of the exact frequencies and
+                          amplitudes from a short sweep) or 'analytic' (exact
+                          frequencies and degeneracies from the encoding generators,
+                          without simulating the circuit). Degeneracies are not power:
+                          'analytic' reports only the accessible frequency set and its
+                          "degeneracy", with "power", "dominant_freq" and "max_power"
+                          left as None.
+            n_samples (int or str): Samples per sweep (default 1000 for 'fft', 64 for
+                          'pencil'). For 'fft', 'auto' refines the grid until the
+                          spectrum is stable and free of energy near the Nyquist limit.
+                          For mode='grid': points per feature (int or tuple, default 32).
+            features (tuple): Feature indices swept jointly in mode='grid'.
         """
-        print(f"[HilbertLens] Computing Spectrum (Mode: {mode})...")
-        
-        # --- SMART WRAPPER ---
-        def kernel_wrapper(X_sweep):
-            """
-            X_sweep is (N, 1).
-            We need to map this 1D sweep to the circuit's full input dimensions.
-            """
-            # 1. Ask the adapter how many features it needs
-            if hasattr(self.adapter, 'n_params') and self.adapter.n_params is not None:
-                n_required = self.adapter.n_params # <--- DYNAMIC!
+        print(f"[HilbertLens] Computing Spectrum (Mode: {mode}, Method: {method})...")
+
+        # 1. Ask the adapter how many features it needs
+        if hasattr(self.adapter, 'n_params') and self.adapter.n_params is not None:
+            n_required = self.adapter.n_params # <--- DYNAMIC!
+        else:
+            n_required = 1 # Fallback
+
+        if mode == 'grid':
+            return self._grid_spectrum(list(features), n_required, n_samples or 32, save_path)
+
+        # 2. Directions of the sweeps in feature space
+        if mode == 'global':
+            # Broadcast t to ALL features
+            sweeps = [("global", np.ones(n_required))]
+        elif mode == 'local':
+            if feature_index >= n_required:
+                raise ValueError(f"Index {feature_index} out of bounds for {n_required}-feature circuit.")
+            sweeps = [(f"x{feature_index}", np.eye(n_required)[feature_index])]
+        elif mode == 'all':
+            sweeps = [(f"x{i}", np.eye(n_required)[i]) for i in range(n_required)]
+            sweeps.append(("global", np.ones(n_required)))
+        else:
+            raise ValueError(f"Unknown mode '{mode}'. Use 'local', 'global', 'all' or 'grid'.")
+
+        # 3. One spectrum per sweep
+        evaluations = 0
+        if method == 'analytic':
+            spectra = [self._analytic_spectrum(direction) for _, direction in sweeps]
+        elif method == 'fft':
+            spectra, evaluations = self._fft_spectra([direction for _, direction in sweeps], n_samples or 1000)
+            print(f"  - Kernel evaluations: {evaluations}")
+        elif method == 'pencil':
+            if n_samples == 'auto':
+                raise ValueError("n_samples='auto' is only available for method='fft'.")
+            spectra, evaluations = self._pencil_spectra([direction for _, direction in sweeps], n_samples or 64)
+            print(f"  - Kernel evaluations: {evaluations}")
+        else:
+            raise ValueError(f"Unknown method '{method}'. Use 'fft', 'pencil' or 'analytic'.")
+
+        table = []
+        for (label, _), (freqs, power, degeneracy) in zip(sweeps, spectra):
+            top_idx = None if power is None else np.argmax(power)
+            table.append({
+                "sweep": label,
+                "dominant_freq": None if power is None else freqs[top_idx],
+                "max_power": None if power is None else power[top_idx],
+                "freqs": freqs,
+                "power": power,
+                "degeneracy": degeneracy
+            })
+
+        # Analytic spectra are plotted as degeneracies, never labelled as power
+        value_label = "Relative Degeneracy" if method == 'analytic' else "Spectral Power"
+        shown = [_relative_degeneracy(row) if row["power"] is None else row["power"] for row in table]
+
+        if mode == 'all':
+            # Common frequency axis (analytic spectra may differ per sweep)
+            freqs = np.unique(np.concatenate([row["freqs"] for row in table]))
+            power = np.zeros((len(table), len(freqs)))
+            for i, row in enumerate(table):
+                power[i, np.searchsorted(freqs, row["freqs"])] = shown[i]
+            plot_spectrum_table(freqs, power, [row["sweep"] for row in table],
+                                title="Spectrum (All Sweeps)", save_path=save_path, value_label=value_label)
+
+            if method == 'analytic':
+                print(f"  {'sweep':>8} | max k | accessible k")
+                for row in table:
+                    accessible = row["freqs"][row["freqs"] > 0]
+                    print(f"  {row['sweep']:>8} | {np.max(accessible, initial=0):5.2f} | {len(accessible)}")
             else:
-                n_required = 1 # Fallback
-            
-            # 2. Create the Input Matrix (N, n_required)
-            N = X_sweep.shape[0]
-            X_full = np.zeros((N, n_required))
-            
-            if mode == 'global':
-                # Broadcast t to ALL features
-                for col in range(n_required):
-                    X_full[:, col] = X_sweep.flatten()
-            elif mode == 'local':
-                if feature_index >= n_required:
-                    raise ValueError(f"Index {feature_index} out of bounds for {n_required}-feature circuit.")
-                X_full[:, feature_index] = X_sweep.flatten()
-            
-            return self.adapter.get_kernel_matrix(X_full)
-        # --- END WRAPPER ---
+                print(f"  {'sweep':>8} | dominant k | power")
+                for row in table:
+                    print(f"  {row['sweep']:>8} | {row['dominant_freq']:10.2f} | {row['max_power']:.3f}")
+
+            # The global sweep stays the headline result (used by diagnose)
+            self.last_spectrum_stats = dict(table[-1], table=table, evaluations=evaluations)
+            return self.last_spectrum_stats
 
-        freqs, power = compute_spectrum(kernel_wrapper)
-        
         title = f"Spectrum ({mode.title()} Sweep)"
         if mode == 'local':
             title += f" - Feature {feature_index}"
-            
-        plot_spectrum(freqs, power, title=title, save_path=save_path)
-        
-        top_idx = np.argmax(power)
+
+        stats = table[0]
+        plot_spectrum(stats["freqs"], shown[0], title=title, save_path=save_path, value_label=value_label)
         
         # STORE FULL RESULTS (Updated)
-        
-        self.last_spectrum_stats = {
-            "dominant_freq": freqs[top_idx], 
-            "max_power": power[top_idx],
-            "freqs": freqs,  
-            "power": power  
-        }
+        self.last_spectrum_stats = {key: stats[key] for key in
+                                    ("dominant_freq", "max_power", "freqs", "power", "degeneracy")}
+        self.last_spectrum_stats["evaluations"] = evaluations
         return self.last_spectrum_stats
 
-    def geometry(self, X_data=None, n_samples=200, save_path=None):
+    def _sweep_kernel_fn(self, directions):
+        """
+        Kernel function of several stacked sweeps: (N, 1) sweep values t map to
+        (N, n_directions) kernel values K(t * d, 0).
+
+        All sweeps start at x = 0 and are evaluated against it, so the stacked
+        batch of every sweep is simulated at once and only one kernel row is needed.
+        """
+        reference = np.zeros(len(directions[0]))
+
+        def kernel_fn(t):
+            X_full = np.vstack([t.reshape(-1, 1) * direction[None, :] for direction in directions])
+            return self.adapter.get_kernel_row(X_full, reference).reshape(len(directions), -1).T
+
+        return kernel_fn
+
+    def _fft_spectra(self, directions, n_samples=1000, range_max=4*np.pi):
+        """
+        Sampled spectra along several sweep directions.
+
+        Returns:
+            (spectra, evaluations): (freqs, power, None) per direction, and the
+            number of kernel values computed.
+        """
+        kernel_fn = self._sweep_kernel_fn(directions)
+        if n_samples == 'auto':
+            freqs, power, evaluations = adaptive_spectrum(kernel_fn, range_max)
+            return [(freqs, p, None) for p in power], evaluations
+
+        signals = kernel_fn(sweep_points(n_samples, range_max)).T
+        return [signal_spectrum(signal, range_max) + (None,) for signal in signals], signals.size
+
+    def _pencil_spectra(self, directions, n_samples=64, dt=0.1):
+        """Matrix-pencil spectra along several sweep directions (see `_fft_spectra`)."""
+        signals = self._sweep_kernel_fn(directions)(np.arange(n_samples) * dt).T
+        return [pencil_spectrum(signal, dt) + (None,) for signal in signals], signals.size
+
+    def _grid_spectrum(self, features, n_required, grid_size, save_path, range_max=4*np.pi):
+        """Joint spectrum over a periodic grid of `features` (others frozen at 0)."""
+        for feature in features:
+            if feature >= n_required:
+                raise ValueError(f"Index {feature} out of bounds for {n_required}-feature circuit.")
+        grid_shape = (grid_size,) * len(features) if np.isscalar(grid_size) else tuple(grid_size)
+        reference = np.zeros(n_required)
+
+        def kernel_fn(points):
+            X_full = np.zeros((points.shape[0], n_required))
+            X_full[:, features] = points
+            return self.adapter.get_kernel_row(X_full, reference)
+
+        freqs, power = grid_spectrum(kernel_fn, grid_shape, range_max)
+        support, support_power = grid_support(freqs, power)
+        evaluations = int(np.prod(grid_shape))
+        print(f"  - Kernel evaluations: {evaluations}")
+
+        labels = [f"x{i}" for i in features]
+        if len(features) == 2:
+            plot_spectrum_2d(freqs[0], freqs[1], power, labels=labels,
+                             title=f"Joint Spectrum ({labels[0]}, {labels[1]})", save_path=save_path)
+
+        print(f"  - Joint frequencies ({', '.join(labels)}) | power")
+        for k, p in zip(support[:10], support_power[:10]):
+            print(f"    {tuple(float(v) for v in k)} | {p:.3f}")
+
+        # Not stored in last_spectrum_stats: diagnose() expects a 1D spectrum
+        return {
+            "features": features,
+            "freqs": freqs,
+            "power": power,
+            "support": support,
+            "support_power": support_power,
+            "evaluations": evaluations
+        }
+
+    def _analytic_spectrum(self, direction):
+        if self.adapter.kernel != "fidelity":
+            # exp(-gamma d^2) of a trigonometric polynomial has no finite spectrum
+            raise ValueError("method='analytic' requires kernel='fidelity'. Use method='fft'.")
+        rotations = self.adapter.encoding_rotations(SWEEP_PROBES[:, None] * direction[None, :])
+        freqs, degeneracy = analytic_spectrum(sweep_generators(rotations))
+        # The amplitudes depend on the fixed gates: there is no power to report
+        return freqs, None, degeneracy
+
+    def geometry(self, X_data=None, n_samples=200, save_path=None, kernel_out=None, n_pairs=None, seed=0,
+                 state_space='auto', nystrom=None, landmarks='uniform'):
         """
         Analyzes geometry preservation. 
         If X_data is None, automatically generates a Swiss Roll.
+
+        Args:
+            kernel_out (str or np.ndarray, optional): Path of a memory-mapped `.npy`
+                file (or a preallocated buffer) to write the Gram matrix into.
+            n_pairs (int, optional): Estimate the score from this many randomly
+                sampled pairs (with a 95% bootstrap interval) instead of all N^2/2.
+            seed (int): Random seed of the pair sample.
+            state_space (bool or str): Project by linear PCA on the vectorized density
+                matrices |psi><psi| (D^2 features) instead of eigendecomposing the
+                N x N kernel. 'auto' does so when D^2 < N (fidelity kernel only).
+                With `n_pairs` the whole analysis then scales linearly in N.
+            nystrom (int, optional): Work off a Nystrom approximation with this many
+                landmarks (O(N m) memory). The score is then estimated from sampled
+                pairs (`n_pairs`, default 100000).
+            landmarks (str): Landmark selection for `nystrom`: 'uniform', 'kmeans'
+                or 'leverage'.
+
+        Returns:
+            dict: "score" (plus "ci" for sampled pairs) and "embedding", a
+            `GeometryEmbedding` whose `transform(X_new)` places new points in the
+            same projection from their kernel row against the training set.
         """
         print("[HilbertLens] Analyzing Geometry...")
         
@@ -137,27 +344,188 @@ class QuantumLens:
         # However, simple 1-qubit circuits might expect 1D data.
         # We'll try passing it directly.
         
+        adapter = self.adapter
         try:
-            K_matrix = self.adapter.get_kernel_matrix(X_data)
+            features = None
+            feature_fn = None
+            states = None
+            if nystrom is not None:
+                factor = self.adapter.get_nystrom_kernel(X_data, nystrom, landmarks=landmarks, seed=seed)
+                features = factor.factor
+                landmark_states = self.adapter.get_states(factor.landmarks)
+                feature_fn = lambda X_new: adapter.kernel_from_states(
+                    adapter.get_states(X_new), landmark_states) @ factor.projection
+                n_pairs = n_pairs or 100_000
+                print(f"  - Nystrom approximation: {factor}")
+            elif state_space and self.adapter.dense_states and self.adapter.kernel == "fidelity":
+                # Decide before simulating when the state size is known
+                D = self.adapter.state_dim
+                if D is None:
+                    states = self.adapter.get_states(X_data)
+                    D = states.shape[1]
+                if state_space is True or D**2 < X_data.shape[0]:
+                    if states is None:
+                        states = self.adapter.get_states(X_data)
+                    features = density_features(states)
+                    feature_fn = lambda X_new: density_features(adapter.get_statevectors(X_new))
+                    print(f"  - State-space PCA on {features.shape[1]} density-matrix features")
+
+            # The full kernel is only needed for an exact (all-pairs) score
+            # or the kernel-space projection. States simulated above are reused.
+            K_matrix = None
+            if features is None or n_pairs is None:
+                if states is None and self.adapter.store is not None:
+                    # The disk store serves (or persists) the kernel and states
+                    K_matrix = self.adapter.get_kernel_matrix(X_data, out=kernel_out)
+                else:
+                    if states is None:
+                        states = self.adapter.get_states(X_data)
+                    K_matrix = self.adapter.kernel_from_states(states, out=kernel_out)
+            if features is None:
+                # Out-of-sample rows are overlaps against the held training states
+                train_states = states if states is not None else self.adapter.get_states(X_data)
+                feature_fn = lambda X_new: adapter.kernel_from_states(adapter.get_states(X_new), train_states)
         except Exception as e:
             print(f"Error computing kernel: {e}")
             print("Hint: Does your circuit have enough parameters for {X_data.shape[1]} features?")
             return None
 
         # 2. Score
-        score = compute_geometry_score(X_data, K_matrix)
-        print(f"  - Geometry Score (Spearman Correlation): {score:.4f}")
+        interval = None
+        if n_pairs is None:
+            score = compute_geometry_score(X_data, K_matrix)
+            print(f"  - Geometry Score (Spearman Correlation): {score:.4f}")
+        else:
+            kernel = K_matrix if K_matrix is not None else \
+                (lambda i, j: np.sum(features[i] * features[j], axis=1))
+            score, interval = estimate_geometry_score(X_data, kernel, n_pairs=n_pairs, seed=seed)
+            print(f"  - Geometry Score (Spearman Correlation, {n_pairs} pairs): {score:.4f} "
+                  f"[95% CI {interval[0]:.4f}, {interval[1]:.4f}]")
         
         # 3. Project & Plot
-        X_proj = project_quantum_state(K_matrix)
+        if features is not None:
+            X_proj, center, components = fit_feature_pca(features)
+            kind = 'nystrom' if nystrom is not None else 'state_space'
+        else:
+            X_proj, center, components = fit_kernel_pca(K_matrix)
+            kind = 'kernel'
+        embedding = GeometryEmbedding(feature_fn, center, components, X_proj, kind)
         
         title = f"Geometry Projection (Score: {score:.2f})"
         plot_manifold_3d(X_proj, color, title=title, save_path=save_path)
         
         # STORE RESULTS
-        self.last_geometry_stats = {"score": score}
+        self.last_geometry_stats = {"score": score, "embedding": embedding}
+        if interval is not None:
+            self.last_geometry_stats["ci"] = interval
         return self.last_geometry_stats
     
+    def kernel_metrics(self, X, y=None, n_components=20, kernel_matrix=None, kernel_out=None,
+                       solver='randomized', seed=0):
+        """
+        Kernel quality metrics for model selection (see `metrics.kernel_metrics`):
+        kernel-target alignment, effective dimension, eigenvalue decay and
+        off-diagonal concentration.
+
+        The Gram matrix is computed once (or loaded from `cache_dir`, or passed in
+        as `kernel_matrix`); all metrics share one partial eigendecomposition and
+        read the kernel in row tiles, so it may live in a memory-mapped file.
+
+        Args:
+            X (array): Input data (N, d).
+            y (array, optional): Class labels (N,) for the alignment metrics.
+            n_components (int): Leading eigenvalues to compute.
+            kernel_matrix (array, optional): Precomputed kernel of X to reuse.
+            kernel_out (str or np.ndarray, optional): Where to write the Gram
+                matrix (see `geometry`).
+        """
+        print("[HilbertLens] Computing Kernel Metrics...")
+        if kernel_matrix is None:
+            kernel_matrix = self.adapter.get_kernel_matrix(X, out=kernel_out)
+
+        stats = kernel_metrics(kernel_matrix, y, n_components=n_components, solver=solver,
+                               memory_budget=self.adapter.memory_budget, seed=seed)
+        if "alignment" in stats:
+            print(f"  - Kernel-Target Alignment: {stats['alignment']:.4f}")
+        print(f"  - Effective Dimension: {stats['effective_dimension']:.2f}")
+        print(f"  - Eigenvalue Decay Rate: {stats['decay_rate']:.4f}")
+        print(f"  - Off-diagonal Kernel: mean {stats['off_diagonal_mean']:.4f}, "
+              f"variance {stats['off_diagonal_variance']:.2e}")
+
+        self.last_kernel_metrics = stats
+        return stats
+
+    def compare_classical(self, X, kernels=('rbf', 'linear'), regularization=1e-3, rank=None,
+                          gamma=None, landmarks='uniform', seed=0, classical_rank=None):
+        """
+        Geometric difference g(K_C || K_Q) of the quantum kernel against classical
+        baselines (Huang et al., "Power of data in quantum machine learning").
+
+        The quantum kernel is decomposed once and reused for every baseline.
+
+        Args:
+            X (array): Input data (N, d).
+            kernels (list): 'rbf', 'linear', or callables kernel(X, Y) -> (N, M)
+                (e.g. sklearn pairwise kernels).
+            regularization (float): lambda in (K_C + lambda I)^{-1}.
+            rank (int, optional): Use Nystrom approximations with this many landmarks
+                for the quantum and the (non-linear) classical kernels: O(N rank^2)
+                instead of O(N^3), for tens of thousands of points.
+            gamma (float, optional): RBF width (default 1 / (d * Var(X))).
+            landmarks (str): Landmark selection for `rank` ('uniform', 'kmeans', 'leverage').
+            classical_rank (int, optional): Landmarks of the classical Nystrom factors
+                (default 4 * rank). Classical kernels are cheap to evaluate, and a
+                truncated classical spectrum inflates g, so they get more landmarks.
+
+        Returns:
+            dict: Geometric difference per classical kernel.
+        """
+        print("[HilbertLens] Comparing against classical kernels...")
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        if gamma is None:
+            gamma = 1.0 / (X.shape[1] * X.var()) if X.var() > 0 else 1.0
+
+        if rank is None:
+            quantum_sqrt = kernel_sqrt(self.adapter.get_kernel_matrix(X))
+        else:
+            factor = self.adapter.get_nystrom_kernel(X, rank, landmarks=landmarks, seed=seed)
+            quantum_sqrt = factor_sqrt(factor.factor)
+            print(f"  - Nystrom approximation: {factor}")
+
+        results = {}
+        for i, kernel in enumerate(kernels):
+            if kernel == 'rbf':
+                name, kernel_fn = 'rbf', (lambda A, B: rbf_kernel(A, B, gamma=gamma))
+            elif kernel == 'linear':
+                name, kernel_fn = 'linear', linear_kernel
+            elif callable(kernel):
+                name, kernel_fn = getattr(kernel, '__name__', f'kernel_{i}'), kernel
+            else:
+                raise ValueError(f"Unknown classical kernel '{kernel}'. Use 'rbf', 'linear' or a callable.")
+
+            if rank is None:
+                g = geometric_difference(quantum_sqrt, classical_kernel=kernel_fn(X, X),
+                                         regularization=regularization)
+            elif kernel == 'linear':
+                # The linear kernel is exactly low rank: its factor is X itself
+                g = geometric_difference(quantum_sqrt, classical_factor=X, regularization=regularization)
+            else:
+                m = min(classical_rank or 4 * rank, X.shape[0])
+                L = X[np.sort(np.random.default_rng(seed).choice(X.shape[0], size=m, replace=False))]
+                classical = NystromFactor(kernel_fn(X, L), kernel_fn(L, L), L)
+                # The exact diagonal accounts for the spectrum the factor truncates
+                diagonal = np.concatenate([np.diag(kernel_fn(X[i:i + 256], X[i:i + 256]))
+                                           for i in range(0, X.shape[0], 256)])
+                g = geometric_difference(quantum_sqrt, classical_factor=classical.factor,
+                                         regularization=regularization, classical_diagonal=diagonal)
+            results[name] = g
+            print(f"  - g(K_{name} || K_Q): {g:.4f}")
+
+        self.last_classical_comparison = results
+        return results
+
     def diagnose(self):
         """
         Generates the full research report based on previous runs.
@@ -99,6 +99,10 @@ def print_report(spec_stats, geom_stats):
     # Extract raw data
     freqs = spec_stats.get('freqs', np.array([spec_stats['dominant_freq']]))
     power = spec_stats.get('power', np.array([spec_stats['max_power']]))
+    accessible = power is None
+    if accessible:
+        # Analytic spectra carry no power: every accessible frequency counts
+        power = np.ones(len(freqs))
     score = geom_stats.get('score', 0)
 
     # Run Deep Analysis
@@ -115,7 +119,7 @@ def print_report(spec_stats, geom_stats):
     
     # --- SECTION 1: CAPACITY ---
     print(f"\n[1] SPECTRUM ANALYSIS (Capacity & Expressibility)")
-    print(f"    • Active Frequencies: {n_act} (Richness)")
+    print(f"    • Active Frequencies: {n_act} (Richness{', accessible set' if accessible else ''})")
     print(f"    • Max Frequency:      k={k_val:.1f} (Bandwidth)")
     print(f"    • Category:           {spec_analysis['category']}")
     print(f"    • Assessment:         {spec_analysis['assessment']}")
@@ -1,8 +1,11 @@
 import numpy as np
-from scipy.stats import spearmanr
+from scipy.linalg import cho_factor, cho_solve
+from scipy.stats import spearmanr, rankdata
 from sklearn.decomposition import KernelPCA
 from sklearn.metrics import pairwise_distances
 
+from .kernels import kernel_times, top_eigenpairs
+
 def compute_geometry_score(X, kernel_matrix):
     """
     Measures how well the quantum kernel preserves the classical distances.
@@ -39,10 +42,298 @@ def compute_geometry_score(X, kernel_matrix):
     # So we return -corr.
     return -corr
 
-def project_quantum_state(kernel_matrix, n_components=3):
+def estimate_geometry_score(X, kernel, n_pairs=100_000, n_bootstrap=200, confidence=0.95,
+                            seed=0, chunk_size=65_536):
+    """
+    Sampled-pair estimate of `compute_geometry_score` with a bootstrap interval.
+
+    Instead of all N(N-1)/2 pairs, `n_pairs` random pairs i != j are drawn
+    (reproducibly under `seed`). Distances and kernel values are gathered in
+    chunks, so memory is O(n_pairs) and the kernel may be a memory-mapped
+    matrix or a function that is never materialized.
+
+    Args:
+        X (array): Input data (N, d).
+        kernel (array or callable): Kernel matrix (N, N), or a function
+                                    kernel(I, J) returning K[I, J] for index arrays.
+        n_pairs (int): Number of sampled pairs.
+        n_bootstrap (int): Bootstrap resamples for the confidence interval (0 = none).
+        confidence (float): Confidence level of the interval.
+        seed (int): Random seed for the pair sample and the bootstrap.
+
+    Returns:
+        score (float): Estimated Spearman correlation (sign flipped as in
+                       `compute_geometry_score`).
+        interval (tuple): (low, high) percentile bootstrap interval, or (nan, nan).
+    """
+    X = np.asarray(X)
+    N = X.shape[0]
+    rng = np.random.default_rng(seed)
+
+    # Uniform over ordered pairs with i != j (j is i shifted by 1..N-1)
+    I = rng.integers(0, N, size=n_pairs)
+    J = (I + rng.integers(1, N, size=n_pairs)) % N
+
+    d_class = np.empty(n_pairs)
+    k_values = np.empty(n_pairs)
+    for start in range(0, n_pairs, chunk_size):
+        i, j = I[start:start + chunk_size], J[start:start + chunk_size]
+        d_class[start:start + len(i)] = np.linalg.norm(X[i] - X[j], axis=1)
+        k_values[start:start + len(i)] = kernel(i, j) if callable(kernel) else kernel[i, j]
+
+    # Spearman = Pearson correlation of the ranks
+    r_class = rankdata(d_class)
+    r_kernel = rankdata(k_values)
+    score = -np.corrcoef(r_class, r_kernel)[0, 1]
+
+    if n_bootstrap <= 0:
+        return score, (np.nan, np.nan)
+
+    # Resample pairs, reusing the ranks of the full sample (avoids re-sorting)
+    boot = np.empty(n_bootstrap)
+    for b in range(n_bootstrap):
+        idx = rng.integers(0, n_pairs, size=n_pairs)
+        boot[b] = -np.corrcoef(r_class[idx], r_kernel[idx])[0, 1]
+
+    alpha = (1 - confidence) / 2
+    return score, (np.quantile(boot, alpha), np.quantile(boot, 1 - alpha))
+
+def project_quantum_state(kernel_matrix, n_components=3, solver='randomized', memory_budget=None,
+                          n_iter=7, oversample=20, seed=0, rcond=1e-10):
     """
     Uses Kernel PCA to project the quantum state back to 3D for visualization.
+
+    See `fit_kernel_pca` for the arguments.
+
+    Returns:
+        X_projected (array): (N, n_components) projections sqrt(lambda_k) * v_k.
+    """
+    return fit_kernel_pca(kernel_matrix, n_components, solver, memory_budget, n_iter, oversample, seed, rcond)[0]
+
+
+def fit_kernel_pca(kernel_matrix, n_components=3, solver='randomized', memory_budget=None,
+                   n_iter=7, oversample=20, seed=0, rcond=1e-10):
+    """
+    Kernel PCA of a precomputed kernel, keeping what out-of-sample projection needs.
+
+    Only the top components are computed. The centered kernel
+    H K H (H = I - 11^T/N) is never formed: it is applied to blocks of vectors
+    by streaming row tiles of K, so the kernel may be a memory-mapped `.npy`.
+
+    Args:
+        kernel_matrix (array): Kernel (N, N); a np.memmap works without loading it.
+        n_components (int): Number of components.
+        solver (str): 'randomized' (block subspace iteration, a few passes over K),
+                      'lanczos' (ARPACK on the implicit operator) or 'dense'
+                      (sklearn KernelPCA, O(N^3)).
+        memory_budget (int, optional): Peak bytes of a kernel row tile.
+        n_iter (int): Power iterations of the randomized solver.
+        oversample (int): Extra subspace vectors of the randomized solver (kernel
+                          spectra are often flat, so a generous margin pays off).
+        seed (int): Random seed of the randomized solver.
+        rcond (float): Eigenvalues below rcond * lambda_max are numerical noise of a
+                       rank-deficient kernel; their components are set to zero.
+
+    Returns:
+        X_projected (array): (N, n_components) projections sqrt(lambda_k) * v_k.
+        row_means (array): Mean kernel value of every training point (N,).
+        components (array): v_k / sqrt(lambda_k) (N, n_components). A new point with
+                            kernel row k projects to (k - row_means) @ components.
+    """
+    if solver == 'dense':
+        K = np.asarray(kernel_matrix)
+        kpca = KernelPCA(n_components=n_components, kernel='precomputed').fit(K)
+        eigvals, eigvecs = kpca.eigenvalues_, kpca.eigenvectors_
+        row_means = K.mean(axis=1)
+    elif solver in ('randomized', 'lanczos'):
+        N = kernel_matrix.shape[0]
+        row_means = kernel_times(kernel_matrix, np.ones((N, 1)), memory_budget)[:, 0] / N
+        total_mean = row_means.mean()
+
+        def centered_times(V):
+            # (K - 1 r^T - r 1^T + m 1 1^T) V
+            col_sums = V.sum(axis=0, keepdims=True)
+            return (kernel_times(kernel_matrix, V, memory_budget) - (row_means @ V)[None, :]
+                    - row_means[:, None] * col_sums + total_mean * col_sums)
+
+        eigvals, eigvecs = top_eigenpairs(centered_times, N, n_components, solver, n_iter, oversample, seed)
+    else:
+        raise ValueError(f"Unknown solver '{solver}'. Use 'randomized', 'lanczos' or 'dense'.")
+
+    # Deterministic signs: largest-magnitude entry of each component is positive
+    signs = np.sign(eigvecs[np.argmax(np.abs(eigvecs), axis=0), np.arange(eigvecs.shape[1])])
+    eigvecs = eigvecs * signs
+
+    # Noise eigenvalues of a rank-deficient kernel would blow up 1/sqrt(lambda):
+    # drop them from both the projection and the out-of-sample components
+    eigvals = np.maximum(eigvals, 0)
+    keep = eigvals > rcond * eigvals.max(initial=0.0)
+    root = np.where(keep, np.sqrt(eigvals), 0.0)
+    # The centered eigenvectors are orthogonal to 1, so the new point's own
+    # mean kernel value drops out of the out-of-sample formula
+    scale = np.divide(1.0, root, out=np.zeros_like(root), where=keep)
+    return eigvecs * root, row_means, eigvecs * scale
+
+
+def density_features(states):
+    """
+    Real vectorization of the density matrices |psi><psi| of a batch of states.
+
+    Diagonal entries are kept as they are; every off-diagonal pair i < j gives
+    sqrt(2) Re(rho_ij) and sqrt(2) Im(rho_ij). The Euclidean inner product of two
+    rows is then Tr(rho_x rho_y) = |<psi_x|psi_y>|^2, the fidelity kernel.
+
+    Args:
+        states (array): Statevectors (N, D).
+
+    Returns:
+        features (array): Real features (N, D^2).
+    """
+    states = np.asarray(states)
+    D = states.shape[1]
+    i, j = np.triu_indices(D, k=1)
+    diagonal = np.abs(states)**2
+    off = np.sqrt(2) * states[:, i] * states[:, j].conj()
+    return np.concatenate([diagonal, off.real, off.imag], axis=1)
+
+
+def project_state_space(features, n_components=3):
+    """
+    Kernel PCA projection computed as linear PCA of explicit features.
+
+    For features whose inner products give the kernel (`density_features`, or
+    the factor of a `NystromFactor`), this equals `project_quantum_state` on
+    that kernel, but costs O(N r^2) time and O(N r) memory for r features
+    instead of working on the N x N kernel.
+
+    Returns:
+        X_projected (array): (N, n_components) projections sqrt(lambda_k) * v_k.
+    """
+    return fit_feature_pca(features, n_components)[0]
+
+
+def fit_feature_pca(features, n_components=3):
+    """
+    Linear PCA of explicit kernel features (see `project_state_space`).
+
+    Returns:
+        X_projected (array): (N, n_components) projections.
+        mean (array): Feature mean (r,).
+        components (array): Principal axes (r, n_components). A new point with
+                            features f projects to (f - mean) @ components.
+    """
+    mean = features.mean(axis=0)
+    centered = features - mean
+    eigvals, eigvecs = np.linalg.eigh(centered.T @ centered)
+    order = np.argsort(eigvals)[::-1][:n_components]
+    components = eigvecs[:, order]
+    projected = centered @ components
+
+    # Same deterministic signs as project_quantum_state
+    signs = np.sign(projected[np.argmax(np.abs(projected), axis=0), np.arange(projected.shape[1])])
+    return projected * signs, mean, components * signs
+
+
+class GeometryEmbedding:
+    """
+    A fitted Hilbert-space embedding that places new points without refitting.
+
+    New points are mapped to features (their kernel row against the training
+    states, or explicit density/Nystrom features), centered with the training
+    statistics and multiplied by the fitted components. Per point, this costs
+    one kernel row: O(N_train) overlaps, or O(r) for explicit features.
+
+    Attributes:
+        kind (str): 'kernel', 'state_space' or 'nystrom'.
+        X_projected (array): The training points' projection (N_train, k).
+    """
+
+    def __init__(self, feature_fn, center, components, X_projected, kind):
+        self.feature_fn = feature_fn
+        self.center = center
+        self.components = components
+        self.X_projected = X_projected
+        self.kind = kind
+
+    def transform(self, X_new):
+        """Projects new input points (M, d) onto the embedding: (M, k)."""
+        return (self.feature_fn(X_new) - self.center) @ self.components
+
+    def __repr__(self):
+        return f"<GeometryEmbedding: {self.kind}, {self.X_projected.shape[0]} training points, {self.components.shape[1]} components>"
+
+
+def kernel_sqrt(kernel_matrix):
     """
-    kpca = KernelPCA(n_components=n_components, kernel='precomputed')
-    X_projected = kpca.fit_transform(kernel_matrix)
-    return X_projected
\ No newline at end of file
+    Eigendecomposition of a PSD kernel as its square-root factor.
+
+    Returns:
+        (V, sigma): Orthonormal V (N, r) and sigma (r,) with K = V diag(sigma^2) V^T,
+                    so sqrt(K) = V diag(sigma) V^T.
+    """
+    eigvals, eigvecs = np.linalg.eigh(np.asarray(kernel_matrix, dtype=float))
+    return eigvecs, np.sqrt(np.maximum(eigvals, 0))
+
+
+def factor_sqrt(factor):
+    """`kernel_sqrt` of a low-rank kernel K = F F^T from its factor F (N, r), in O(N r^2)."""
+    V, sigma, _ = np.linalg.svd(factor, full_matrices=False)
+    return V, sigma
+
+
+def geometric_difference(quantum_sqrt, classical_kernel=None, classical_factor=None, regularization=1e-3,
+                         classical_diagonal=None):
+    """
+    Geometric difference g(K_C || K_Q) = sqrt(||sqrt(K_Q) (K_C + lambda I)^{-1} sqrt(K_Q)||_2).
+
+    Large values mean some labelling is learnable with the quantum kernel but not
+    with the classical one. Both kernels are normalized to trace N. The quantum
+    side enters through its (possibly low-rank) square root, computed once and
+    shared across classical baselines: with K_Q = V S^2 V^T the norm is that of
+    the small matrix S V^T (K_C + lambda I)^{-1} V S.
+
+    A truncated classical factor (e.g. Nystrom) misses the spectrum beyond its
+    rank, and the inverse would treat all of it as lambda alone, inflating g.
+    Given the exact diagonal, the missing mass is spread evenly instead:
+    K_C ~ F F^T + rho I with rho the mean residual diagonal.
+
+    Args:
+        quantum_sqrt (tuple): (V, sigma) from `kernel_sqrt` or `factor_sqrt`.
+        classical_kernel (array, optional): Dense classical kernel (N, N).
+        classical_factor (array, optional): Low-rank classical factor F (N, r),
+                                            K_C ~ F F^T (inverted by Woodbury).
+        regularization (float): lambda > 0.
+        classical_diagonal (array, optional): Exact diagonal of K_C (N,) for a
+                                              truncated `classical_factor`.
+
+    Returns:
+        g (float): Geometric difference.
+    """
+    if regularization <= 0:
+        raise ValueError("regularization must be positive.")
+    V, sigma = quantum_sqrt
+    N = V.shape[0]
+    # Normalize K_Q to trace N
+    sigma = sigma * np.sqrt(N / np.sum(sigma**2))
+
+    if classical_kernel is not None:
+        K_C = np.array(classical_kernel, dtype=float)
+        K_C *= N / np.trace(K_C)
+        K_C[np.diag_indices(N)] += regularization
+        middle = V.T @ cho_solve(cho_factor(K_C), V)
+    elif classical_factor is not None:
+        U, s = factor_sqrt(classical_factor)
+        captured = np.sum(s**2)
+        trace = captured if classical_diagonal is None else max(np.sum(classical_diagonal), captured)
+        scale = N / trace
+        s2 = s**2 * scale
+        # Residual K_C - F F^T, approximated by its mean diagonal (after normalization)
+        shift = regularization + (trace - captured) * scale / N
+        # (U S U^T + shift I)^{-1} = (I - U diag(s2 / (s2 + shift)) U^T) / shift
+        P = U.T @ V
+        middle = (np.eye(V.shape[1]) - P.T @ (P * (s2 / (s2 + shift))[:, None])) / shift
+    else:
+        raise ValueError("Pass either classical_kernel or classical_factor.")
+
+    A = sigma[:, None] * middle * sigma[None, :]
+    return float(np.sqrt(max(np.linalg.eigvalsh((A + A.T) / 2)[-1], 0)))
@@ -0,0 +1,508 @@
+"""
+Shared Kernel Routines.
+
+Builds fidelity Gram matrices from batches of statevectors. The computation is
+tiled so that the complex intermediates never exceed a configurable memory
+budget. Only the upper triangle is computed for symmetric matrices, and the
+result can be written into a memory-mapped `.npy` file or any caller-provided
+buffer.
+
+`NystromFactor` holds a low-rank approximation K ~ F F^T built from the
+cross-kernel against m landmarks, in O(N m) memory.
+
+`IncrementalKernel` grows a Gram matrix as data is appended, simulating and
+computing only the new rows.
+
+`projected_gram` builds the projected quantum kernel, an RBF kernel on the
+single-qubit reduced density matrices (see `reduced_density_features`).
+
+`kernel_times` and `top_eigenpairs` stream row tiles of a (possibly
+memory-mapped) kernel for products and partial eigendecompositions.
+"""
+
+import os
+import numpy as np
+from scipy.linalg.blas import get_blas_funcs
+from scipy.sparse.linalg import LinearOperator, eigsh
+from typing import List, Optional, Union
+
+# Default peak memory for kernel intermediates (bytes).
+DEFAULT_MEMORY_BUDGET = 512 * 1024**2
+
+
+class ProductLayout:
+    """
+    Packed layout of product states: the block states of each sample side by side.
+
+    The fidelity of a product state is the product of its block fidelities.
+    """
+
+    def __init__(self, widths: List[int]):
+        self.widths = list(widths)
+
+    def fidelity(self, M_x: np.ndarray, M_y: np.ndarray) -> np.ndarray:
+        K = np.ones((M_x.shape[0], M_y.shape[0]), dtype=M_x.real.dtype)
+        start = 0
+        for width in self.widths:
+            K *= fidelity_kernel(M_x[:, start:start + width], M_y[:, start:start + width])
+            start += width
+        return K
+
+    def entry_bytes(self, itemsize: int) -> int:
+        # One block product at a time, plus the running real product
+        return itemsize + itemsize // 2 + 8
+
+    def reduced_density_features(self, M: np.ndarray) -> np.ndarray:
+        """Single-qubit RDM features of every block (qubit order does not affect the kernel)."""
+        features, start = [], 0
+        for width in self.widths:
+            features.append(reduced_density_features(M[:, start:start + width]))
+            start += width
+        return np.concatenate(features, axis=1)
+
+    def __repr__(self):
+        return f"product{self.widths}"
+
+
+def fidelity_kernel(M_x: np.ndarray, M_y: np.ndarray, layout=None) -> np.ndarray:
+    """
+    Fidelity kernel between two batches of statevectors.
+
+    Args:
+        M_x (np.ndarray): Statevectors (N, 2^n).
+        M_y (np.ndarray): Statevectors (M, 2^n).
+        layout (optional): Packed state layout (e.g. ProductLayout) that knows how
+                           to compute fidelities without forming 2^n vectors.
+
+    Returns:
+        np.ndarray: Kernel matrix (N, M) with entries |<psi_x|psi_y>|^2.
+    """
+    if layout is not None:
+        return layout.fidelity(M_x, M_y)
+
+    # Fidelity is the squared magnitude of the inner products <psi(x)|psi(y)>
+    return _squared_modulus(_inner_products(M_x, M_y))
+
+
+def _inner_products(M_x: np.ndarray, M_y: np.ndarray) -> np.ndarray:
+    """
+    conj(M_x @ M_y^H) through BLAS GEMM, without copying either operand.
+
+    A C-ordered (N, D) block is the Fortran-ordered (D, N) transpose, so
+    GEMM(op_a = conjugate transpose) of the transposed views reads the states
+    in place. The result is the complex conjugate of the inner products, which
+    has the same squared modulus.
+    """
+    if not np.iscomplexobj(M_x) or not np.iscomplexobj(M_y) or M_x.dtype != M_y.dtype:
+        return M_x @ M_y.conj().T
+    gemm, = get_blas_funcs(("gemm",), (M_x,))
+    return gemm(1.0, M_x.T, M_y.T, trans_a=2)
+
+
+def _self_inner_products(M: np.ndarray) -> np.ndarray:
+    """
+    Upper triangle of conj(M @ M^H) via a Hermitian rank-k update (HERK).
+
+    Half the flops of the general product; the strict lower triangle is zero.
+    """
+    if not np.iscomplexobj(M):
+        return np.triu(M @ M.T)
+    herk, = get_blas_funcs(("herk",), (M,))
+    return herk(1.0, M.T, trans=2)
+
+
+def _squared_modulus(G: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """|G|^2 written into `out` (or a new real array), reusing G's buffer as scratch."""
+    if not np.iscomplexobj(G):
+        return np.square(G, out=out)
+    out = np.square(G.real, out=out)
+    out += np.square(G.imag, out=G.imag)
+    return out
+
+
+def rdm_features(rho: np.ndarray) -> np.ndarray:
+    """
+    Real features of single-qubit density matrices rho (N, n, 2, 2).
+
+    Per qubit: rho_00, rho_11, sqrt(2) Re(rho_01), sqrt(2) Im(rho_01), so the
+    squared Euclidean distance of two rows is sum_k ||rho_k - rho'_k||_F^2.
+    """
+    off = np.sqrt(2) * rho[:, :, 0, 1]
+    features = np.stack([rho[:, :, 0, 0].real, rho[:, :, 1, 1].real, off.real, off.imag], axis=2)
+    return features.reshape(rho.shape[0], -1)
+
+
+def reduced_density_features(states: np.ndarray) -> np.ndarray:
+    """
+    Single-qubit reduced density matrices of a batch of statevectors, as `rdm_features`.
+
+    One vectorized pass over the (N, 2^n) matrix per qubit: O(N 2^n n).
+
+    Args:
+        states (np.ndarray): Statevectors (N, 2^n), Qiskit (little-endian) order.
+
+    Returns:
+        np.ndarray: Real features (N, 4n).
+    """
+    N, D = states.shape
+    n = int(np.log2(D))
+    rho = np.empty((N, n, 2, 2), dtype=states.dtype)
+    for k in range(n):
+        # Qubit k is bit k of the index: (higher bits, b_k, lower bits)
+        psi = states.reshape(N, 2**(n - 1 - k), 2, 2**k)
+        rho[:, k] = np.einsum('nhal,nhbl->nab', psi, psi.conj())
+    return rdm_features(rho)
+
+
+def block_size_for_budget(memory_budget: Optional[int], entry_bytes: int = 24) -> int:
+    """
+    Largest tile edge b such that one tile's intermediates fit in the budget.
+
+    Args:
+        memory_budget (int, optional): Peak bytes (None = DEFAULT_MEMORY_BUDGET).
+        entry_bytes (int): Intermediate bytes per kernel entry. For dense states
+                           a tile needs a complex (b, b) product plus a real result.
+    """
+    budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+    return max(1, int(np.sqrt(budget / entry_bytes)))
+
+
+def allocate_kernel(shape: tuple, out: Union[None, str, np.ndarray] = None, dtype=np.float64) -> np.ndarray:
+    """
+    Allocates the kernel output.
+
+    Args:
+        shape (tuple): (N, M).
+        out: None (in-memory array), a file path (memory-mapped `.npy`), or an
+             existing array/memmap of the right shape.
+    """
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+
+    if isinstance(out, (str, os.PathLike)):
+        directory = os.path.dirname(os.fspath(out))
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        return np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=shape)
+
+    if tuple(out.shape) != tuple(shape):
+        raise ValueError(f"Output buffer has shape {out.shape}, expected {shape}.")
+    return out
+
+
+def gram_matrix(M_x: np.ndarray, M_y: Optional[np.ndarray] = None,
+                out: Union[None, str, np.ndarray] = None,
+                memory_budget: Optional[int] = None, layout=None) -> np.ndarray:
+    """
+    Tiled fidelity Gram matrix.
+
+    Args:
+        M_x (np.ndarray): Statevectors (N, 2^n).
+        M_y (np.ndarray, optional): Statevectors (M, 2^n). If None, the symmetric
+                                    Gram matrix of M_x is built from its upper triangle.
+        out: Output target (see `allocate_kernel`).
+        memory_budget (int, optional): Peak bytes for tile intermediates.
+        layout (optional): Packed state layout (see `fidelity_kernel`).
+
+    Returns:
+        np.ndarray: Kernel (N, M); a np.memmap when `out` is a path. complex64
+                    states give a float32 kernel.
+    """
+    symmetric = M_y is None
+    if symmetric:
+        M_y = M_x
+
+    N, M = M_x.shape[0], M_y.shape[0]
+    K = allocate_kernel((N, M), out, dtype=np.finfo(M_x.dtype).dtype)
+    itemsize = np.dtype(M_x.dtype).itemsize
+    # Dense tiles only hold the complex product; |.|^2 is written straight into K
+    entry_bytes = itemsize if layout is None else layout.entry_bytes(itemsize)
+    b = block_size_for_budget(memory_budget, entry_bytes)
+
+    for i in range(0, N, b):
+        i_end = min(i + b, N)
+        j_start = i if symmetric else 0
+        for j in range(j_start, M, b):
+            j_end = min(j + b, M)
+            if layout is None:
+                _dense_tile(K, M_x, M_y, i, i_end, j, j_end, symmetric)
+                continue
+            tile = fidelity_kernel(M_x[i:i_end], M_y[j:j_end], layout)
+            if symmetric and j == i:
+                # Diagonal tile: keep its upper triangle so K is exactly symmetric
+                tile = np.triu(tile) + np.triu(tile, 1).T
+            K[i:i_end, j:j_end] = tile
+            if symmetric and j != i:
+                # Mirror the upper-triangle tile into the lower triangle
+                K[j:j_end, i:i_end] = tile.T
+
+    if isinstance(K, np.memmap):
+        K.flush()
+    return K
+
+
+def _dense_tile(K, M_x, M_y, i, i_end, j, j_end, symmetric):
+    """Fills K[i:i_end, j:j_end] (and its mirror) for full statevectors."""
+    block = K[i:i_end, j:j_end]
+    if symmetric and j == i:
+        # Diagonal tile: one triangle by HERK, then mirrored row by row in place
+        _squared_modulus(_self_inner_products(M_x[i:i_end]), out=block)
+        for r in range(1, i_end - i):
+            block[r, :r] = block[:r, r]
+        return
+    _squared_modulus(_inner_products(M_x[i:i_end], M_y[j:j_end]), out=block)
+    if symmetric:
+        # Mirror the upper-triangle tile into the lower triangle
+        K[j:j_end, i:i_end] = block.T
+
+
+def projected_gram(F_x: np.ndarray, F_y: Optional[np.ndarray] = None, gamma: float = 1.0,
+                   out: Union[None, str, np.ndarray] = None,
+                   memory_budget: Optional[int] = None) -> np.ndarray:
+    """
+    Tiled projected quantum kernel K = exp(-gamma sum_k ||rho_k(x) - rho_k(y)||_F^2).
+
+    Works on the reduced-density features of `reduced_density_features`: each
+    tile costs O(b^2 n) and the squared distances are formed in place.
+
+    Args:
+        F_x (np.ndarray): RDM features (N, 4n).
+        F_y (np.ndarray, optional): RDM features (M, 4n); None for the symmetric kernel.
+        gamma (float): RBF width.
+        out: Output target (see `allocate_kernel`).
+        memory_budget (int, optional): Peak bytes for tile intermediates.
+    """
+    symmetric = F_y is None
+    if symmetric:
+        F_y = F_x
+
+    N, M = F_x.shape[0], F_y.shape[0]
+    K = allocate_kernel((N, M), out, dtype=F_x.dtype)
+    b = block_size_for_budget(memory_budget, F_x.dtype.itemsize)
+    sq_x = np.einsum('ij,ij->i', F_x, F_x)
+    sq_y = sq_x if symmetric else np.einsum('ij,ij->i', F_y, F_y)
+
+    for i in range(0, N, b):
+        i_end = min(i + b, N)
+        for j in range(i if symmetric else 0, M, b):
+            j_end = min(j + b, M)
+            block = K[i:i_end, j:j_end]
+            # ||f - f'||^2 = |f|^2 + |f'|^2 - 2 f.f', then exp(-gamma d^2), all in place
+            d2 = np.matmul(F_x[i:i_end], F_y[j:j_end].T, out=block)
+            d2 *= -2
+            d2 += sq_x[i:i_end, None]
+            d2 += sq_y[None, j:j_end]
+            np.maximum(d2, 0, out=d2)
+            d2 *= -gamma
+            np.exp(d2, out=d2)
+            if symmetric and j == i:
+                for r in range(1, i_end - i):
+                    block[r, :r] = block[:r, r]
+            elif symmetric:
+                K[j:j_end, i:i_end] = block.T
+
+    if isinstance(K, np.memmap):
+        K.flush()
+    return K
+
+
+def kernel_times(kernel_matrix: np.ndarray, V: np.ndarray, memory_budget: Optional[int] = None) -> np.ndarray:
+    """K @ V, reading K one tile of rows at a time (K may be a np.memmap)."""
+    N = kernel_matrix.shape[0]
+    budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+    rows = max(1, int(budget // (8 * N)))
+    out = np.empty((N, V.shape[1]))
+    for start in range(0, N, rows):
+        out[start:start + rows] = np.asarray(kernel_matrix[start:start + rows], dtype=float) @ V
+    return out
+
+
+def top_eigenpairs(apply, N: int, n_components: int, solver: str = 'randomized',
+                   n_iter: int = 7, oversample: int = 20, seed: int = 0) -> tuple:
+    """
+    Largest eigenpairs of a symmetric N x N operator given only as `apply(V) = A @ V`.
+
+    Args:
+        apply (callable): Maps an (N, k) block to A @ block.
+        solver (str): 'randomized' (block subspace iteration + Rayleigh-Ritz,
+                      n_iter + 2 applications), 'lanczos' (ARPACK; needs
+                      n_components < N, else falls back to 'dense') or 'dense'
+                      (applies A to the identity, O(N^2) memory).
+        oversample (int): Extra subspace vectors of the randomized solver (kernel
+                          spectra are often flat, so a generous margin pays off).
+
+    Returns:
+        eigvals (np.ndarray): (n_components,) in descending order.
+        eigvecs (np.ndarray): (N, n_components).
+    """
+    if solver == 'dense' or (solver == 'lanczos' and n_components >= N):
+        # ARPACK cannot return all N eigenpairs; A is at most n_components wide here
+        eigvals, eigvecs = np.linalg.eigh(apply(np.eye(N)))
+    elif solver == 'lanczos':
+        operator = LinearOperator((N, N), matvec=lambda v: apply(v.reshape(N, -1)),
+                                  matmat=apply, dtype=float)
+        eigvals, eigvecs = eigsh(operator, k=n_components, which='LA')
+    elif solver == 'randomized':
+        rng = np.random.default_rng(seed)
+        Q = np.linalg.qr(apply(rng.standard_normal((N, min(N, n_components + oversample)))))[0]
+        for _ in range(n_iter):
+            Q = np.linalg.qr(apply(Q))[0]
+        # Rayleigh-Ritz on the captured subspace
+        eigvals, small = np.linalg.eigh(Q.T @ apply(Q))
+        eigvecs = Q @ small
+    else:
+        raise ValueError(f"Unknown solver '{solver}'. Use 'randomized', 'lanczos' or 'dense'.")
+
+    order = np.argsort(eigvals)[::-1][:n_components]
+    return eigvals[order], eigvecs[:, order]
+
+
+class NystromFactor:
+    """
+    Nystrom low-rank kernel approximation K ~ C W^+ C^T = F F^T.
+
+    C is the (N, m) cross-kernel against m landmarks and W the (m, m) landmark
+    kernel. Only the factor F = C W^{-1/2} (N, r <= m) is kept.
+
+    Attributes:
+        factor (np.ndarray): F, shape (N, rank).
+        projection (np.ndarray): W^{-1/2}, shape (m, rank). A new point with
+                                 landmark kernel row c has features c @ projection.
+        landmarks (np.ndarray): Landmark input points (m, d).
+        landmark_indices (np.ndarray or None): Rows of X used as landmarks, if any.
+    """
+
+    def __init__(self, C: np.ndarray, W: np.ndarray, landmarks: np.ndarray,
+                 landmark_indices: Optional[np.ndarray] = None, rcond: float = 1e-10):
+        eigvals, eigvecs = np.linalg.eigh((W + W.T) / 2)
+        keep = eigvals > rcond * max(eigvals.max(), 0)
+        self.projection = eigvecs[:, keep] / np.sqrt(eigvals[keep])
+        self.factor = C @ self.projection
+        self.landmarks = landmarks
+        self.landmark_indices = landmark_indices
+
+    @property
+    def shape(self) -> tuple:
+        return (self.factor.shape[0], self.factor.shape[0])
+
+    @property
+    def rank(self) -> int:
+        return self.factor.shape[1]
+
+    def pairs(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Approximate kernel values K[i, j] for index arrays i, j."""
+        return np.sum(self.factor[i] * self.factor[j], axis=1)
+
+    def to_dense(self, out: Union[None, str, np.ndarray] = None,
+                 memory_budget: Optional[int] = None) -> np.ndarray:
+        """Materializes F F^T (tiled by rows; see `allocate_kernel` for `out`)."""
+        N = self.factor.shape[0]
+        K = allocate_kernel((N, N), out)
+        rows = max(1, int((DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget) // (8 * N)))
+        for start in range(0, N, rows):
+            K[start:start + rows] = self.factor[start:start + rows] @ self.factor.T
+        if isinstance(K, np.memmap):
+            K.flush()
+        return K
+
+    def __repr__(self):
+        return f"<NystromFactor: N={self.factor.shape[0]}, landmarks={len(self.landmarks)}, rank={self.rank}>"
+
+
+class IncrementalKernel:
+    """
+    Gram matrix of a growing dataset, updated block by block.
+
+    Appending k samples to N simulates only the k new states and computes the
+    (k, N) cross block and the (k, k) diagonal block: O(k N) overlaps instead
+    of O((N + k)^2). Inputs, states and the kernel live in buffers whose
+    capacity doubles when full, so the amortized copy cost per sample is O(N).
+    For the projected kernel the reduced-density features are buffered too, so
+    only the new states are reduced.
+
+    Attributes:
+        X (np.ndarray): Inputs so far (N, d) (a view into the buffer).
+        states (np.ndarray): States in the adapter's native layout (N, width).
+        matrix (np.ndarray): Kernel matrix (N, N) (a view into the buffer).
+    """
+
+    def __init__(self, adapter, capacity: int = 256):
+        self.adapter = adapter
+        self.capacity = max(1, int(capacity))
+        self.n = 0
+        self._X = None
+        self._states = None
+        self._features = None
+        self._K = None
+
+    def _reserve(self, n_total: int, X_new: np.ndarray, states_new: np.ndarray,
+                 features_new: Optional[np.ndarray] = None):
+        if self._K is None:
+            while self.capacity < n_total:
+                self.capacity *= 2
+            self._X = np.empty((self.capacity, X_new.shape[1]), dtype=X_new.dtype)
+            self._states = np.empty((self.capacity, states_new.shape[1]), dtype=states_new.dtype)
+            if features_new is not None:
+                self._features = np.empty((self.capacity, features_new.shape[1]), dtype=features_new.dtype)
+            self._K = np.empty((self.capacity, self.capacity))
+            return
+        if n_total <= self.capacity:
+            return
+        while self.capacity < n_total:
+            self.capacity *= 2
+        n = self.n
+        X, states, features, K = self._X, self._states, self._features, self._K
+        self._X = np.empty((self.capacity, X.shape[1]), dtype=X.dtype)
+        self._states = np.empty((self.capacity, states.shape[1]), dtype=states.dtype)
+        self._K = np.empty((self.capacity, self.capacity))
+        self._X[:n], self._states[:n], self._K[:n, :n] = X[:n], states[:n], K[:n, :n]
+        if features is not None:
+            self._features = np.empty((self.capacity, features.shape[1]), dtype=features.dtype)
+            self._features[:n] = features[:n]
+
+    def append(self, X_new: np.ndarray) -> 'IncrementalKernel':
+        """Adds samples (k, d) and fills in their kernel rows and columns."""
+        X_new = np.asarray(X_new, dtype=float)
+        if X_new.ndim == 1:
+            X_new = X_new.reshape(-1, 1)
+        states_new = self.adapter.get_states(X_new)
+        n, k = self.n, X_new.shape[0]
+        projected = self.adapter.kernel == "projected"
+        features_new = self.adapter.reduced_density_features(states_new) if projected else None
+        self._reserve(n + k, X_new, states_new, features_new)
+
+        self._X[n:n + k] = X_new
+        self._states[n:n + k] = states_new
+        if projected:
+            self._features[n:n + k] = features_new
+            gram = lambda F_x, F_y=None: projected_gram(F_x, F_y, gamma=self.adapter.gamma,
+                                                        memory_budget=self.adapter.memory_budget)
+            new, old = features_new, self._features[:n]
+        else:
+            gram = self.adapter.kernel_from_states
+            new, old = states_new, self._states[:n]
+        if n:
+            cross = gram(new, old)
+            self._K[n:n + k, :n] = cross
+            self._K[:n, n:n + k] = cross.T
+        self._K[n:n + k, n:n + k] = gram(new)
+        self.n = n + k
+        return self
+
+    @property
+    def X(self) -> np.ndarray:
+        return self._X[:self.n] if self.n else np.empty((0, 0))
+
+    @property
+    def states(self) -> np.ndarray:
+        return self._states[:self.n] if self.n else np.empty((0, 0), dtype=complex)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._K[:self.n, :self.n] if self.n else np.empty((0, 0))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self):
+        return f"<IncrementalKernel: N={self.n}, capacity={self.capacity}>"
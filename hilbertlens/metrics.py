@@ -0,0 +1,101 @@
+"""
+Kernel Quality Metrics.
+
+Model-selection statistics of a Gram matrix: kernel-target alignment,
+effective dimension, eigenvalue decay and concentration of the off-diagonal
+values. Everything comes from one streamed pass over row tiles of K plus one
+shared partial eigendecomposition, so the kernel may be a memory-mapped
+`.npy` that is never loaded as a whole.
+"""
+
+import numpy as np
+
+from .kernels import kernel_times, top_eigenpairs, DEFAULT_MEMORY_BUDGET
+
+
+def _label_matrix(y):
+    """One-hot (N, C) encoding of class labels; T = 2 Y Y^T - 1 1^T is the target kernel."""
+    classes, codes = np.unique(np.asarray(y).ravel(), return_inverse=True)
+    Y = np.zeros((codes.size, classes.size))
+    Y[np.arange(codes.size), codes] = 1.0
+    return Y
+
+
+def kernel_metrics(kernel_matrix, y=None, n_components=20, solver='randomized',
+                   memory_budget=None, seed=0):
+    """
+    Quality metrics of a kernel matrix.
+
+    Args:
+        kernel_matrix (array): Kernel (N, N); a np.memmap works without loading it.
+        y (array, optional): Class labels (N,). The target kernel is +1 for pairs of
+                             the same class and -1 otherwise (y y^T for +-1 labels).
+        n_components (int): Number of leading eigenpairs to compute.
+        solver (str): Eigensolver, see `kernels.top_eigenpairs`.
+        memory_budget (int, optional): Peak bytes of a kernel row tile.
+        seed (int): Random seed of the randomized solver.
+
+    Returns:
+        dict:
+            "effective_dimension": participation ratio (tr K)^2 / ||K||_F^2.
+            "eigenvalues": leading eigenvalues as fractions of tr K.
+            "explained": their cumulative sum.
+            "decay_rate": r of the fit lambda_k ~ exp(-r k) over the leading eigenvalues.
+            "off_diagonal_mean", "off_diagonal_variance": concentration of K(x, x'), x != x'.
+            With y: "alignment" <K, T>_F / (||K||_F ||T||_F) and
+            "alignment_by_rank", the alignment of the rank-k truncations of K.
+    """
+    N = kernel_matrix.shape[0]
+    n_components = min(n_components, N)
+    budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+    rows = max(1, int(budget // (8 * N)))
+
+    # One pass over K: trace, norms, sums and the label projections
+    Y = None if y is None else _label_matrix(y)
+    probes = np.ones((N, 1)) if Y is None else np.hstack([Y, np.ones((N, 1))])
+    K_probes = np.empty((N, probes.shape[1]))
+    trace = diag_sq = frob_sq = total = 0.0
+    for start in range(0, N, rows):
+        tile = np.asarray(kernel_matrix[start:start + rows], dtype=float)
+        diag = tile[np.arange(tile.shape[0]), start + np.arange(tile.shape[0])]
+        trace += diag.sum()
+        diag_sq += np.dot(diag, diag)
+        frob_sq += np.einsum('ij,ij->', tile, tile)
+        total += tile.sum()
+        K_probes[start:start + rows] = tile @ probes
+
+    pairs = N * (N - 1)
+    off_mean = (total - trace) / pairs if pairs else np.nan
+    off_var = (frob_sq - diag_sq) / pairs - off_mean**2 if pairs else np.nan
+
+    eigvals, eigvecs = top_eigenpairs(lambda V: kernel_times(kernel_matrix, V, memory_budget),
+                                      N, n_components, solver, seed=seed)
+    eigvals = np.maximum(eigvals, 0)
+    fractions = eigvals / trace
+
+    positive = fractions > 1e-12
+    if positive.sum() >= 2:
+        decay_rate = -np.polyfit(np.flatnonzero(positive), np.log(fractions[positive]), 1)[0]
+    else:
+        decay_rate = np.inf
+
+    metrics = {
+        "n_samples": N,
+        "effective_dimension": trace**2 / frob_sq,
+        "eigenvalues": fractions,
+        "explained": np.cumsum(fractions),
+        "decay_rate": decay_rate,
+        "off_diagonal_mean": off_mean,
+        "off_diagonal_variance": off_var,
+    }
+
+    if Y is not None:
+        # <K, T> = 2 sum_c y_c^T K y_c - 1^T K 1, and ||T||_F = N
+        ones_K_ones = K_probes[:, -1].sum()
+        metrics["alignment"] = (2 * np.sum(Y * K_probes[:, :-1]) - ones_K_ones) / (np.sqrt(frob_sq) * N)
+
+        # Rank-k truncations: <K_k, T> = sum_i lambda_i (2 ||Y^T v_i||^2 - (1^T v_i)^2)
+        target = 2 * np.sum((Y.T @ eigvecs)**2, axis=0) - eigvecs.sum(axis=0)**2
+        metrics["alignment_by_rank"] = (np.cumsum(eigvals * target)
+                                        / (np.sqrt(np.cumsum(eigvals**2)) * N))
+    return metrics
@@ -0,0 +1,233 @@
+"""
+Matrix-Product-State Simulation for Wide Feature Maps.
+
+Simulates a compiled circuit as a batch of MPS with a bounded bond dimension
+(NumPy only). This handles 40-60 qubit hardware-efficient encodings whose
+entanglement stays low (e.g. nearest-neighbour CNOT ladders) where a 2^n
+statevector is impossible.
+
+Site k holds qubit k as a tensor (N, chi_left, 2, chi_right). Two-qubit gates
+on neighbours are applied by contracting both sites and splitting them again
+with a truncated SVD. Non-adjacent gates are routed with SWAPs. The squared
+singular values dropped along the way are accumulated per sample as the
+truncation error.
+
+Each sample is packed into one row: every site tensor zero-padded to a fixed
+bond profile, plus a final column with the truncation error. This keeps the
+width the same for every batch, so caching and process-pool sharding work
+unchanged.
+"""
+
+import numpy as np
+from typing import List
+
+from .simulator import CompiledCircuit
+from .kernels import rdm_features
+
+_SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex)
+
+
+class MPSLayout:
+    """Packed row layout of batched MPS (see module docstring)."""
+
+    def __init__(self, num_qubits: int, max_bond_dim: int):
+        self.num_qubits = num_qubits
+        self.max_bond_dim = max_bond_dim
+        # Bond k sits between sites k-1 and k; it can never exceed 2^min(k, n-k).
+        self.bond_dims = [
+            min(max_bond_dim, 2**min(k, num_qubits - k)) for k in range(num_qubits + 1)
+        ]
+        self.site_shapes = [(self.bond_dims[k], 2, self.bond_dims[k + 1]) for k in range(num_qubits)]
+        self.offsets = np.cumsum([0] + [int(np.prod(shape)) for shape in self.site_shapes])
+        self.width = int(self.offsets[-1]) + 1
+
+    def pack(self, sites: List[np.ndarray], errors: np.ndarray) -> np.ndarray:
+        N = sites[0].shape[0]
+        packed = np.zeros((N, self.width), dtype=sites[0].dtype)
+        for k, (site, shape) in enumerate(zip(sites, self.site_shapes)):
+            padded = np.zeros((N,) + shape, dtype=site.dtype)
+            padded[:, :site.shape[1], :, :site.shape[3]] = site
+            packed[:, self.offsets[k]:self.offsets[k + 1]] = padded.reshape(N, -1)
+        packed[:, -1] = errors
+        return packed
+
+    def sites(self, packed: np.ndarray) -> List[np.ndarray]:
+        N = packed.shape[0]
+        return [
+            packed[:, self.offsets[k]:self.offsets[k + 1]].reshape((N,) + shape)
+            for k, shape in enumerate(self.site_shapes)
+        ]
+
+    def truncation_error(self, packed: np.ndarray) -> np.ndarray:
+        """Discarded weight (sum of dropped squared singular values) per sample."""
+        return packed[:, -1].real
+
+    def fidelity(self, M_x: np.ndarray, M_y: np.ndarray) -> np.ndarray:
+        """|<psi(x)|psi(y)>|^2 by contracting every MPS pair site by site."""
+        env = np.ones((M_x.shape[0], M_y.shape[0], 1, 1), dtype=M_x.dtype)
+        for A, B in zip(self.sites(M_x), self.sites(M_y)):
+            env = np.einsum('nmab,nasc->nmbsc', env, A.conj())
+            env = np.einsum('nmbsc,mbsd->nmcd', env, B)
+        return np.abs(env[:, :, 0, 0])**2
+
+    def reduced_density_features(self, packed: np.ndarray) -> np.ndarray:
+        """
+        Single-qubit RDM features (see `kernels.rdm_features`) from left and right
+        environments, O(N n chi^3) without forming the 2^n vector.
+        """
+        sites = self.sites(packed)
+        N = packed.shape[0]
+        right = [np.ones((N, 1, 1), dtype=packed.dtype)]
+        for A in reversed(sites[1:]):
+            right.append(np.einsum('nasc,nbsd,ncd->nab', A, A.conj(), right[-1]))
+        right.reverse()
+
+        rho = np.empty((N, self.num_qubits, 2, 2), dtype=packed.dtype)
+        left = np.ones((N, 1, 1), dtype=packed.dtype)
+        for k, A in enumerate(sites):
+            rho[:, k] = np.einsum('nab,nasc,nbtd,ncd->nst', left, A, A.conj(), right[k])
+            left = np.einsum('nab,nasc,nbsd->ncd', left, A, A.conj())
+        rho /= np.trace(rho, axis1=2, axis2=3)[:, :, None, None]
+        return rdm_features(rho)
+
+    def entry_bytes(self, itemsize: int) -> int:
+        # Largest environment intermediate: (chi, 2, chi) per kernel entry
+        chi = max(self.bond_dims)
+        return itemsize * (2 * chi * chi + chi * chi) + 8
+
+    def expand(self, packed: np.ndarray) -> np.ndarray:
+        """Contracts the MPS into full (N, 2^n) statevectors (small n only)."""
+        N, n = packed.shape[0], self.num_qubits
+        psi = np.ones((N, 1, 1), dtype=packed.dtype)
+        for site in self.sites(packed):
+            # psi: (N, 2^k, chi); qubit k is appended as the least significant digit
+            psi = np.einsum('npa,nasb->npsb', psi, site).reshape(N, -1, site.shape[3])
+        # Reverse the axes so qubit n-1 is the most significant (Qiskit ordering)
+        psi = psi.reshape((N,) + (2,) * n)
+        return psi.transpose([0] + list(range(n, 0, -1))).reshape(N, 2**n)
+
+    def __repr__(self):
+        return f"mps(n={self.num_qubits}, chi={self.max_bond_dim})"
+
+
+class MPSCircuit:
+    """
+    A compiled circuit simulated as a batch of bounded-bond-dimension MPS.
+
+    Raises ValueError for gates acting on more than two qubits (decompose the
+    circuit first).
+    """
+
+    def __init__(self, compiled: CompiledCircuit, max_bond_dim: int = 16):
+        for gate in compiled.gates:
+            if len(gate.qubits) > 2:
+                raise ValueError(
+                    f"MPS simulation supports 1- and 2-qubit gates only; found '{gate.name}' "
+                    f"on {len(gate.qubits)} qubits. Use circuit.decompose() first."
+                )
+        self.compiled = compiled
+        self.num_qubits = compiled.num_qubits
+        self.max_bond_dim = max_bond_dim
+        self.layout = MPSLayout(compiled.num_qubits, max_bond_dim)
+
+    def run(self, X: np.ndarray, dtype=np.complex128) -> np.ndarray:
+        """
+        Simulates the circuit for every row of X.
+
+        Returns:
+            np.ndarray: Packed MPS rows (N, layout.width) of the given complex dtype.
+        """
+        N = X.shape[0]
+        mps = _BatchMPS(N, self.num_qubits, self.max_bond_dim, dtype)
+
+        for gate in self.compiled.gates:
+            matrices = gate.matrices(X).astype(dtype, copy=False)
+            U = np.broadcast_to(matrices, (N,) + matrices.shape[1:])
+            if len(gate.qubits) == 1:
+                q = gate.qubits[0]
+                mps.sites[q] = np.einsum('nij,najb->naib', U, mps.sites[q])
+            else:
+                mps.apply_two_qubit(U, gate.qubits)
+
+        # Global phases are carried by the first site
+        for phase in self.compiled.phases:
+            mps.sites[0] = mps.sites[0] * np.exp(1j * phase.evaluate(X)).astype(dtype)[:, None, None, None]
+
+        return self.layout.pack(mps.sites, mps.errors)
+
+
+class _BatchMPS:
+    """
+    Mutable batch of MPS in mixed-canonical form during a simulation.
+
+    Every site left of `center` is a left isometry and every site right of it a
+    right isometry. A two-qubit gate first moves the center onto its left site,
+    so the SVD of the contracted pair is the true Schmidt decomposition: the
+    truncation is optimal and the dropped weight is the exact state error.
+    """
+
+    def __init__(self, N: int, num_qubits: int, max_bond_dim: int, dtype=np.complex128):
+        self.max_bond_dim = max_bond_dim
+        self.sites = []
+        for _ in range(num_qubits):
+            site = np.zeros((N, 1, 2, 1), dtype=dtype)
+            site[:, 0, 0, 0] = 1.0
+            self.sites.append(site)
+        self.center = 0
+        self.errors = np.zeros(N)
+
+    def apply_two_qubit(self, U: np.ndarray, qubits):
+        q_lo, q_hi = qubits  # Gate matrix index = b(q_lo) + 2 * b(q_hi)
+        left, right = min(q_lo, q_hi), max(q_lo, q_hi)
+
+        # Route the far qubit next to `left` with SWAPs, apply, then route back
+        swap = np.broadcast_to(_SWAP.astype(U.dtype), U.shape)
+        for k in range(right - 1, left, -1):
+            self.apply_adjacent(swap, k, lo_first=True)
+        self.apply_adjacent(U, left, lo_first=(q_lo == left))
+        for k in range(left + 1, right):
+            self.apply_adjacent(swap, k, lo_first=True)
+
+    def move_center(self, target: int):
+        """Shifts the orthogonality center to site `target` with batched QR sweeps."""
+        sites = self.sites
+        while self.center < target:
+            k = self.center
+            N, chi_l, _, chi_r = sites[k].shape
+            q, r = np.linalg.qr(sites[k].reshape(N, chi_l * 2, chi_r))
+            sites[k] = q.reshape(N, chi_l, 2, q.shape[2])
+            sites[k + 1] = np.einsum('nab,nbsc->nasc', r, sites[k + 1])
+            self.center += 1
+        while self.center > target:
+            k = self.center
+            N, chi_l, _, chi_r = sites[k].shape
+            # LQ decomposition via the QR of the conjugate transpose
+            q, r = np.linalg.qr(sites[k].reshape(N, chi_l, 2 * chi_r).conj().transpose(0, 2, 1))
+            sites[k] = q.conj().transpose(0, 2, 1).reshape(N, q.shape[2], 2, chi_r)
+            sites[k - 1] = np.einsum('nasb,ncb->nasc', sites[k - 1], r.conj())
+            self.center -= 1
+
+    def apply_adjacent(self, U: np.ndarray, k: int, lo_first: bool):
+        """Applies U to sites (k, k+1); lo_first means U's first qubit is on site k."""
+        self.move_center(k)
+        N = U.shape[0]
+        A, B = self.sites[k], self.sites[k + 1]
+        chi_l, chi_r = A.shape[1], B.shape[3]
+
+        theta = np.einsum('najb,nbkc->najkc', A, B)
+        U5 = U.reshape(N, 2, 2, 2, 2)  # (out_hi, out_lo, in_hi, in_lo)
+        if lo_first:
+            theta = np.einsum('npors,nasrc->naopc', U5, theta)
+        else:
+            theta = np.einsum('npors,narsc->napoc', U5, theta)
+
+        u, s, vh = np.linalg.svd(theta.reshape(N, chi_l * 2, 2 * chi_r), full_matrices=False)
+        chi = min(self.max_bond_dim, s.shape[1])
+        kept = s[:, :chi]
+        self.errors += np.sum(s[:, chi:]**2, axis=1)
+
+        # Renormalize so the truncated state stays a unit vector
+        kept = kept / np.linalg.norm(kept, axis=1, keepdims=True)
+        self.sites[k] = u[:, :, :chi].reshape(N, chi_l, 2, chi)
+        self.sites[k + 1] = (kept[:, :, None] * vh[:, :chi, :]).reshape(N, chi, 2, chi_r)
+        self.center = k + 1
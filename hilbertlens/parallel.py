@@ -0,0 +1,101 @@
+"""
+Process-Pool Parallel State Generation.
+
+Shards the rows of X across worker processes. Each worker simulates its slice
+with the adapter's serial engine and writes the states directly into a shared
+memory block, so only the row offsets travel back to the parent process.
+Because every row is simulated independently, the result is identical for any
+number of workers.
+"""
+
+import os
+import numpy as np
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Set in each worker by the pool initializer (inherited, not pickled, under 'fork').
+_WORKER_ADAPTER = None
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Maps the joblib-style n_jobs convention (-1 = all cores) to a worker count."""
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    n_cpus = os.cpu_count() or 1
+    if n_jobs < 0:
+        return max(1, n_cpus + 1 + n_jobs)
+    return n_jobs
+
+
+def _init_worker(adapter):
+    global _WORKER_ADAPTER
+    _WORKER_ADAPTER = adapter
+
+
+def _simulate_shard(X_shard, start, shm_name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        states = _WORKER_ADAPTER._compute_statevectors(X_shard)
+        out[start:start + X_shard.shape[0]] = states
+        del out
+    finally:
+        shm.close()
+    return start
+
+
+def _get_context():
+    # 'fork' lets workers inherit the adapter (PennyLane QNodes are often not picklable)
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+def parallel_statevectors(adapter, X: np.ndarray, n_jobs: int) -> np.ndarray:
+    """
+    Computes the (N, 2^n) state matrix of X using a process pool.
+
+    Args:
+        adapter (BaseAdapter): Adapter providing `_compute_statevectors` for a row slice.
+        X (np.ndarray): Validated input data (N, d).
+        n_jobs (int): Number of worker processes (-1 = all cores).
+
+    Returns:
+        np.ndarray: Statevector matrix (N, 2^n_qubits).
+    """
+    N = X.shape[0]
+    n_workers = min(resolve_n_jobs(n_jobs), N)
+
+    # The first row is simulated in the parent to learn the state size/dtype.
+    first = adapter._compute_statevectors(X[:1])
+    if n_workers <= 1 or N == 1:
+        return np.concatenate([first, adapter._compute_statevectors(X[1:])]) if N > 1 else first
+
+    shape = (N, first.shape[1])
+    dtype = first.dtype
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+
+    try:
+        M_shared = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        M_shared[0] = first[0]
+
+        # Contiguous shards keep the row order deterministic.
+        bounds = np.linspace(1, N, n_workers + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=_get_context(),
+                                 initializer=_init_worker, initargs=(adapter,)) as pool:
+            futures = [
+                pool.submit(_simulate_shard, X[a:b], a, shm.name, shape, dtype)
+                for a, b in zip(bounds[:-1], bounds[1:]) if b > a
+            ]
+            for future in futures:
+                future.result()
+
+        M = np.array(M_shared)
+        del M_shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return M
@@ -0,0 +1,391 @@
+"""
+Batched Statevector Engine for Qiskit Circuits.
+
+Translates a parameterized QuantumCircuit once into a flat gate list and then
+evolves a whole batch of input samples at the same time, holding the states as
+a single (N, 2^n) NumPy array. This avoids the per-sample `assign_parameters`
+copy and the `Statevector` object overhead of the reference simulation path.
+
+Qubit ordering follows Qiskit (little-endian): amplitude index = sum_q b_q * 2^q.
+
+Circuits whose qubits split into groups never linked by a multi-qubit gate
+produce product states. `ProductCircuit` simulates each group on its own and
+returns the block states packed side by side, so a 30-qubit angle encoding
+needs 30 x 2 amplitudes per sample instead of 2^30.
+"""
+
+import numpy as np
+from typing import List
+
+try:
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterExpression
+    from qiskit.quantum_info import Operator
+    HAS_QISKIT = True
+except ImportError:
+    HAS_QISKIT = False
+
+
+# Instructions that do not act on the statevector.
+_SKIP_GATES = {"barrier", "delay", "id"}
+
+# Gates whose matrix is diagonal (applied as a phase multiplication).
+_DIAGONAL_GATES = {"rz", "p", "u1", "rzz", "cp", "cu1", "crz", "z", "s", "sdg", "t", "tdg", "cz", "ccz"}
+
+
+class _Angle:
+    """
+    A gate parameter evaluated for a whole batch of samples.
+
+    Linear expressions (the common case, e.g. 2*x[0] + 0.5) are evaluated as
+    offset + sum_j c_j * X[:, j]. Anything else is bound numerically per row.
+    """
+
+    def __init__(self, value, data_params: list):
+        self.const = None
+        self.coeffs = None
+        self.expr = None
+
+        if not isinstance(value, ParameterExpression):
+            self.const = float(value)
+            return
+
+        params = value.parameters
+        unknown = [p for p in params if p not in data_params]
+        if unknown:
+            raise NotImplementedError(f"Unbound non-data parameters {unknown}.")
+
+        self.expr = value
+        self.index = [data_params.index(p) for p in params]
+        self.params = list(params)
+
+        try:
+            coeffs = np.zeros(len(data_params))
+            for p, j in zip(self.params, self.index):
+                coeffs[j] = float(value.gradient(p))
+            self.offset = float(value.bind({p: 0.0 for p in params}))
+            self.coeffs = coeffs
+        except TypeError:
+            # Gradient still depends on parameters -> non-linear expression.
+            self.coeffs = None
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        N = X.shape[0]
+        if self.const is not None:
+            return np.full(N, self.const)
+
+        if self.coeffs is not None:
+            # Accumulate column by column so each row is computed identically
+            # regardless of the batch size.
+            theta = np.full(N, self.offset)
+            for j in np.flatnonzero(self.coeffs):
+                theta += self.coeffs[j] * X[:, j]
+            return theta
+
+        return np.array([
+            float(self.expr.bind({p: X[i, j] for p, j in zip(self.params, self.index)}))
+            for i in range(N)
+        ])
+
+
+def _rotation_matrices(name: str, angles: List[np.ndarray]) -> np.ndarray:
+    """Builds a batch of gate matrices (N, 2^k, 2^k) for a parameterized gate."""
+    if name in ("rx", "ry", "rz", "crx", "cry", "crz"):
+        theta = angles[0]
+        c, s = np.cos(theta / 2), np.sin(theta / 2)
+        base = name[-2:]
+        U = np.empty((theta.shape[0], 2, 2), dtype=complex)
+        if base == "rx":
+            U[:, 0, 0], U[:, 0, 1], U[:, 1, 0], U[:, 1, 1] = c, -1j * s, -1j * s, c
+        elif base == "ry":
+            U[:, 0, 0], U[:, 0, 1], U[:, 1, 0], U[:, 1, 1] = c, -s, s, c
+        else:
+            U[:, 0, 0], U[:, 0, 1] = np.exp(-0.5j * theta), 0
+            U[:, 1, 0], U[:, 1, 1] = 0, np.exp(0.5j * theta)
+        return _controlled(U) if name.startswith("c") else U
+
+    if name in ("p", "u1", "cp", "cu1"):
+        theta = angles[0]
+        U = np.zeros((theta.shape[0], 2, 2), dtype=complex)
+        U[:, 0, 0] = 1
+        U[:, 1, 1] = np.exp(1j * theta)
+        return _controlled(U) if name.startswith("c") else U
+
+    if name in ("u", "u3", "u2"):
+        if name == "u2":
+            phi, lam = angles
+            theta = np.full_like(phi, np.pi / 2)
+        else:
+            theta, phi, lam = angles
+        c, s = np.cos(theta / 2), np.sin(theta / 2)
+        U = np.empty((theta.shape[0], 2, 2), dtype=complex)
+        U[:, 0, 0] = c
+        U[:, 0, 1] = -np.exp(1j * lam) * s
+        U[:, 1, 0] = np.exp(1j * phi) * s
+        U[:, 1, 1] = np.exp(1j * (phi + lam)) * c
+        return U
+
+    if name in ("rzz", "rxx", "ryy"):
+        theta = angles[0]
+        c, s = np.cos(theta / 2), np.sin(theta / 2)
+        U = np.zeros((theta.shape[0], 4, 4), dtype=complex)
+        if name == "rzz":
+            U[:, 0, 0] = U[:, 3, 3] = np.exp(-0.5j * theta)
+            U[:, 1, 1] = U[:, 2, 2] = np.exp(0.5j * theta)
+        else:
+            corner = -1j * s if name == "rxx" else 1j * s
+            for i in range(4):
+                U[:, i, i] = c
+            U[:, 0, 3] = U[:, 3, 0] = corner
+            U[:, 1, 2] = U[:, 2, 1] = -1j * s
+        return U
+
+    raise NotImplementedError(name)
+
+
+def _controlled(U: np.ndarray) -> np.ndarray:
+    """Embeds a batch of 1-qubit matrices as controlled gates (control = first qubit)."""
+    CU = np.zeros((U.shape[0], 4, 4), dtype=complex)
+    # Little-endian: index = b_control + 2 * b_target.
+    CU[:, 0, 0] = CU[:, 2, 2] = 1
+    CU[:, 1, 1], CU[:, 1, 3] = U[:, 0, 0], U[:, 0, 1]
+    CU[:, 3, 1], CU[:, 3, 3] = U[:, 1, 0], U[:, 1, 1]
+    return CU
+
+
+_PARAMETERIZED_GATES = {
+    "rx", "ry", "rz", "crx", "cry", "crz", "p", "u1", "cp", "cu1",
+    "u", "u3", "u2", "rzz", "rxx", "ryy",
+}
+
+# Eigenvalues of the generator G of each angle, U(theta) = V exp(-i theta G).
+# Every angle of u/u3/u2 is a Z or Y rotation (up to a global phase).
+_GENERATOR_EIGENVALUES = {
+    "rx": (-0.5, 0.5), "ry": (-0.5, 0.5), "rz": (-0.5, 0.5),
+    "rxx": (-0.5, -0.5, 0.5, 0.5), "ryy": (-0.5, -0.5, 0.5, 0.5), "rzz": (-0.5, -0.5, 0.5, 0.5),
+    "crx": (0.0, 0.0, -0.5, 0.5), "cry": (0.0, 0.0, -0.5, 0.5), "crz": (0.0, 0.0, -0.5, 0.5),
+    "p": (0.0, 1.0), "u1": (0.0, 1.0), "cp": (0.0, 0.0, 0.0, 1.0), "cu1": (0.0, 0.0, 0.0, 1.0),
+    "u": (-0.5, 0.5), "u3": (-0.5, 0.5), "u2": (-0.5, 0.5),
+}
+
+
+class _Gate:
+    """One entry of the compiled gate list."""
+
+    def __init__(self, name, qubits, matrix=None, angles=None):
+        self.name = name
+        self.qubits = qubits
+        self.matrix = matrix        # Constant (2^k, 2^k) matrix, or None
+        self.angles = angles        # List of _Angle for parameterized gates
+        self.diagonal = name in _DIAGONAL_GATES
+
+    def matrices(self, X: np.ndarray) -> np.ndarray:
+        if self.matrix is not None:
+            return self.matrix[None]
+        return _rotation_matrices(self.name, [a.evaluate(X) for a in self.angles])
+
+
+class CompiledCircuit:
+    """
+    A Qiskit circuit translated into a gate list for batched simulation.
+
+    Raises NotImplementedError at construction if the circuit contains
+    instructions the engine cannot simulate (measurements, resets, control flow,
+    or non-data parameters), so callers can fall back to the reference path.
+    """
+
+    def __init__(self, circuit: 'QuantumCircuit', data_params: list):
+        if not HAS_QISKIT:
+            raise ImportError("Qiskit is not installed. Please install it via 'pip install qiskit'.")
+
+        self.num_qubits = circuit.num_qubits
+        self.data_params = list(data_params)
+        self.gates: List[_Gate] = []
+        self.phases: List[_Angle] = []
+
+        qubit_map = [circuit.find_bit(q).index for q in circuit.qubits]
+        self._compile(circuit, qubit_map)
+
+    def _compile(self, circuit, qubit_map):
+        if isinstance(circuit.global_phase, ParameterExpression) or circuit.global_phase != 0:
+            self.phases.append(_Angle(circuit.global_phase, self.data_params))
+
+        for instruction in circuit.data:
+            op = instruction.operation
+            name = op.name
+            qubits = [qubit_map[circuit.find_bit(q).index] for q in instruction.qubits]
+
+            if name in _SKIP_GATES:
+                continue
+            if instruction.clbits or name in ("measure", "reset"):
+                raise NotImplementedError(f"Non-unitary instruction '{name}'.")
+
+            symbolic = any(isinstance(p, ParameterExpression) for p in op.params)
+
+            if name in _PARAMETERIZED_GATES:
+                angles = [_Angle(p, self.data_params) for p in op.params]
+                self.gates.append(_Gate(name, qubits, angles=angles))
+            elif not symbolic:
+                try:
+                    matrix = np.asarray(Operator(op).data, dtype=complex)
+                except Exception as e:
+                    raise NotImplementedError(f"Cannot build matrix for '{name}'.") from e
+                self.gates.append(_Gate(name, qubits, matrix=matrix))
+            elif getattr(op, "definition", None) is not None:
+                # Composite gate with symbolic parameters: inline its definition.
+                self._compile(op.definition, qubits)
+            else:
+                raise NotImplementedError(f"Unsupported gate '{name}'.")
+
+    @classmethod
+    def _from_gates(cls, num_qubits: int, data_params: list, gates: List[_Gate], phases: List[_Angle]):
+        compiled = cls.__new__(cls)
+        compiled.num_qubits = num_qubits
+        compiled.data_params = data_params
+        compiled.gates = gates
+        compiled.phases = phases
+        return compiled
+
+    def separable_blocks(self) -> List[List[int]]:
+        """Groups of qubits connected (directly or transitively) by multi-qubit gates."""
+        parent = list(range(self.num_qubits))
+
+        def find(q):
+            while parent[q] != q:
+                parent[q] = parent[parent[q]]
+                q = parent[q]
+            return q
+
+        for gate in self.gates:
+            root = find(gate.qubits[0])
+            for q in gate.qubits[1:]:
+                parent[find(q)] = root
+
+        blocks = {}
+        for q in range(self.num_qubits):
+            blocks.setdefault(find(q), []).append(q)
+        return sorted(blocks.values())
+
+    def encoding_rotations(self, X: np.ndarray) -> List[tuple]:
+        """
+        Data-dependent rotation angles of the circuit, evaluated without simulation.
+
+        Args:
+            X (np.ndarray): Input points (N, d).
+
+        Returns:
+            list: (generator eigenvalues, angles (N,)) for every gate angle that
+            depends on the data. Global phases are omitted (they cancel in kernels).
+        """
+        rotations = []
+        for gate in self.gates:
+            for angle in gate.angles or []:
+                if angle.const is None:
+                    rotations.append((_GENERATOR_EIGENVALUES[gate.name], angle.evaluate(X)))
+        return rotations
+
+    def run(self, X: np.ndarray, dtype=np.complex128) -> np.ndarray:
+        """
+        Simulates the circuit for every row of X.
+
+        Args:
+            X (np.ndarray): Input data (N, d), columns ordered like data_params.
+            dtype: Complex dtype of the evolution (np.complex64 halves memory).
+
+        Returns:
+            np.ndarray: Statevector matrix (N, 2^n_qubits) of the given dtype.
+        """
+        N, n = X.shape[0], self.num_qubits
+        psi = np.zeros((N, 2**n), dtype=dtype)
+        psi[:, 0] = 1.0
+        psi = psi.reshape((N,) + (2,) * n)
+
+        for gate in self.gates:
+            U = gate.matrices(X).astype(dtype, copy=False)
+            psi = _apply_gate(psi, U, gate.qubits, n, gate.diagonal)
+
+        psi = psi.reshape(N, 2**n)
+        for phase in self.phases:
+            psi *= np.exp(1j * phase.evaluate(X)).astype(dtype)[:, None]
+        return psi
+
+
+class ProductCircuit:
+    """
+    A compiled circuit split into independently simulated qubit blocks.
+
+    `run` returns the packed representation (N, sum_b 2^|b|): the block states
+    side by side, in the order of `blocks`. The full state is their tensor
+    product, and the fidelity kernel is the product of the block fidelities.
+    """
+
+    def __init__(self, compiled: CompiledCircuit, blocks: List[List[int]]):
+        self.num_qubits = compiled.num_qubits
+        self.blocks = blocks
+        self.widths = [2**len(b) for b in blocks]
+
+        self.parts: List[CompiledCircuit] = []
+        for i, qubits in enumerate(blocks):
+            local = {q: j for j, q in enumerate(qubits)}
+            gates = [
+                _Gate(g.name, [local[q] for q in g.qubits], matrix=g.matrix, angles=g.angles)
+                for g in compiled.gates if g.qubits[0] in local
+            ]
+            # Global phases are carried by the first block
+            phases = compiled.phases if i == 0 else []
+            self.parts.append(CompiledCircuit._from_gates(len(qubits), compiled.data_params, gates, phases))
+
+    def run(self, X: np.ndarray, dtype=np.complex128) -> np.ndarray:
+        return np.concatenate([part.run(X, dtype) for part in self.parts], axis=1)
+
+    def expand(self, packed: np.ndarray) -> np.ndarray:
+        """Rebuilds full (N, 2^n) statevectors from packed block states."""
+        N, n = packed.shape[0], self.num_qubits
+        psi = np.ones((N, 1), dtype=packed.dtype)
+        axis_qubits: List[int] = []
+        start = 0
+        for qubits, width in zip(self.blocks, self.widths):
+            block = packed[:, start:start + width]
+            psi = (psi[:, :, None] * block[:, None, :]).reshape(N, -1)
+            # Within a block the most significant bit is its highest local qubit
+            axis_qubits += list(reversed(qubits))
+            start += width
+
+        psi = psi.reshape((N,) + (2,) * n)
+        order = [0] + [1 + axis_qubits.index(q) for q in range(n - 1, -1, -1)]
+        return psi.transpose(order).reshape(N, 2**n)
+
+
+def _apply_gate(psi: np.ndarray, U: np.ndarray, qubits: List[int], n: int, diagonal: bool) -> np.ndarray:
+    """
+    Applies a batch of k-qubit matrices U (N or 1, 2^k, 2^k) to psi (N, 2, ..., 2).
+
+    Only element-wise products are used so that every row is computed the same
+    way independently of how many rows are in the batch.
+    """
+    k = len(qubits)
+    dim = 2**k
+    N = psi.shape[0]
+
+    # Axis 1 holds the most significant qubit (n-1). Order the target axes so
+    # that the flattened sub-index matches Qiskit's little-endian gate matrix.
+    axes = [1 + (n - 1 - q) for q in reversed(qubits)]
+    front = list(range(1, k + 1))
+    moved = np.moveaxis(psi, axes, front)
+    shape = moved.shape
+    flat = moved.reshape(N, dim, -1)
+
+    if diagonal:
+        diag = np.diagonal(U, axis1=1, axis2=2)
+        out = flat * diag[:, :, None]
+    else:
+        out = np.zeros_like(flat)
+        for i in range(dim):
+            for j in range(dim):
+                u_ij = U[:, i, j]
+                if not np.any(u_ij):
+                    continue
+                out[:, i] += u_ij[:, None] * flat[:, j]
+
+    return np.moveaxis(out.reshape(shape), front, axes)
+
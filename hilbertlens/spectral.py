@@ -6,8 +6,9 @@ def compute_spectrum(kernel_fn, n_samples=1000, range_max=4*np.pi):
 
     Args:
         kernel_fn (callable): A function that takes a numpy array of shape (N, 1)
-                              and returns the kernel matrix (N, N) or vector (N,).
-                              We assume K(x, 0) captures the structure.
+                              and returns the kernel row K(x, 0) as a vector (N,),
+                              or a kernel matrix whose first column is K(x, 0).
+                              Returning the row avoids building an N x N matrix.
         n_samples (int): Number of points to sample for the FFT. 
                          Higher = better resolution, less aliasing.
         range_max (float): The interval to sample [0, range_max].
@@ -19,12 +20,30 @@ def compute_spectrum(kernel_fn, n_samples=1000, range_max=4*np.pi):
     """
     
     # 1. Sweep
-    X_sweep = np.linspace(0, range_max, n_samples).reshape(-1, 1)
+    X_sweep = sweep_points(n_samples, range_max).reshape(-1, 1)
     
     # 2. Get Signal (K(x, 0))
-    K_matrix = kernel_fn(X_sweep)
-    signal = K_matrix[:, 0]
-    
+    K_out = np.asarray(kernel_fn(X_sweep))
+    signal = K_out if K_out.ndim == 1 else K_out[:, 0]
+
+    return signal_spectrum(signal, range_max)
+
+
+def sweep_points(n_samples=1000, range_max=4*np.pi):
+    """The sample positions t of a spectrum sweep over [0, range_max]."""
+    return np.linspace(0, range_max, n_samples)
+
+
+def signal_spectrum(signal, range_max=4*np.pi):
+    """
+    Normalized power spectrum of a kernel signal sampled at `sweep_points`.
+
+    Returns:
+        freqs (np.array): Frequencies k (in e^{ikx}).
+        power (np.array): The normalized power of each frequency.
+    """
+    n_samples = len(signal)
+
     # 3. FFT
     # Normalize signal by subtracting mean (removes the DC component/Frequency 0 spike)
     # This helps us see the 'structure' frequencies better.
@@ -49,4 +68,239 @@ def compute_spectrum(kernel_fn, n_samples=1000, range_max=4*np.pi):
     else:
         power_normalized = power_spectrum
     
-    return freqs_k, power_normalized
\ No newline at end of file
+    return freqs_k, power_normalized
+
+def adaptive_spectrum(kernel_fn, range_max=4*np.pi, n_start=64, max_samples=8192, tol=1e-3,
+                      nyquist_band=0.25):
+    """
+    Spectrum with a sample count adapted to the kernel's bandwidth.
+
+    Starts from a coarse periodic grid over [0, range_max) and doubles it (only
+    the new midpoints are evaluated) until the spectrum is stable: the power
+    changed by at most `tol` (L1) since the previous grid, and at most `tol` of
+    it lies in the top `nyquist_band` of frequencies below the Nyquist limit.
+
+    Args:
+        kernel_fn (callable): Maps sweep values (N, 1) to K(t, 0), shape (N,),
+                              or (N, S) for S sweeps evaluated together.
+        range_max (float): Sweep length; frequencies are resolved in steps of 2*pi/range_max.
+        n_start (int): Initial number of samples.
+        max_samples (int): Upper bound on samples per sweep.
+        tol (float): Stability and Nyquist-energy tolerance.
+
+    Returns:
+        freqs (np.array): Frequencies k (in e^{ikx}).
+        power (np.array): Normalized power, (F,) or (S, F) for stacked sweeps.
+        evaluations (int): Number of kernel values computed.
+    """
+    n = n_start
+    values = np.asarray(kernel_fn((np.arange(n) * range_max / n).reshape(-1, 1)), dtype=float)
+    evaluations = values.size
+    previous = None
+
+    while True:
+        columns = values.reshape(n, -1).T
+        spectra = [signal_spectrum(column, range_max) for column in columns]
+        freqs = spectra[0][0]
+        power = np.array([p for _, p in spectra])
+
+        near_nyquist = power[:, freqs >= (1 - nyquist_band) * freqs[-1]].sum(axis=1)
+        if previous is not None:
+            change = np.abs(power[:, :previous.shape[1]] - previous).sum(axis=1)
+            change += power[:, previous.shape[1]:].sum(axis=1)
+            if np.max(change) <= tol and np.max(near_nyquist) <= tol:
+                break
+        if 2 * n > max_samples:
+            break
+
+        # Refine: evaluate only the midpoints of the current grid
+        midpoints = ((np.arange(n) + 0.5) * range_max / n).reshape(-1, 1)
+        new_values = np.asarray(kernel_fn(midpoints), dtype=float)
+        evaluations += new_values.size
+        refined = np.empty((2 * n,) + values.shape[1:])
+        refined[0::2], refined[1::2] = values, new_values
+        values, previous, n = refined, power, 2 * n
+
+    return freqs, (power[0] if values.ndim == 1 else power), evaluations
+
+def grid_spectrum(kernel_fn, grid_shape, range_max=4*np.pi, chunk_size=4096):
+    """
+    Joint Fourier spectrum of a kernel over a grid of several features.
+
+    The grid points are generated and evaluated chunk by chunk, so only
+    `chunk_size` points (and their states) are in memory at once. Only the
+    (prod(grid_shape),) kernel values are kept for the N-dimensional rFFT.
+
+    Args:
+        kernel_fn (callable): Maps grid points (M, d) to K(x, 0) of shape (M,).
+        grid_shape (tuple): Samples per swept feature, e.g. (64, 64, 64).
+        range_max (float): Each feature is sampled periodically over [0, range_max).
+        chunk_size (int): Grid points per kernel_fn call.
+
+    Returns:
+        freqs (list): Frequency axes k per feature (signed; the last axis is k >= 0).
+        power (np.ndarray): Normalized power on the half-space rFFT grid.
+    """
+    grid_shape = tuple(int(n) for n in grid_shape)
+    step = range_max / np.array(grid_shape)
+    total = int(np.prod(grid_shape))
+
+    signal = np.empty(total)
+    for start in range(0, total, chunk_size):
+        index = np.arange(start, min(start + chunk_size, total))
+        points = np.stack(np.unravel_index(index, grid_shape), axis=1) * step
+        signal[start:start + len(index)] = kernel_fn(points)
+    signal = signal.reshape(grid_shape)
+
+    # Remove the DC component, as in the 1D spectrum
+    power = np.abs(np.fft.rfftn(signal - np.mean(signal)))**2
+
+    # rFFT keeps half of the conjugate pairs: count the omitted mirror bins
+    # (last-axis frequencies strictly between 0 and Nyquist) so every pair
+    # carries its full energy
+    n_last = grid_shape[-1]
+    mirrored = slice(1, (n_last + 1) // 2)
+    power[..., mirrored] *= 2
+
+    if np.sum(power) > 1e-10:
+        power = power / np.sum(power)
+
+    freqs = [np.fft.fftfreq(n, d=d) * 2 * np.pi for n, d in zip(grid_shape[:-1], step[:-1])]
+    freqs.append(np.fft.rfftfreq(n_last, d=step[-1]) * 2 * np.pi)
+    return freqs, power
+
+
+def grid_support(freqs, power, threshold=1e-3):
+    """
+    Joint frequencies carrying more than `threshold` of the power.
+
+    Returns:
+        support (np.ndarray): Frequency vectors (M, d), strongest first.
+        support_power (np.ndarray): Their power (M,).
+    """
+    index = np.argwhere(power > threshold)
+    values = power[tuple(index.T)]
+    order = np.argsort(values)[::-1]
+    support = np.stack([axis[index[order, i]] for i, axis in enumerate(freqs)], axis=1)
+    return support, values[order]
+
+def pencil_spectrum(signal, dt=0.1, rank_tol=1e-8, decimals=6):
+    """
+    Parametric (matrix pencil) spectrum of a kernel signal sampled at t_j = j * dt.
+
+    A kernel signal is a finite sum of exponentials a_m e^{i w_m t}. The matrix
+    pencil method recovers the exact frequencies w_m (integer or not) and the
+    amplitudes a_m from a few dozen samples, without FFT bins or leakage:
+    N samples resolve up to ~N/2 exponentials, i.e. ~N/4 distinct frequencies,
+    as long as every |w_m| < pi / dt.
+
+    Args:
+        signal (np.array): Samples K(t_j, 0), j = 0..N-1.
+        dt (float): Sample spacing.
+        rank_tol (float): Singular values below rank_tol * s_max are treated as noise.
+        decimals (int): Frequencies equal after rounding are merged.
+
+    Returns:
+        freqs (np.array): The detected frequencies k >= 0, ascending.
+        power (np.array): Normalized power |a_k|^2 + |a_-k|^2 (DC excluded, as in
+                          `signal_spectrum`).
+    """
+    signal = np.asarray(signal, dtype=complex)
+    N = len(signal)
+    L = N // 2
+
+    # Hankel matrix Y[i, j] = y[i + j]; its right singular vectors span the signal space
+    Y = np.lib.stride_tricks.sliding_window_view(signal, L + 1)
+    _, s, vh = np.linalg.svd(Y, full_matrices=False)
+    order = int(np.sum(s > rank_tol * s[0])) if s[0] > 0 else 0
+    if order == 0:
+        return np.array([0.0]), np.array([0.0])
+
+    V = vh[:order].conj().T
+    poles = np.linalg.eigvals(np.linalg.pinv(V[:-1]) @ V[1:])
+
+    # Amplitudes by least squares on the Vandermonde system y_j = sum_m a_m z_m^j
+    vandermonde = poles[None, :] ** np.arange(N)[:, None]
+    amplitudes = np.linalg.lstsq(vandermonde, signal, rcond=None)[0]
+
+    spectrum = {}
+    for pole, amplitude in zip(poles, amplitudes):
+        k = round(abs(np.angle(pole)) / dt, decimals) + 0.0
+        spectrum[k] = spectrum.get(k, 0.0) + abs(amplitude)**2
+
+    freqs = np.array(sorted(spectrum))
+    power = np.array([spectrum[k] if k > 0 else 0.0 for k in freqs])
+    if np.sum(power) > 1e-10:
+        power = power / np.sum(power)
+    return freqs, power
+
+# Sweep values t at which encoding angles are probed by the analytic mode.
+SWEEP_PROBES = np.array([0.0, 1.0, -0.7311, 2.419])
+
+
+def sweep_generators(rotations, probes=SWEEP_PROBES, atol=1e-9):
+    """
+    Turns data-dependent rotations into (coefficient, eigenvalues) generators.
+
+    Args:
+        rotations (list): (generator eigenvalues, angles) pairs, where the angles
+                          were evaluated at the input points t * direction for t in `probes`.
+        probes (np.array): The sweep values t.
+
+    Returns:
+        list: (c, eigenvalues) for every rotation whose angle is c * t + const with c != 0.
+
+    Raises:
+        ValueError: If an angle is not affine in t (the spectrum is then not a
+                    finite set of frequencies).
+    """
+    generators = []
+    for eigenvalues, angles in rotations:
+        angles = np.asarray(angles, dtype=float)
+        slope = (angles[1] - angles[0]) / (probes[1] - probes[0])
+        if not np.allclose(angles, angles[0] + slope * (probes - probes[0]), atol=atol, rtol=1e-9):
+            raise ValueError("An encoding angle is not linear in the swept input, so the spectrum "
+                             "has no finite frequency set. Use method='fft' instead.")
+        if abs(slope) > atol:
+            generators.append((slope, np.asarray(eigenvalues, dtype=float)))
+    return generators
+
+
+def analytic_spectrum(generators, decimals=9):
+    """
+    Exact frequency spectrum of a quantum kernel from its encoding generators.
+
+    With encoding gates exp(-i c_g t G_g), the state carries the "eigenvalue sums"
+    Lambda = sum_g c_g * lambda_g, and the kernel K(t) = Tr[rho(t) rho_0] can only
+    contain the frequencies Lambda_j - Lambda_k. The degeneracy of a frequency is
+    the number of (j, k) pairs producing it, counted over all eigenvalue choices.
+
+    Args:
+        generators (list): (c_g, eigenvalues of G_g) pairs (see `sweep_generators`).
+        decimals (int): Frequencies equal after rounding to this many decimals are merged.
+
+    Returns:
+        freqs (np.array): The non-negative frequencies k (in e^{ikt}), ascending.
+        degeneracy (np.array): Number of eigenvalue-sum pairs giving each frequency.
+    """
+    # Distribution of eigenvalue sums, built one gate at a time
+    sums = {0.0: 1}
+    for c, eigenvalues in generators:
+        new_sums = {}
+        for value, count in sums.items():
+            for lam in eigenvalues:
+                key = round(value + c * lam, decimals) + 0.0
+                new_sums[key] = new_sums.get(key, 0) + count
+        sums = new_sums
+
+    # Pairwise differences; the spectrum is symmetric, so only k >= 0 is kept
+    differences = {}
+    for a, count_a in sums.items():
+        for b, count_b in sums.items():
+            key = round(a - b, decimals) + 0.0
+            if key >= 0:
+                differences[key] = differences.get(key, 0) + count_a * count_b
+
+    freqs = np.array(sorted(differences))
+    degeneracy = np.array([float(differences[k]) for k in freqs])
+    return freqs, degeneracy
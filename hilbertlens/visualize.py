@@ -4,7 +4,8 @@ import os
 from mpl_toolkits.mplot3d import Axes3D # Required for 3D plotting
 
 
-def plot_spectrum(freqs, power, top_k=5, title="Quantum Kernel Spectrum", save_path=None):
+def plot_spectrum(freqs, power, top_k=5, title="Quantum Kernel Spectrum", save_path=None,
+                  value_label="Spectral Power"):
     """
     Visualizes the frequency spectrum.
     
@@ -12,6 +13,7 @@ def plot_spectrum(freqs, power, top_k=5, title="Quantum Kernel Spectrum", save_p
         freqs (array): The frequency integers/floats (k).
         power (array): The normalized power.
         top_k (int): How many top frequencies to label explicitly.
+        value_label (str): What `power` holds (e.g. "Relative Degeneracy").
         save_path (str, optional): Full path (including filename) to save the plot. 
                                    If None, the plot is displayed interactively.
     """
@@ -24,7 +26,7 @@ def plot_spectrum(freqs, power, top_k=5, title="Quantum Kernel Spectrum", save_p
     plt.stem(freqs[mask], power[mask], basefmt=" ", linefmt='b-', markerfmt='bo')
     
     plt.xlabel(r"Frequency $k$ (in $e^{ikx}$)")
-    plt.ylabel("Spectral Power")
+    plt.ylabel(value_label)
     plt.title(title)
     plt.grid(True, alpha=0.3)
     
@@ -43,7 +45,7 @@ def plot_spectrum(freqs, power, top_k=5, title="Quantum Kernel Spectrum", save_p
         # Only label if significant (power > 1%)
         if f <= 10.0 and p > 0.01: 
             plt.text(f, p, f" k={f:.1f}\n", ha='center', va='bottom', fontweight='bold', fontsize=9)
-            print(f"Freq k={f:.1f} | Power: {p:.3f}")
+            print(f"Freq k={f:.1f} | {value_label}: {p:.3f}")
     plt.ylim(0, 1.15)        
     plt.tight_layout()
     
@@ -102,3 +104,72 @@ def plot_manifold_3d(X_projected, color_values, title="Quantum State Projection"
 
 
 
+
+def plot_spectrum_table(freqs, power, labels, title="Spectrum per Feature", save_path=None,
+                        value_label="Spectral Power"):
+    """
+    Visualizes several spectra at once as a heatmap (one row per sweep).
+
+    Args:
+        freqs (array): Common frequency axis (k).
+        power (array): Normalized power, shape (n_sweeps, len(freqs)).
+        labels (list): Row labels (e.g. "x0", ..., "global").
+        value_label (str): What `power` holds (e.g. "Relative Degeneracy").
+        save_path (str, optional): Full path to save the plot. If None, the plot is shown.
+    """
+    mask = freqs <= 10.0
+    fig = plt.figure(figsize=(10, 1.5 + 0.4 * len(labels)))
+
+    # Bin edges halfway between frequencies so each cell is centred on its k
+    shown = freqs[mask]
+    edges = np.concatenate([[shown[0] - 0.5 * (shown[1] - shown[0]) if len(shown) > 1 else shown[0] - 0.5],
+                            (shown[1:] + shown[:-1]) / 2,
+                            [shown[-1] + 0.5 * (shown[-1] - shown[-2]) if len(shown) > 1 else shown[-1] + 0.5]])
+    mesh = plt.pcolormesh(edges, np.arange(len(labels) + 1), power[:, mask], cmap='viridis', vmin=0, vmax=1)
+    fig.colorbar(mesh, label=value_label)
+
+    plt.yticks(np.arange(len(labels)) + 0.5, labels)
+    plt.xlabel(r"Frequency $k$ (in $e^{ikx}$)")
+    plt.title(title)
+    plt.tight_layout()
+
+    if save_path:
+        directory = os.path.dirname(save_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        plt.savefig(save_path, dpi=300)
+        print(f"Plot saved to: {save_path}")
+        plt.close(fig)
+    else:
+        plt.show()
+
+def plot_spectrum_2d(freqs_x, freqs_y, power, labels=("x0", "x1"), title="Joint Spectrum", save_path=None):
+    """
+    Visualizes a joint 2D spectrum as a heatmap over (k_x, k_y).
+
+    Args:
+        freqs_x (array): Signed frequencies of the first feature (FFT order).
+        freqs_y (array): Non-negative frequencies of the second feature (rFFT axis).
+        power (array): Normalized power, shape (len(freqs_x), len(freqs_y)).
+        labels (tuple): Axis names of the two features.
+        save_path (str, optional): Full path to save the plot. If None, the plot is shown.
+    """
+    order = np.argsort(freqs_x)
+    fig = plt.figure(figsize=(8, 6))
+    mesh = plt.pcolormesh(freqs_y, freqs_x[order], power[order], cmap='viridis', shading='nearest')
+    fig.colorbar(mesh, label="Spectral Power")
+
+    plt.xlabel(f"Frequency $k$ ({labels[1]})")
+    plt.ylabel(f"Frequency $k$ ({labels[0]})")
+    plt.title(title)
+    plt.tight_layout()
+
+    if save_path:
+        directory = os.path.dirname(save_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        plt.savefig(save_path, dpi=300)
+        print(f"Plot saved to: {save_path}")
+        plt.close(fig)
+    else:
+        plt.show()
@@ -0,0 +1,55 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.spectral import adaptive_spectrum
+
+
+def test_low_bandwidth_stops_early():
+    freqs, power, evaluations = adaptive_spectrum(lambda t: np.cos(t[:, 0])**2)
+    # cos^2(t) has a single frequency k=2; the first refinement already confirms it
+    assert evaluations == 128
+    assert np.isclose(freqs[np.argmax(power)], 2.0)
+    assert np.isclose(power.max(), 1.0)
+
+
+def test_high_bandwidth_is_refined_past_aliasing():
+    # k = 45 aliases to k = 19 on the initial 64-point grid (Nyquist k = 16)
+    kernel_fn = lambda t: 0.5 + 0.3 * np.cos(t[:, 0]) + 0.2 * np.cos(45 * t[:, 0])
+    freqs, power, evaluations = adaptive_spectrum(kernel_fn)
+    assert evaluations > 128
+    assert set(freqs[power > 0.01]) == {1.0, 45.0}
+
+
+def test_stacked_sweeps_and_lens_integration():
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    qc.rx(x[0], 0)
+    qc.rx(3 * x[1], 1)
+    lens = QuantumLens(qc, params=list(x))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = lens.spectrum(mode='all', n_samples='auto', save_path=os.path.join(tmp, "all.png"))
+    x0, x1, glob = stats["table"]
+    assert (x0["dominant_freq"], x1["dominant_freq"]) == (1, 3)
+    # cos^2(t/2) cos^2(3t/2) mixes the frequencies 1..4
+    assert set(glob["freqs"][glob["power"] > 0.01]) == {1.0, 2.0, 3.0, 4.0}
+    # 3 sweeps of at most a few hundred points instead of 3 x 1000
+    assert stats["evaluations"] < 1000
+
+
+if __name__ == "__main__":
+    test_low_bandwidth_stops_early()
+    test_high_bandwidth_is_refined_past_aliasing()
+    test_stacked_sweeps_and_lens_integration()
@@ -0,0 +1,97 @@
+import sys
+import os
+import numpy as np
+import pennylane as qml
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+from qiskit.circuit.library import ZZFeatureMap
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter, PennyLaneAdapter
+from hilbertlens.spectral import analytic_spectrum, sweep_generators, compute_spectrum, SWEEP_PROBES
+
+
+def _reuploading_circuit(layers):
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    for _ in range(layers):
+        qc.rx(x[0], 0)
+        qc.ry(2 * x[1], 1)
+        qc.cx(0, 1)
+    return qc, x
+
+
+def _spectrum(adapter, direction):
+    rotations = adapter.encoding_rotations(SWEEP_PROBES[:, None] * np.asarray(direction)[None, :])
+    return analytic_spectrum(sweep_generators(rotations))
+
+
+def test_degeneracies_of_reuploading():
+    # Two RX(x) layers: eigenvalue sums {-1: 1, 0: 2, 1: 1}
+    qc, x = _reuploading_circuit(2)
+    freqs, degeneracy = _spectrum(QiskitAdapter(qc, list(x)), [1, 0])
+    assert np.allclose(freqs, [0, 1, 2])
+    assert np.allclose(degeneracy, [6, 4, 1])
+
+    # Global sweep: RX(t) twice and RY(2t) twice reach frequency 6
+    freqs, _ = _spectrum(QiskitAdapter(qc, list(x)), [1, 1])
+    assert np.allclose(freqs, np.arange(7))
+
+
+def test_analytic_frequencies_contain_fft_peaks():
+    qc, x = _reuploading_circuit(2)
+    adapter = QiskitAdapter(qc, list(x))
+    freqs, _ = _spectrum(adapter, [1, 1])
+
+    def kernel_fn(X_sweep):
+        X_full = np.repeat(X_sweep, 2, axis=1)
+        return adapter.get_kernel_row(X_full, X_full[0])
+
+    fft_freqs, power = compute_spectrum(kernel_fn, n_samples=512, range_max=2 * np.pi)
+    # (The sweep includes its endpoint, so small leakage sits on every bin)
+    peaks = fft_freqs[power > 1e-3]
+    assert len(peaks) == 6
+    assert all(np.min(np.abs(freqs - k)) < 1e-6 for k in peaks)
+
+
+def test_nonlinear_encoding_is_rejected():
+    feature_map = ZZFeatureMap(2, reps=1)
+    adapter = QiskitAdapter(feature_map, list(feature_map.parameters))
+    # (pi - x0)(pi - x1) is linear in x0 while x1 stays frozen ...
+    _spectrum(adapter, [1, 0])
+    # ... but quadratic along the global sweep
+    try:
+        _spectrum(adapter, [1, 1])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected a ValueError for a non-linear encoding.")
+
+
+def test_pennylane_tape_matches_qiskit():
+    dev = qml.device("default.qubit", wires=2)
+
+    @qml.qnode(dev)
+    def circuit(x):
+        for _ in range(2):
+            qml.AngleEmbedding([x[0], 2 * x[1]], wires=[0, 1])
+            qml.CNOT(wires=[0, 1])
+        return qml.state()
+
+    qc, x = _reuploading_circuit(2)
+    for direction in ([1, 0], [0, 1], [1, 1]):
+        freqs_pl, deg_pl = _spectrum(PennyLaneAdapter(circuit), direction)
+        freqs_qk, deg_qk = _spectrum(QiskitAdapter(qc, list(x)), direction)
+        assert np.allclose(freqs_pl, freqs_qk)
+        assert np.allclose(deg_pl, deg_qk)
+
+
+if __name__ == "__main__":
+    test_degeneracies_of_reuploading()
+    test_analytic_frequencies_contain_fft_peaks()
+    test_nonlinear_encoding_is_rejected()
+    test_pennylane_tape_matches_qiskit()
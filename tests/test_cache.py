@@ -0,0 +1,90 @@
+import sys
+import os
+import tempfile
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter
+from hilbertlens.cache import StateCache
+
+
+def _circuit(angle_scale=1.0):
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    qc.h([0, 1])
+    qc.rz(angle_scale * x[0], 0)
+    qc.rz(x[1], 1)
+    qc.cx(0, 1)
+    return qc, list(x)
+
+
+def test_repeated_rows_are_served_from_cache():
+    qc, params = _circuit()
+    adapter = QiskitAdapter(qc, params)
+    X = np.random.default_rng(0).uniform(-1, 1, size=(20, 2))
+
+    K_first = adapter.get_kernel_matrix(X)
+    assert adapter.cache.misses == 20 and adapter.cache.hits == 0
+
+    # Overlapping second call: 10 old rows + 5 new rows
+    X_overlap = np.vstack([X[:10], X[:5] + 0.5])
+    adapter.get_statevectors(X_overlap)
+    assert adapter.cache.hits == 10 and adapter.cache.misses == 25
+
+    K_second = adapter.get_kernel_matrix(X)
+    assert np.array_equal(K_first, K_second)
+
+
+def test_fingerprint_tracks_circuit_structure():
+    qc_a, params_a = _circuit(1.0)
+    qc_b, params_b = _circuit(2.0)
+    assert QiskitAdapter(qc_a, params_a).fingerprint() == QiskitAdapter(qc_a, params_a).fingerprint()
+    assert QiskitAdapter(qc_a, params_a).fingerprint() != QiskitAdapter(qc_b, params_b).fingerprint()
+
+
+def test_lru_eviction_respects_byte_limit():
+    cache = StateCache(max_bytes=3 * 16 * 4)  # Room for three 2-qubit states
+    X = np.arange(10, dtype=float).reshape(5, 2)
+    keys = cache.keys_for("fp", X)
+    cache.insert(keys, np.ones((5, 4), dtype=complex))
+
+    assert len(cache) == 3
+    assert cache.nbytes <= cache.max_bytes
+    _, missing = cache.lookup(keys)
+    assert missing == [0, 1]  # Oldest entries evicted first
+
+
+def test_disk_store_reuses_results_across_sessions():
+    qc, params = _circuit()
+    X = np.random.default_rng(1).uniform(-1, 1, size=(15, 2))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first = QiskitAdapter(qc, params, cache_dir=cache_dir)
+        K_first = np.array(first.get_kernel_matrix(X))
+        assert first.store.misses > 0
+
+        # A fresh adapter (new session) on a rebuilt, identical circuit
+        qc_again, params_again = _circuit()
+        second = QiskitAdapter(qc_again, params_again, cache_dir=cache_dir)
+        K_second = second.get_kernel_matrix(X)
+
+        assert isinstance(K_second, np.memmap)
+        assert second.store.hits == 1 and second.cache.misses == 0
+        assert np.array_equal(K_first, K_second)
+
+        kinds = sorted(entry["kind"] for entry in second.store.index().values())
+        assert kinds == ["kernel", "states"]
+        del K_second
+
+
+if __name__ == "__main__":
+    test_repeated_rows_are_served_from_cache()
+    test_fingerprint_tracks_circuit_structure()
+    test_lru_eviction_respects_byte_limit()
+    test_disk_store_reuses_results_across_sessions()
@@ -0,0 +1,113 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.geometry import project_quantum_state, fit_kernel_pca
+
+
+def _make_lens(n=3):
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for i in range(n):
+        qc.ry(x[i], i)
+    for i in range(n - 1):
+        qc.cx(i, i + 1)
+    for i in range(n):
+        qc.rz(x[i], i)
+    return QuantumLens(qc, params=list(x))
+
+
+def _geometry(lens, X, **kwargs):
+    with tempfile.TemporaryDirectory() as tmp:
+        return lens.geometry(X, save_path=os.path.join(tmp, "geometry.png"), **kwargs)
+
+
+def test_kernel_embedding_reproduces_training_projection():
+    lens = _make_lens()
+    X = np.random.default_rng(0).uniform(-1, 1, size=(40, 3))
+    embedding = _geometry(lens, X, state_space=False)["embedding"]
+
+    assert embedding.kind == 'kernel'
+    assert np.allclose(embedding.transform(X), embedding.X_projected, atol=1e-8)
+    assert np.allclose(embedding.X_projected, project_quantum_state(lens.adapter.get_kernel_matrix(X)))
+
+
+def test_new_points_match_refit_with_centering():
+    lens = _make_lens()
+    rng = np.random.default_rng(1)
+    X, X_new = rng.uniform(-1, 1, size=(30, 3)), rng.uniform(-1, 1, size=(5, 3))
+    embedding = _geometry(lens, X, state_space=False)["embedding"]
+
+    # Reference: explicit centered out-of-sample formula
+    K = lens.adapter.get_kernel_matrix(X)
+    K_new = lens.adapter.get_kernel_matrix(X_new, X)
+    _, _, components = fit_kernel_pca(K, solver='dense')
+    one = np.full_like(K, 1 / len(X))
+    one_new = np.full_like(K_new, 1 / len(X))
+    centered = K_new - one_new @ K - K_new @ one + one_new @ K @ one
+    expected = centered @ components
+    # Components agree up to sign between solvers
+    signs = np.sign(np.sum(expected * embedding.transform(X_new), axis=0))
+    assert np.allclose(embedding.transform(X_new), expected * signs, atol=1e-6)
+
+
+def test_feature_embeddings():
+    # D^2 = 64 < N: the state-space path; then the Nystrom path
+    lens = _make_lens()
+    X = np.random.default_rng(2).uniform(-1, 1, size=(100, 3))
+    for kwargs, kind in (({}, 'state_space'), ({"nystrom": 20, "n_pairs": 2000}, 'nystrom')):
+        embedding = _geometry(lens, X, **kwargs)["embedding"]
+        assert embedding.kind == kind
+        assert np.allclose(embedding.transform(X), embedding.X_projected, atol=1e-8)
+        assert embedding.transform(X[:4]).shape == (4, 3)
+
+
+def test_training_set_is_simulated_once():
+    lens = _make_lens()
+    lens.adapter.cache = None
+    calls = []
+    compute = lens.adapter._compute_statevectors
+    lens.adapter._compute_statevectors = lambda X: calls.append(X.shape[0]) or compute(X)
+
+    X = np.random.default_rng(3).uniform(-1, 1, size=(50, 3))
+    embedding = _geometry(lens, X, state_space=False)["embedding"]
+    assert sum(calls) == 50
+    # New points only simulate themselves
+    embedding.transform(X[:4])
+    assert sum(calls) == 54
+
+
+def test_low_rank_kernel_embedding():
+    # A 1-qubit kernel has centered rank 2: the third component is numerical noise
+    x = ParameterVector('x', 1)
+    qc = QuantumCircuit(1)
+    qc.ry(x[0], 0)
+    lens = QuantumLens(qc, params=list(x))
+    X = np.random.default_rng(4).uniform(-1, 1, size=(60, 1))
+    embedding = _geometry(lens, X, state_space=False)["embedding"]
+    assert np.allclose(embedding.transform(X), embedding.X_projected, atol=1e-8)
+
+    K = lens.adapter.get_kernel_matrix(X)
+    for solver in ('dense', 'randomized', 'lanczos'):
+        X_proj, _, components = fit_kernel_pca(K, solver=solver)
+        assert np.all(np.isfinite(components))
+        assert np.allclose(components[:, 2], 0) and np.allclose(X_proj[:, 2], 0)
+
+
+if __name__ == "__main__":
+    test_kernel_embedding_reproduces_training_projection()
+    test_new_points_match_refit_with_centering()
+    test_feature_embeddings()
+    test_training_set_is_simulated_once()
+    test_low_rank_kernel_embedding()
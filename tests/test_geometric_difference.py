@@ -0,0 +1,90 @@
+import sys
+import os
+import numpy as np
+from scipy.linalg import sqrtm
+from sklearn.metrics.pairwise import rbf_kernel
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.geometry import geometric_difference, kernel_sqrt, factor_sqrt
+
+
+def _naive(K_Q, K_C, lam):
+    N = K_Q.shape[0]
+    K_Q = K_Q * N / np.trace(K_Q)
+    K_C = K_C * N / np.trace(K_C)
+    root = sqrtm(K_Q).real
+    M = root @ np.linalg.inv(K_C + lam * np.eye(N)) @ root
+    return np.sqrt(np.linalg.norm(M, 2))
+
+
+def _make_lens():
+    x = ParameterVector('x', 3)
+    qc = QuantumCircuit(3)
+    for i in range(3):
+        qc.ry(x[i], i)
+    qc.cx(0, 1)
+    qc.cx(1, 2)
+    for i in range(3):
+        qc.rz(2 * x[i], i)
+    return QuantumLens(qc, params=list(x))
+
+
+def test_matches_naive_formula():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 3))
+    F = rng.normal(size=(40, 6))
+    K_Q, K_C = F @ F.T, rbf_kernel(X, gamma=0.3)
+
+    for lam in (1e-3, 1e-1):
+        expected = _naive(K_Q, K_C, lam)
+        # Dense and factored quantum square roots, dense and factored classical kernels
+        assert np.isclose(geometric_difference(kernel_sqrt(K_Q), K_C, regularization=lam), expected)
+        assert np.isclose(geometric_difference(factor_sqrt(F), K_C, regularization=lam), expected)
+        assert np.isclose(geometric_difference(kernel_sqrt(K_Q), classical_factor=X, regularization=lam),
+                          _naive(K_Q, X @ X.T, lam))
+
+
+def test_compare_classical_dense_and_low_rank():
+    lens = _make_lens()
+    X = np.random.default_rng(1).uniform(-1, 1, size=(60, 3))
+    dense = lens.compare_classical(X, kernels=['rbf', 'linear', rbf_kernel])
+    assert set(dense) == {'rbf', 'linear', 'rbf_kernel'}
+    assert lens.last_classical_comparison is dense
+
+    K_Q = lens.adapter.get_kernel_matrix(X)
+    gamma = 1.0 / (3 * X.var())
+    assert np.isclose(dense['rbf'], _naive(K_Q, rbf_kernel(X, gamma=gamma), 1e-3))
+    assert np.isclose(dense['linear'], _naive(K_Q, X @ X.T, 1e-3))
+
+    # Every point a landmark: the Nystrom path is exact up to its rank cutoff
+    low_rank = lens.compare_classical(X, kernels=['rbf', 'linear'], rank=60)
+    for name in ('rbf', 'linear'):
+        assert np.isclose(low_rank[name], dense[name], rtol=1e-3)
+
+
+def test_low_rank_with_few_landmarks_tracks_dense():
+    lens = _make_lens()
+    X = np.random.default_rng(5).uniform(-1, 1, size=(600, 3))
+    dense = lens.compare_classical(X, kernels=['rbf'])['rbf']
+
+    # rank << N: without the residual correction and extra classical landmarks
+    # the truncated RBF spectrum inflated g by 20x at rank 20
+    low_rank = lens.compare_classical(X, kernels=['rbf'], rank=40)['rbf']
+    assert abs(low_rank - dense) < 0.1 * dense
+
+    # Even with equal classical and quantum ranks g stays the same order
+    same_rank = lens.compare_classical(X, kernels=['rbf'], rank=40, classical_rank=40)['rbf']
+    assert dense <= same_rank < 3 * dense
+
+
+if __name__ == "__main__":
+    test_matches_naive_formula()
+    test_compare_classical_dense_and_low_rank()
+    test_low_rank_with_few_landmarks_tracks_dense()
@@ -0,0 +1,44 @@
+import sys
+import os
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.geometry import compute_geometry_score, estimate_geometry_score
+
+
+def _data(N=400):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1, 1, size=(N, 2))
+    D2 = np.sum((X[:, None] - X[None]) ** 2, axis=2)
+    # Gaussian kernel with noise: good but imperfect distance preservation
+    K = np.exp(-D2) + 0.05 * rng.standard_normal((N, N))
+    return X, (K + K.T) / 2
+
+
+def test_estimate_brackets_exact_score():
+    X, K = _data()
+    exact = compute_geometry_score(X, K)
+    score, (low, high) = estimate_geometry_score(X, K, n_pairs=20_000, n_bootstrap=200, seed=3)
+
+    assert low <= score <= high
+    assert low - 0.01 <= exact <= high + 0.01
+    assert abs(score - exact) < 0.02
+
+
+def test_estimate_is_reproducible_and_accepts_callable():
+    X, K = _data(200)
+    a = estimate_geometry_score(X, K, n_pairs=5000, seed=7)
+    b = estimate_geometry_score(X, lambda i, j: K[i, j], n_pairs=5000, seed=7, chunk_size=999)
+    assert a == b
+
+    score, interval = estimate_geometry_score(X, K, n_pairs=5000, n_bootstrap=0)
+    assert np.isnan(interval[0]) and np.isfinite(score)
+
+
+if __name__ == "__main__":
+    test_estimate_brackets_exact_score()
+    test_estimate_is_reproducible_and_accepts_callable()
@@ -0,0 +1,60 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.spectral import grid_spectrum, grid_support
+
+
+def test_joint_support_of_mixed_signal():
+    kernel_fn = lambda P: 0.5 + 0.3 * np.cos(P[:, 0] - 2 * P[:, 1]) + 0.2 * np.cos(P[:, 0])
+    chunks = []
+    freqs, power = grid_spectrum(lambda P: chunks.append(len(P)) or kernel_fn(P), (16, 16), chunk_size=100)
+
+    assert max(chunks) == 100 and sum(chunks) == 256
+    assert np.isclose(power.sum(), 1.0)
+    support, support_power = grid_support(freqs, power)
+    assert [tuple(k) for k in support] == [(-1.0, 2.0), (-1.0, 0.0), (1.0, 0.0)]
+    # Each conjugate pair carries its full energy: 0.3^2 vs 0.2^2
+    assert np.isclose(support_power[0], 0.09 / 0.13)
+
+
+def test_lens_grid_mode_detects_cross_feature_mixing():
+    x = ParameterVector('x', 3)
+
+    def circuit(entangle):
+        qc = QuantumCircuit(2)
+        qc.ry(x[0], 0)
+        qc.ry(x[1], 1)
+        if entangle:
+            # Feature 1 also drives qubit 0, whose frequencies then mix x0 and x1
+            qc.rx(x[1], 0)
+        qc.rx(x[2], 1)
+        return qc
+
+    with tempfile.TemporaryDirectory() as tmp:
+        separate = QuantumLens(circuit(False), params=list(x)).spectrum(
+            mode='grid', features=(0, 1), n_samples=16, save_path=os.path.join(tmp, "a.png"))
+        mixed = QuantumLens(circuit(True), params=list(x)).spectrum(
+            mode='grid', features=(0, 1), n_samples=16, save_path=os.path.join(tmp, "b.png"))
+
+    assert separate["evaluations"] == 256
+    # Product kernel cos^2(x0/2) cos^2(x1/2): |k0| <= 1 and |k1| <= 1
+    assert {tuple(k) for k in separate["support"]} == \
+        {(1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (1.0, 1.0), (-1.0, 1.0)}
+    assert np.max(mixed["support"][:, 1]) == 2.0
+
+
+if __name__ == "__main__":
+    test_joint_support_of_mixed_signal()
+    test_lens_grid_mode_detects_cross_feature_mixing()
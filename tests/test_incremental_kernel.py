@@ -0,0 +1,92 @@
+import sys
+import os
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter
+from hilbertlens.geometry import compute_geometry_score
+
+
+def _circuit(n=3):
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for i in range(n):
+        qc.ry(x[i], i)
+    for i in range(n - 1):
+        qc.cx(i, i + 1)
+    return qc, x
+
+
+def test_rounds_match_full_kernel():
+    qc, x = _circuit()
+    adapter = QiskitAdapter(qc, list(x), cache_bytes=0)
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(50, 3))
+
+    kernel = adapter.incremental_kernel(X[:7], capacity=4)
+    for start, stop in ((7, 20), (20, 21), (21, 50)):
+        kernel.append(X[start:stop])
+        assert np.allclose(kernel.matrix, adapter.get_kernel_matrix(X[:stop]))
+
+    assert len(kernel) == 50
+    assert kernel.capacity == 64
+    assert np.allclose(kernel.X, X)
+    assert np.isclose(compute_geometry_score(kernel.X, kernel.matrix),
+                      compute_geometry_score(X, adapter.get_kernel_matrix(X)))
+
+
+def test_only_new_rows_are_simulated():
+    qc, x = _circuit()
+    adapter = QiskitAdapter(qc, list(x), cache_bytes=0)
+    calls = []
+    compute = adapter._compute_statevectors
+    adapter._compute_statevectors = lambda X: calls.append(X.shape[0]) or compute(X)
+
+    kernel = adapter.incremental_kernel()
+    rng = np.random.default_rng(1)
+    for _ in range(3):
+        kernel.append(rng.uniform(-1, 1, size=(10, 3)))
+    assert calls == [10, 10, 10]
+
+
+def test_packed_layout():
+    # Two unentangled pairs: states are stored per block
+    x = ParameterVector('x', 4)
+    qc = QuantumCircuit(4)
+    for i in range(4):
+        qc.ry(x[i], i)
+    qc.cx(0, 1)
+    qc.cx(2, 3)
+    adapter = QiskitAdapter(qc, list(x), product_states=True)
+    X = np.random.default_rng(2).uniform(-1, 1, size=(12, 4))
+
+    kernel = adapter.incremental_kernel(X[:5]).append(X[5:])
+    assert not adapter.dense_states
+    assert np.allclose(kernel.matrix, adapter.get_kernel_matrix(X))
+
+
+def test_projected_features_are_reduced_once():
+    qc, x = _circuit()
+    adapter = QiskitAdapter(qc, list(x), cache_bytes=0, kernel='projected', gamma=0.5)
+    calls = []
+    reduce = adapter.reduced_density_features
+    adapter.reduced_density_features = lambda M: calls.append(M.shape[0]) or reduce(M)
+    X = np.random.default_rng(3).uniform(-1, 1, size=(30, 3))
+
+    kernel = adapter.incremental_kernel(X[:4], capacity=4)
+    for start, stop in ((4, 9), (9, 30)):
+        kernel.append(X[start:stop])
+    assert calls == [4, 5, 21]
+    assert np.allclose(kernel.matrix, adapter.get_kernel_matrix(X))
+
+
+if __name__ == "__main__":
+    test_rounds_match_full_kernel()
+    test_only_new_rows_are_simulated()
+    test_packed_layout()
+    test_projected_features_are_reduced_once()
@@ -0,0 +1,88 @@
+import sys
+import os
+import tempfile
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.metrics import kernel_metrics
+
+
+def _kernel(N=60, seed=0):
+    rng = np.random.default_rng(seed)
+    M = rng.normal(size=(N, 8)) + 1j * rng.normal(size=(N, 8))
+    M /= np.linalg.norm(M, axis=1, keepdims=True)
+    return np.abs(M @ M.conj().T)**2
+
+
+def test_metrics_match_direct_formulas():
+    K = _kernel()
+    y = np.random.default_rng(1).integers(0, 3, size=K.shape[0])
+    # Tiny budget: a handful of rows per tile
+    stats = kernel_metrics(K, y, n_components=10, solver='dense', memory_budget=8 * 60 * 7)
+
+    T = np.where(y[:, None] == y[None, :], 1.0, -1.0)
+    assert np.isclose(stats["alignment"], np.sum(K * T) / (np.linalg.norm(K) * np.linalg.norm(T)))
+
+    eigvals = np.linalg.eigvalsh(K)[::-1]
+    assert np.isclose(stats["effective_dimension"], eigvals.sum()**2 / np.sum(eigvals**2))
+    assert np.allclose(stats["eigenvalues"], eigvals[:10] / np.trace(K))
+
+    off = K[~np.eye(K.shape[0], dtype=bool)]
+    assert np.isclose(stats["off_diagonal_mean"], off.mean())
+    assert np.isclose(stats["off_diagonal_variance"], off.var())
+
+    # The full-rank truncation recovers the alignment
+    full = kernel_metrics(K, y, n_components=K.shape[0], solver='dense')
+    assert np.isclose(full["alignment_by_rank"][-1], full["alignment"])
+
+
+def test_binary_labels_and_memmap():
+    K = _kernel(80, seed=2)
+    y = np.random.default_rng(3).choice([-1, 1], size=80)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "kernel.npy")
+        np.save(path, K)
+        K_mm = np.load(path, mmap_mode='r')
+        stats = kernel_metrics(K_mm, y, n_components=5)
+        del K_mm
+    assert np.isclose(stats["alignment"], y @ K @ y / (np.linalg.norm(K) * 80))
+    assert np.allclose(stats["eigenvalues"], np.linalg.eigvalsh(K)[::-1][:5] / np.trace(K), atol=1e-6)
+
+
+def test_lens_kernel_metrics():
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    qc.ry(x[0], 0)
+    qc.ry(x[1], 1)
+    qc.cx(0, 1)
+    lens = QuantumLens(qc, params=list(x))
+
+    X = np.random.default_rng(4).uniform(-np.pi, np.pi, size=(40, 2))
+    y = (X[:, 0] > 0).astype(int)
+    stats = lens.kernel_metrics(X, y, n_components=16)
+    assert lens.last_kernel_metrics is stats
+    # A 2-qubit fidelity kernel has rank <= D^2 = 16: 16 components explain everything
+    assert np.isclose(stats["explained"][-1], 1.0)
+    assert 1 <= stats["effective_dimension"] <= 16
+    assert -1 <= stats["alignment"] <= 1
+
+
+def test_lanczos_with_fewer_samples_than_components():
+    # The default n_components=20 asks for every eigenpair of a 10 x 10 kernel
+    K = _kernel(10, seed=5)
+    stats = kernel_metrics(K, solver='lanczos')
+    assert np.allclose(stats["eigenvalues"], np.linalg.eigvalsh(K)[::-1] / np.trace(K))
+
+
+if __name__ == "__main__":
+    test_metrics_match_direct_formulas()
+    test_binary_labels_and_memmap()
+    test_lens_kernel_metrics()
+    test_lanczos_with_fewer_samples_than_components()
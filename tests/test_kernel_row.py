@@ -0,0 +1,60 @@
+import sys
+import os
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter
+from hilbertlens.spectral import compute_spectrum
+
+
+def _make_adapter():
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    qc.h([0, 1])
+    qc.rz(x[0], 0)
+    qc.rz(x[1], 1)
+    qc.cx(0, 1)
+    return QiskitAdapter(qc, list(x))
+
+
+def test_kernel_row_matches_gram_column():
+    adapter = _make_adapter()
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-np.pi, np.pi, size=(40, 2))
+
+    K_full = adapter.get_kernel_matrix(X)
+    row = adapter.get_kernel_row(X, X[0])
+
+    assert row.shape == (40,)
+    assert np.allclose(row, K_full[:, 0])
+
+
+def test_cross_kernel_shape_and_values():
+    adapter = _make_adapter()
+    rng = np.random.default_rng(1)
+    X = rng.uniform(-np.pi, np.pi, size=(10, 2))
+    Y = rng.uniform(-np.pi, np.pi, size=(4, 2))
+
+    K_xy = adapter.get_kernel_matrix(X, Y)
+    K_all = adapter.get_kernel_matrix(np.vstack([X, Y]))
+
+    assert K_xy.shape == (10, 4)
+    assert np.allclose(K_xy, K_all[:10, 10:])
+
+
+def test_compute_spectrum_accepts_kernel_row():
+    # K(x, 0) = cos(3x) returned as a vector (no Gram matrix)
+    freqs, power = compute_spectrum(lambda X: np.cos(3 * X.flatten()), range_max=2*np.pi)
+    assert np.isclose(freqs[np.argmax(power)], 3.0, atol=0.1)
+
+
+if __name__ == "__main__":
+    test_kernel_row_matches_gram_column()
+    test_cross_kernel_shape_and_values()
+    test_compute_spectrum_accepts_kernel_row()
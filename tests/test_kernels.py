@@ -0,0 +1,72 @@
+import sys
+import os
+import tempfile
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.kernels import fidelity_kernel, gram_matrix
+
+
+def _random_states(n, dim, seed):
+    rng = np.random.default_rng(seed)
+    M = rng.normal(size=(n, dim)) + 1j * rng.normal(size=(n, dim))
+    return M / np.linalg.norm(M, axis=1, keepdims=True)
+
+
+def test_tiled_gram_matches_dense():
+    M = _random_states(103, 8, seed=0)
+    K_ref = fidelity_kernel(M, M)
+
+    # Tiny budget forces many (uneven) tiles
+    K_tiled = gram_matrix(M, memory_budget=24 * 10**2)
+    assert np.allclose(K_tiled, K_ref)
+    assert np.array_equal(K_tiled, K_tiled.T)
+
+
+def test_tiled_cross_gram_into_buffer():
+    M_x = _random_states(37, 4, seed=1)
+    M_y = _random_states(11, 4, seed=2)
+    buffer = np.zeros((37, 11))
+
+    K = gram_matrix(M_x, M_y, out=buffer, memory_budget=24 * 5**2)
+    assert K is buffer
+    assert np.allclose(buffer, fidelity_kernel(M_x, M_y))
+
+
+def test_gram_memmap_output():
+    M = _random_states(50, 4, seed=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "kernel.npy")
+        K = gram_matrix(M, out=path, memory_budget=24 * 16**2)
+        assert isinstance(K, np.memmap)
+        del K
+
+        K_loaded = np.load(path, mmap_mode='r')
+        assert np.allclose(K_loaded, fidelity_kernel(M, M))
+        del K_loaded
+
+
+def test_herk_gram_matches_naive_product():
+    for dtype in (np.complex128, np.complex64):
+        M = _random_states(70, 16, seed=4).astype(dtype)
+        M.setflags(write=False)
+        K_ref = np.abs(M.astype(np.complex128) @ M.astype(np.complex128).conj().T)**2
+        tol = 1e-12 if dtype == np.complex128 else 1e-5
+
+        for budget in (None, np.dtype(dtype).itemsize * 9**2):
+            K = gram_matrix(M, memory_budget=budget)
+            assert K.dtype == np.finfo(dtype).dtype
+            assert np.max(np.abs(K - K_ref)) < tol
+            assert np.array_equal(K, K.T)
+        assert np.max(np.abs(fidelity_kernel(M[:5], M) - K_ref[:5])) < tol
+
+
+if __name__ == "__main__":
+    test_tiled_gram_matches_dense()
+    test_tiled_cross_gram_into_buffer()
+    test_gram_memmap_output()
+    test_herk_gram_matches_naive_product()
@@ -0,0 +1,139 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.adapters import QiskitAdapter
+
+
+def hardware_efficient(n, layers=2):
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for _ in range(layers):
+        for i in range(n):
+            qc.ry(x[i], i)
+            qc.rz(0.5 * x[i], i)
+        for i in range(n - 1):
+            qc.cx(i, i + 1)
+    return qc, x
+
+
+def test_mps_matches_dense_without_truncation():
+    n = 6
+    qc, x = hardware_efficient(n)
+    # Non-adjacent gates exercise the SWAP routing in both directions
+    qc.cz(0, 3)
+    qc.rzz(x[2], 5, 1)
+    qc.cx(4, 0)
+
+    mps = QiskitAdapter(qc, list(x), simulator="mps", max_bond_dim=8)
+    dense = QiskitAdapter(qc, list(x), product_states=False)
+
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(10, n))
+    assert np.allclose(mps.get_statevectors(X), dense.get_statevectors(X))
+    assert np.allclose(mps.get_kernel_matrix(X), dense.get_kernel_matrix(X))
+    assert np.allclose(mps.get_kernel_row(X, X[2]), dense.get_kernel_row(X, X[2]))
+    assert mps.truncation_error < 1e-12
+
+
+def test_truncation_error_is_reported():
+    n = 6
+    qc, x = hardware_efficient(n, layers=3)
+    qc.cz(0, 5)
+
+    adapter = QiskitAdapter(qc, list(x), simulator="mps", max_bond_dim=2)
+    X = np.random.default_rng(1).uniform(-np.pi, np.pi, size=(5, n))
+    K = adapter.get_kernel_matrix(X)
+
+    assert adapter.truncation_error > 0
+    assert np.allclose(np.diag(K), 1.0)
+
+
+def test_wide_circuit_kernel():
+    # A 48-qubit CNOT ladder has at most one ebit per cut per layer
+    n = 48
+    qc, x = hardware_efficient(n, layers=1)
+
+    adapter = QiskitAdapter(qc, list(x), simulator="mps", max_bond_dim=4)
+    X = np.random.default_rng(2).uniform(-1, 1, size=(6, n))
+    K = adapter.get_kernel_matrix(X)
+
+    assert K.shape == (6, 6)
+    assert np.allclose(K, K.T)
+    assert np.allclose(np.diag(K), 1.0)
+    assert np.all((K >= -1e-12) & (K <= 1 + 1e-12))
+    assert adapter.truncation_error < 1e-12
+
+
+def test_truncation_error_covers_whole_kernel_call():
+    n = 6
+    qc, x = hardware_efficient(n, layers=3)
+    qc.cz(0, 5)
+    adapter = QiskitAdapter(qc, list(x), simulator="mps", max_bond_dim=2)
+    X = np.random.default_rng(3).uniform(-np.pi, np.pi, size=(5, n))
+
+    adapter.get_kernel_matrix(X)
+    error = adapter.truncation_error
+    assert error > 0
+    # The reference / Y rows are simulated last but must not hide the X error
+    adapter.get_kernel_row(X, np.zeros(n))
+    assert adapter.truncation_error == error
+    adapter.get_kernel_matrix(X, np.zeros((1, n)))
+    assert adapter.truncation_error == error
+
+    # A spectrum sweep (kernel rows against x = 0) reports its truncation too
+    lens = QuantumLens(qc, params=list(x), simulator="mps", max_bond_dim=2)
+    with tempfile.TemporaryDirectory() as tmp:
+        lens.spectrum(mode='global', n_samples=64, save_path=os.path.join(tmp, "spectrum.png"))
+    assert lens.adapter.truncation_error > 0
+
+
+def test_lens_reaches_wide_circuits():
+    # 40 qubits: far beyond dense statevectors, reachable through the public constructor
+    n = 40
+    qc, x = hardware_efficient(n, layers=1)
+    lens = QuantumLens(qc, params=list(x), simulator="mps", max_bond_dim=4, product_states=False)
+    assert lens.adapter.simulator == "mps"
+    X = np.random.default_rng(5).uniform(-1, 1, size=(20, n))
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = lens.geometry(X, state_space=False, save_path=os.path.join(tmp, "geometry.png"))
+    assert np.isfinite(stats["score"])
+    assert lens.adapter.truncation_error < 1e-12
+
+
+def test_store_separates_simulators():
+    n = 6
+    qc, x = hardware_efficient(n, layers=3)
+    qc.cz(0, 5)
+    X = np.random.default_rng(4).uniform(-np.pi, np.pi, size=(5, n))
+    exact = QiskitAdapter(qc, list(x), product_states=False).get_kernel_matrix(X)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        truncated = QiskitAdapter(qc, list(x), simulator="mps", max_bond_dim=1, cache_dir=cache_dir)
+        K_mps = np.array(truncated.get_kernel_matrix(X))
+        assert not np.allclose(K_mps, exact)
+        # A truncated kernel on disk must not be served to the exact simulator
+        dense = QiskitAdapter(qc, list(x), product_states=False, cache_dir=cache_dir)
+        assert np.allclose(dense.get_kernel_matrix(X), exact)
+        again = QiskitAdapter(qc, list(x), simulator="mps", max_bond_dim=1, cache_dir=cache_dir)
+        assert np.allclose(again.get_kernel_matrix(X), K_mps)
+        assert again.store.hits > 0
+
+
+if __name__ == "__main__":
+    test_mps_matches_dense_without_truncation()
+    test_truncation_error_is_reported()
+    test_wide_circuit_kernel()
+    test_truncation_error_covers_whole_kernel_call()
+    test_lens_reaches_wide_circuits()
+    test_store_separates_simulators()
@@ -0,0 +1,65 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.adapters import QiskitAdapter
+
+
+def _setup(N=300):
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    qc.h([0, 1])
+    qc.rz(x[0], 0)
+    qc.rz(x[1], 1)
+    qc.cx(0, 1)
+    qc.ry(x[0], 1)
+    X = np.random.default_rng(0).uniform(-1, 1, size=(N, 2))
+    return qc, x, X
+
+
+def test_exact_when_landmarks_span_the_feature_space():
+    # The kernel has rank <= 16 (2 qubits), so 40 landmarks reproduce it exactly
+    qc, x, X = _setup()
+    adapter = QiskitAdapter(qc, list(x))
+    K = adapter.get_kernel_matrix(X)
+    for method in ("uniform", "kmeans", "leverage"):
+        factor = adapter.get_nystrom_kernel(X, n_landmarks=40, landmarks=method, seed=1)
+        assert factor.factor.shape[0] == 300 and factor.rank <= 16
+        assert np.allclose(factor.to_dense(), K, atol=1e-8)
+
+
+def test_factor_pairs_and_reproducibility():
+    qc, x, X = _setup()
+    adapter = QiskitAdapter(qc, list(x))
+    a = adapter.get_nystrom_kernel(X, n_landmarks=8, seed=3)
+    b = adapter.get_nystrom_kernel(X, n_landmarks=8, seed=3)
+    assert np.array_equal(a.landmark_indices, b.landmark_indices)
+
+    i, j = np.array([0, 5, 7]), np.array([1, 5, 299])
+    assert np.allclose(a.pairs(i, j), a.to_dense()[i, j])
+
+
+def test_geometry_nystrom_mode():
+    qc, x, X = _setup()
+    with tempfile.TemporaryDirectory() as tmp:
+        lens = QuantumLens(qc, params=list(x))
+        exact = lens.geometry(X, save_path=os.path.join(tmp, "a.png"), state_space=False)
+        approx = lens.geometry(X, save_path=os.path.join(tmp, "b.png"), nystrom=40, n_pairs=20_000)
+    assert approx["ci"][0] - 0.02 <= exact["score"] <= approx["ci"][1] + 0.02
+
+
+if __name__ == "__main__":
+    test_exact_when_landmarks_span_the_feature_space()
+    test_factor_pairs_and_reproducibility()
+    test_geometry_nystrom_mode()
@@ -0,0 +1,45 @@
+import sys
+import os
+import numpy as np
+import pennylane as qml
+from qiskit.circuit.library import zz_feature_map
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter, PennyLaneAdapter
+
+
+def test_qiskit_parallel_is_deterministic():
+    qc = zz_feature_map(3, reps=2)
+    params = list(qc.parameters)
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(57, 3))
+
+    serial = QiskitAdapter(qc, params).get_statevectors(X)
+    for n_jobs in (2, 3):
+        parallel = QiskitAdapter(qc, params, n_jobs=n_jobs).get_statevectors(X)
+        assert np.array_equal(serial, parallel)
+
+
+def test_pennylane_parallel_matches_serial():
+    dev = qml.device("default.qubit", wires=2)
+
+    @qml.qnode(dev)
+    def circuit(x):
+        qml.RX(x[0], wires=0)
+        qml.RY(x[1], wires=1)
+        qml.CNOT(wires=[0, 1])
+        return qml.state()
+
+    X = np.random.default_rng(1).uniform(-np.pi, np.pi, size=(9, 2))
+
+    serial = PennyLaneAdapter(circuit).get_kernel_matrix(X)
+    parallel = PennyLaneAdapter(circuit, n_jobs=2).get_kernel_matrix(X)
+    assert np.array_equal(serial, parallel)
+
+
+if __name__ == "__main__":
+    test_qiskit_parallel_is_deterministic()
+    test_pennylane_parallel_matches_serial()
@@ -0,0 +1,55 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.spectral import pencil_spectrum
+from hilbertlens.diagnose import analyze_spectrum_richness
+
+
+def test_recovers_non_integer_frequencies():
+    t = np.arange(48) * 0.1
+    signal = 0.5 + 0.4 * np.cos(t) + 0.1 * np.cos(2.7 * t + 0.3)
+    freqs, power = pencil_spectrum(signal)
+
+    assert np.allclose(freqs, [0.0, 1.0, 2.7])
+    assert np.allclose(power, [0.0, 0.16 / 0.17, 0.01 / 0.17])
+
+
+def test_lens_pencil_matches_analytic_frequencies():
+    x = ParameterVector('x', 2)
+    qc = QuantumCircuit(2)
+    for _ in range(2):
+        qc.ry(x[0], 0)
+        qc.rx(1.5 * x[1], 1)
+        qc.cx(0, 1)
+    lens = QuantumLens(qc, params=list(x), cache_bytes=0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pencil = lens.spectrum(mode='global', method='pencil', save_path=os.path.join(tmp, "p.png"))
+        fft = lens.spectrum(mode='global', save_path=os.path.join(tmp, "f.png"))
+        analytic = lens.spectrum(mode='global', method='analytic', save_path=os.path.join(tmp, "a.png"))
+
+    assert pencil["evaluations"] == 64
+    assert fft["evaluations"] == 1000
+    # Every fitted frequency is allowed by the generators
+    active = pencil["freqs"][pencil["power"] > 1e-8]
+    assert all(np.min(np.abs(analytic["freqs"] - k)) < 1e-6 for k in active)
+    # Same verdict as the dense FFT sweep
+    assert analyze_spectrum_richness(pencil["freqs"], pencil["power"])["category"] == \
+        analyze_spectrum_richness(fft["freqs"], fft["power"])["category"]
+
+
+if __name__ == "__main__":
+    test_recovers_non_integer_frequencies()
+    test_lens_pencil_matches_analytic_frequencies()
@@ -0,0 +1,84 @@
+import sys
+import os
+import tempfile
+import warnings
+import numpy as np
+import pennylane as qml
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import PennyLaneAdapter
+
+dev = qml.device("default.qubit", wires=2)
+
+
+@qml.qnode(dev)
+def indexed_circuit(x):
+    qml.Hadamard(wires=0)
+    qml.RX(x[0], wires=0)
+    qml.RY(x[1], wires=1)
+    qml.CNOT(wires=[0, 1])
+    return qml.state()
+
+
+@qml.qnode(dev)
+def embedding_circuit(x):
+    qml.AngleEmbedding(x, wires=[0, 1])
+    qml.CNOT(wires=[0, 1])
+    return qml.state()
+
+
+@qml.qnode(dev)
+def scalar_only_circuit(x):
+    # float() rejects batched input -> adapter must fall back to the loop
+    qml.RX(float(x), wires=0)
+    return qml.state()
+
+
+def _compare(circuit, X):
+    batched = PennyLaneAdapter(circuit, chunk_size=16, cache_bytes=0)
+    looped = PennyLaneAdapter(circuit, broadcast=False, cache_bytes=0)
+    assert np.allclose(batched.get_statevectors(X), looped.get_statevectors(X))
+    return batched
+
+
+def test_broadcast_feature_major_layout():
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(50, 2))
+    adapter = _compare(indexed_circuit, X)
+    assert adapter._broadcast_layout == "feature_major"
+
+
+def test_broadcast_batch_major_layout():
+    X = np.random.default_rng(1).uniform(-np.pi, np.pi, size=(50, 2))
+    adapter = _compare(embedding_circuit, X)
+    assert adapter._broadcast_layout == "batch_major"
+
+
+def test_rejected_broadcast_falls_back():
+    X = np.linspace(0, np.pi, 7).reshape(-1, 1)
+    adapter = _compare(scalar_only_circuit, X)
+    assert adapter._broadcast_layout is None
+
+
+def test_untraceable_callable_is_not_persisted():
+    # A plain wrapper has no tape to trace: its id-based fingerprint must not reach disk
+    X = np.random.default_rng(2).uniform(-np.pi, np.pi, size=(8, 2))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            adapter = PennyLaneAdapter(lambda x: indexed_circuit(x), cache_dir=cache_dir)
+            K = adapter.get_kernel_matrix(X)
+        assert any("cache_dir" in str(w.message) for w in caught)
+        assert not adapter._persistent(2)
+        assert not [f for f in os.listdir(cache_dir) if f.endswith(".npy")]
+    assert np.allclose(K, PennyLaneAdapter(indexed_circuit, cache_bytes=0).get_kernel_matrix(X))
+
+
+if __name__ == "__main__":
+    test_broadcast_feature_major_layout()
+    test_broadcast_batch_major_layout()
+    test_rejected_broadcast_falls_back()
+    test_untraceable_callable_is_not_persisted()
@@ -0,0 +1,73 @@
+import sys
+import os
+import tempfile
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter
+from hilbertlens.geometry import compute_geometry_score
+
+
+def _circuit(n=4):
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for _ in range(2):
+        for i in range(n):
+            qc.ry(x[i], i)
+            qc.rz(0.7 * x[i], i)
+        for i in range(n - 1):
+            qc.cx(i, i + 1)
+    return qc, x
+
+
+def test_single_precision_dtypes_and_accuracy():
+    qc, x = _circuit()
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(30, 4))
+    double = QiskitAdapter(qc, list(x))
+
+    for options in ({}, {"product_states": True}, {"simulator": "mps", "max_bond_dim": 16}):
+        single = QiskitAdapter(qc, list(x), precision="single", **options)
+        assert single.get_states(X).dtype == np.complex64
+        K = single.get_kernel_matrix(X)
+        assert K.dtype == np.float32
+        assert np.max(np.abs(K - double.get_kernel_matrix(X))) < 1e-5
+        assert 0 < single.precision_deviation(X) < 1e-5
+
+    # The rank-based score is unaffected at this accuracy
+    K_single = QiskitAdapter(qc, list(x), precision="single").get_kernel_matrix(X)
+    assert np.isclose(compute_geometry_score(X, K_single),
+                      compute_geometry_score(X, double.get_kernel_matrix(X)), atol=1e-3)
+
+
+def test_precision_is_part_of_the_store_key():
+    qc, x = _circuit()
+    X = np.random.default_rng(1).uniform(-1, 1, size=(8, 4))
+    with tempfile.TemporaryDirectory() as tmp:
+        double = QiskitAdapter(qc, list(x), cache_dir=tmp)
+        single = QiskitAdapter(qc, list(x), cache_dir=tmp, precision="single")
+        assert double.get_states(X).dtype == np.complex128
+        assert single.get_states(X).dtype == np.complex64
+        assert double.get_kernel_matrix(X).dtype == np.float64
+        assert single.get_kernel_matrix(X).dtype == np.float32
+
+
+def test_unknown_precision():
+    qc, x = _circuit()
+    try:
+        QiskitAdapter(qc, list(x), precision="half")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected a ValueError for an unknown precision.")
+
+
+if __name__ == "__main__":
+    test_single_precision_dtypes_and_accuracy()
+    test_precision_is_part_of_the_store_key()
+    test_unknown_precision()
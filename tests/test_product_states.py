@@ -0,0 +1,56 @@
+import sys
+import os
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter
+
+
+def test_separable_blocks_match_dense_simulation():
+    n = 8
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for i in range(n):
+        qc.h(i)
+        qc.rz(x[i], i)
+        qc.ry(0.3 * x[i], i)
+    # One entangled block {2, 5}; every other qubit stays separable
+    qc.cx(2, 5)
+    qc.rzz(x[1], 2, 5)
+
+    product = QiskitAdapter(qc, list(x), product_states=True)
+    dense = QiskitAdapter(qc, list(x), product_states=False)
+    assert product._layout.widths == [2, 2, 4, 2, 2, 2, 2]
+
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(25, n))
+    assert np.allclose(product.get_statevectors(X), dense.get_statevectors(X))
+    assert np.allclose(product.get_kernel_matrix(X), dense.get_kernel_matrix(X))
+    assert np.allclose(product.get_kernel_row(X, X[3]), dense.get_kernel_row(X, X[3]))
+
+
+def test_wide_angle_encoding_kernel():
+    # 2^40 amplitudes would never fit; the factorized kernel needs 40 x 2
+    n = 40
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for i in range(n):
+        qc.ry(x[i], i)
+
+    adapter = QiskitAdapter(qc, list(x))
+    X = np.random.default_rng(1).uniform(-1, 1, size=(12, n))
+    K = adapter.get_kernel_matrix(X)
+
+    # Closed form for RY angle encoding: prod_q cos^2((x_q - y_q) / 2)
+    diff = X[:, None, :] - X[None, :, :]
+    assert np.allclose(K, np.prod(np.cos(diff / 2)**2, axis=2))
+
+
+if __name__ == "__main__":
+    test_separable_blocks_match_dense_simulation()
+    test_wide_angle_encoding_kernel()
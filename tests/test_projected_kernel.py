@@ -0,0 +1,114 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+from qiskit.quantum_info import Statevector, partial_trace
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.adapters import QiskitAdapter
+
+
+def _circuit(n, layers=2):
+    x = ParameterVector('x', n)
+    qc = QuantumCircuit(n)
+    for _ in range(layers):
+        for i in range(n):
+            qc.ry(x[i], i)
+            qc.rz(0.5 * x[i], i)
+        for i in range(n - 1):
+            qc.cx(i, i + 1)
+    return qc, x
+
+
+def _reference_kernel(states, gamma):
+    # exp(-gamma sum_k ||rho_k(x) - rho_k(y)||_F^2) with qiskit partial traces
+    n = int(np.log2(states.shape[1]))
+    rdms = np.array([[partial_trace(Statevector(s), [q for q in range(n) if q != k]).data
+                      for k in range(n)] for s in states])
+    d2 = np.sum(np.abs(rdms[:, None] - rdms[None, :])**2, axis=(2, 3, 4))
+    return np.exp(-gamma * d2)
+
+
+def test_projected_kernel_matches_partial_traces():
+    qc, x = _circuit(4)
+    X = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(12, 4))
+    adapter = QiskitAdapter(qc, list(x), kernel='projected', gamma=0.7)
+
+    K_ref = _reference_kernel(adapter.get_statevectors(X), 0.7)
+    # Tiny budget: many tiles
+    adapter.memory_budget = 8 * 5**2
+    K = adapter.get_kernel_matrix(X)
+    assert np.allclose(K, K_ref)
+    assert np.array_equal(K, K.T)
+    assert np.allclose(adapter.get_kernel_matrix(X[:5], X), K_ref[:5])
+    assert np.allclose(adapter.get_kernel_row(X, X[3]), K_ref[:, 3])
+
+
+def test_packed_layouts_give_the_same_kernel():
+    qc, x = _circuit(6)
+    qc.cz(0, 4)
+    X = np.random.default_rng(1).uniform(-1, 1, size=(8, 6))
+    dense = QiskitAdapter(qc, list(x), kernel='projected', product_states=False).get_kernel_matrix(X)
+    mps = QiskitAdapter(qc, list(x), kernel='projected', simulator='mps', max_bond_dim=8).get_kernel_matrix(X)
+    assert np.allclose(mps, dense)
+
+    # Two unentangled 2-qubit blocks
+    y = ParameterVector('y', 4)
+    blocks = QuantumCircuit(4)
+    for i in range(4):
+        blocks.ry(y[i], i)
+    blocks.cx(0, 1)
+    blocks.cx(2, 3)
+    X = X[:, :4]
+    packed = QiskitAdapter(blocks, list(y), kernel='projected', product_states=True)
+    assert not packed.dense_states
+    assert np.allclose(packed.get_kernel_matrix(X),
+                       QiskitAdapter(blocks, list(y), kernel='projected', product_states=False).get_kernel_matrix(X))
+
+
+def test_wide_circuit_concentration():
+    # 40 qubits: fidelities collapse to ~0, the projected kernel stays spread out
+    n = 40
+    qc, x = _circuit(n, layers=1)
+    X = np.random.default_rng(2).uniform(-np.pi, np.pi, size=(10, n))
+    off = ~np.eye(10, dtype=bool)
+    fidelity = QiskitAdapter(qc, list(x), simulator='mps', max_bond_dim=4).get_kernel_matrix(X)
+    projected = QiskitAdapter(qc, list(x), simulator='mps', max_bond_dim=4, kernel='projected',
+                              gamma=0.05).get_kernel_matrix(X)
+    assert fidelity[off].max() < 1e-6
+    assert projected[off].min() > 1e-3
+    assert np.allclose(np.diag(projected), 1.0)
+
+
+def test_lens_geometry_and_spectrum():
+    qc, x = _circuit(3)
+    lens = QuantumLens(qc, params=list(x), kernel='projected')
+    X = np.random.default_rng(3).uniform(-1, 1, size=(80, 3))
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = lens.geometry(X, save_path=os.path.join(tmp, "geometry.png"))
+        spectrum = lens.spectrum(mode='global', save_path=os.path.join(tmp, "spectrum.png"))
+    # D^2 = 64 < N would pick state-space PCA for the fidelity kernel
+    assert stats["embedding"].kind == 'kernel'
+    assert spectrum["dominant_freq"] > 0
+    try:
+        lens.spectrum(mode='global', method='analytic')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected a ValueError for the analytic projected spectrum.")
+
+
+if __name__ == "__main__":
+    test_projected_kernel_matches_partial_traces()
+    test_packed_layouts_give_the_same_kernel()
+    test_wide_circuit_concentration()
+    test_lens_geometry_and_spectrum()
@@ -0,0 +1,59 @@
+import sys
+import os
+import tempfile
+import numpy as np
+from sklearn.datasets import make_swiss_roll
+from sklearn.metrics.pairwise import rbf_kernel
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.geometry import project_quantum_state
+
+
+def _swiss_kernel(N=600):
+    X, _ = make_swiss_roll(n_samples=N, noise=0.1, random_state=0)
+    return rbf_kernel(X, gamma=0.05)
+
+
+def _assert_same_projection(A, B):
+    # Components are defined up to sign; compare each column up to a flip
+    for a, b in zip(A.T, B.T):
+        assert min(np.abs(a - b).max(), np.abs(a + b).max()) < 1e-3 * max(1.0, np.abs(b).max())
+
+
+def test_iterative_solvers_match_dense_kernel_pca():
+    K = _swiss_kernel()
+    dense = project_quantum_state(K, solver='dense')
+    for solver in ('randomized', 'lanczos'):
+        # A small budget forces many row tiles
+        X_proj = project_quantum_state(K, solver=solver, memory_budget=8 * 600 * 37)
+        assert X_proj.shape == (600, 3)
+        _assert_same_projection(X_proj, dense)
+
+
+def test_memmapped_kernel():
+    K = _swiss_kernel(300)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "K.npy")
+        np.save(path, K)
+        K_mmap = np.load(path, mmap_mode="r")
+        X_mmap = project_quantum_state(K_mmap, memory_budget=8 * 300 * 50)
+        del K_mmap
+    _assert_same_projection(X_mmap, project_quantum_state(K))
+
+
+def test_lanczos_with_few_samples():
+    # ARPACK needs k < N: tiny problems fall back to a dense eigendecomposition
+    K = _swiss_kernel(3)
+    X_proj = project_quantum_state(K, solver='lanczos')
+    assert X_proj.shape == (3, 3)
+    _assert_same_projection(X_proj, project_quantum_state(K, solver='dense'))
+
+
+if __name__ == "__main__":
+    test_iterative_solvers_match_dense_kernel_pca()
+    test_memmapped_kernel()
+    test_lanczos_with_few_samples()
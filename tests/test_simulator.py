@@ -0,0 +1,74 @@
+import sys
+import os
+import warnings
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+from qiskit.circuit.library import zz_feature_map
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens.adapters import QiskitAdapter
+
+
+def _compare(qc, params, n_samples=30):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-np.pi, np.pi, size=(n_samples, len(params)))
+
+    compiled = QiskitAdapter(qc, params, simulator='compiled')
+    reference = QiskitAdapter(qc, params, simulator='statevector')
+
+    return np.abs(compiled.get_statevectors(X) - reference.get_statevectors(X)).max()
+
+
+def test_compiled_matches_statevector_mixed_gates():
+    x = ParameterVector('x', 3)
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    qc.rx(x[0], 0)
+    qc.ry(2 * x[1] + 0.3, 1)
+    qc.rz(x[2], 2)
+    qc.p(x[0] - x[1], 1)
+    qc.u(x[0], x[1], x[2], 2)
+    qc.cx(0, 2)
+    qc.cz(1, 2)
+    qc.rzz(x[0], 0, 2)
+    qc.rxx(x[1], 1, 0)
+    qc.ryy(x[2], 2, 1)
+    qc.crx(x[0], 2, 0)
+    qc.cry(x[1], 0, 1)
+    qc.crz(x[2], 1, 2)
+    qc.swap(0, 2)
+    qc.ccx(0, 1, 2)
+    qc.rzx(x[1], 0, 1)   # Inlined from its definition
+    qc.rx(x[0] * x[1], 2)  # Non-linear expression
+
+    assert _compare(qc, list(x)) < 1e-10
+
+
+def test_compiled_matches_statevector_zz_feature_map():
+    qc = zz_feature_map(4, reps=2)
+    assert _compare(qc, list(qc.parameters)) < 1e-10
+
+
+def test_unsupported_circuit_falls_back():
+    x = ParameterVector('x', 1)
+    qc = QuantumCircuit(1, 1)
+    qc.rx(x[0], 0)
+    qc.measure(0, 0)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        adapter = QiskitAdapter(qc, list(x))
+
+    assert adapter._compiled is None
+    assert any("Falling back" in str(w.message) for w in caught)
+
+
+if __name__ == "__main__":
+    test_compiled_matches_statevector_mixed_gates()
+    test_compiled_matches_statevector_zz_feature_map()
+    test_unsupported_circuit_falls_back()
@@ -0,0 +1,76 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.diagnose import print_report
+
+
+def _make_lens():
+    x = ParameterVector('x', 3)
+    qc = QuantumCircuit(3)
+    for i in range(3):
+        qc.rx((i + 1) * x[i], i)
+    qc.cx(0, 1)
+    qc.cx(1, 2)
+    # cache_bytes=0 so every spectrum call really simulates
+    return QuantumLens(qc, params=list(x), cache_bytes=0)
+
+
+def test_all_mode_matches_individual_sweeps():
+    lens = _make_lens()
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = lens.spectrum(mode='all', save_path=os.path.join(tmp, "all.png"))
+        table = stats["table"]
+        assert [row["sweep"] for row in table] == ["x0", "x1", "x2", "global"]
+
+        for i in range(3):
+            local = lens.spectrum(mode='local', feature_index=i, save_path=os.path.join(tmp, f"x{i}.png"))
+            assert np.allclose(table[i]["power"], local["power"])
+            assert np.isclose(table[i]["dominant_freq"], i + 1)
+        glob = lens.spectrum(mode='global', save_path=os.path.join(tmp, "global.png"))
+        assert np.allclose(table[3]["power"], glob["power"])
+
+
+def test_all_mode_simulates_once():
+    lens = _make_lens()
+    adapter = lens.adapter
+    calls = []
+    compute = adapter._compute_statevectors
+    adapter._compute_statevectors = lambda X: calls.append(X.shape[0]) or compute(X)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lens.spectrum(mode='all', save_path=os.path.join(tmp, "all.png"))
+    # One stacked batch of 4 sweeps (+ the reference row)
+    assert len(calls) == 2
+    assert sum(calls) == 4 * 1000 + 1
+
+
+def test_all_mode_analytic():
+    lens = _make_lens()
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = lens.spectrum(mode='all', method='analytic', save_path=os.path.join(tmp, "all.png"))
+    # Degeneracies are not power: only the accessible set is reported
+    assert all(row["power"] is None and row["dominant_freq"] is None for row in stats["table"])
+    assert [np.max(row["freqs"]) for row in stats["table"]] == [1, 2, 3, 6]
+    assert np.allclose(stats["freqs"], np.arange(7))
+    # Raw generator degeneracies (DC included), not a normalized power
+    assert np.allclose(stats["degeneracy"], [10, 8, 7, 6, 3, 2, 1])
+    # The report counts the accessible frequencies
+    print_report(stats, {"score": 0.9})
+
+
+if __name__ == "__main__":
+    test_all_mode_matches_individual_sweeps()
+    test_all_mode_simulates_once()
+    test_all_mode_analytic()
@@ -0,0 +1,84 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from hilbertlens import QuantumLens
+from hilbertlens.adapters import QiskitAdapter
+from hilbertlens.geometry import density_features, project_state_space, project_quantum_state
+
+
+def _circuit():
+    x = ParameterVector('x', 3)
+    qc = QuantumCircuit(2)
+    qc.h([0, 1])
+    qc.rz(x[0], 0)
+    qc.rz(x[1], 1)
+    qc.cx(0, 1)
+    qc.ry(x[2], 1)
+    return qc, x
+
+
+def test_density_features_reproduce_fidelity_kernel():
+    qc, x = _circuit()
+    adapter = QiskitAdapter(qc, list(x))
+    X = np.random.default_rng(0).uniform(-2, 2, size=(50, 3))
+
+    features = density_features(adapter.get_statevectors(X))
+    assert features.shape == (50, 16)
+    assert np.allclose(features @ features.T, adapter.get_kernel_matrix(X))
+
+
+def test_state_space_projection_matches_kernel_pca():
+    qc, x = _circuit()
+    adapter = QiskitAdapter(qc, list(x))
+    X = np.random.default_rng(1).uniform(-2, 2, size=(300, 3))
+
+    X_states = project_state_space(density_features(adapter.get_statevectors(X)))
+    X_kernel = project_quantum_state(adapter.get_kernel_matrix(X), solver='lanczos')
+    assert np.allclose(X_states, X_kernel, atol=1e-8)
+
+
+def test_geometry_uses_state_space_automatically():
+    qc, x = _circuit()
+    X = np.random.default_rng(2).uniform(-2, 2, size=(200, 3))
+    with tempfile.TemporaryDirectory() as tmp:
+        lens = QuantumLens(qc, params=list(x))
+        auto = lens.geometry(X, save_path=os.path.join(tmp, "a.png"))
+        kernel = lens.geometry(X, save_path=os.path.join(tmp, "b.png"), state_space=False)
+        sampled = lens.geometry(X, save_path=os.path.join(tmp, "c.png"), n_pairs=5000)
+
+    assert auto["score"] == kernel["score"]
+    assert sampled["ci"][0] <= sampled["score"] <= sampled["ci"][1]
+
+
+def test_state_space_simulates_once():
+    qc, x = _circuit()
+    X = np.random.default_rng(3).uniform(-2, 2, size=(100, 3))
+    # No cache: every state request simulates
+    lens = QuantumLens(qc, params=list(x), cache_bytes=0)
+    calls = []
+    compute = lens.adapter._compute_statevectors
+    lens.adapter._compute_statevectors = lambda X: calls.append(X.shape[0]) or compute(X)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = lens.geometry(X, save_path=os.path.join(tmp, "a.png"))
+    assert stats["embedding"].kind == 'state_space'
+    # Features and the exact-score kernel come from the same states
+    assert sum(calls) == 100
+
+
+if __name__ == "__main__":
+    test_density_features_reproduce_fidelity_kernel()
+    test_state_space_projection_matches_kernel_pca()
+    test_geometry_uses_state_space_automatically()
+    test_state_space_simulates_once()